@@ -0,0 +1,124 @@
+"""
+수집 이력 인덱스 (SQLite)
+- 게시글 키별 최초/최근 발견 시각 저장
+- (카페, 키워드)별 워터마크 (처리 완료된 최신 게시글 ID)
+- 실행/주차/프로세스 간 공유 (WAL 모드)
+- 조회: 메모리 캐시(확인된 키) → SQLite 기본키 조회
+"""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Set, Union
+
+
+class ArticleIndex:
+    """수집 완료 게시글 인덱스"""
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 여러 프로세스가 동시에 쓰므로 잠금 대기 시간을 넉넉히
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS articles ('
+            ' article_key TEXT PRIMARY KEY,'
+            ' url TEXT,'
+            ' first_seen TEXT NOT NULL,'
+            ' last_seen TEXT NOT NULL'
+            ') WITHOUT ROWID'
+        )
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS watermarks ('
+            ' cafe_id TEXT NOT NULL,'
+            ' keyword TEXT NOT NULL,'
+            ' article_id INTEGER NOT NULL,'
+            ' updated_at TEXT NOT NULL,'
+            ' PRIMARY KEY (cafe_id, keyword)'
+            ') WITHOUT ROWID'
+        )
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS meta ('
+            ' name TEXT PRIMARY KEY,'
+            ' value TEXT'
+            ') WITHOUT ROWID'
+        )
+
+        # 이미 확인된 키 캐시 (한번 수집된 키는 삭제되지 않음)
+        self._known: Set[str] = set()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat(timespec='seconds')
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._known:
+            return True
+        row = self.conn.execute('SELECT 1 FROM articles WHERE article_key = ?', (key,)).fetchone()
+        if row:
+            self._known.add(key)
+            return True
+        return False
+
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+    def add(self, key: str, url: Optional[str] = None):
+        """수집 완료 기록 (이미 있으면 최근 발견 시각만 갱신)"""
+        now = self._now()
+        self.conn.execute(
+            'INSERT INTO articles (article_key, url, first_seen, last_seen) VALUES (?, ?, ?, ?)'
+            ' ON CONFLICT(article_key) DO UPDATE SET last_seen = excluded.last_seen',
+            (key, url or key, now, now)
+        )
+        self._known.add(key)
+
+    def add_many(self, keys: Iterable[str]) -> int:
+        """여러 키 일괄 기록 (기존 키는 유지)"""
+        now = self._now()
+        rows = [(key, key, now, now) for key in keys]
+        with self.conn:
+            self.conn.execute('BEGIN')
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO articles (article_key, url, first_seen, last_seen) VALUES (?, ?, ?, ?)',
+                rows
+            )
+        return len(rows)
+
+    def touch(self, key: str):
+        """중복으로 다시 발견된 게시글의 최근 발견 시각 갱신"""
+        self.conn.execute('UPDATE articles SET last_seen = ? WHERE article_key = ?', (self._now(), key))
+
+    def get_watermark(self, cafe_id: str, keyword: str) -> Optional[int]:
+        """(카페, 키워드)별 처리 완료된 최신 게시글 ID"""
+        row = self.conn.execute(
+            'SELECT article_id FROM watermarks WHERE cafe_id = ? AND keyword = ?',
+            (cafe_id, keyword)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, cafe_id: str, keyword: str, article_id: int):
+        """워터마크 갱신 (기존 값보다 클 때만)"""
+        self.conn.execute(
+            'INSERT INTO watermarks (cafe_id, keyword, article_id, updated_at) VALUES (?, ?, ?, ?)'
+            ' ON CONFLICT(cafe_id, keyword) DO UPDATE SET'
+            ' article_id = MAX(article_id, excluded.article_id), updated_at = excluded.updated_at',
+            (cafe_id, keyword, article_id, self._now())
+        )
+
+    def get_meta(self, name: str) -> Optional[str]:
+        row = self.conn.execute('SELECT value FROM meta WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, name: str, value: str):
+        self.conn.execute(
+            'INSERT INTO meta (name, value) VALUES (?, ?)'
+            ' ON CONFLICT(name) DO UPDATE SET value = excluded.value',
+            (name, value)
+        )
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,878 @@
+"""
+단일 프로세스 asyncio 크롤링 엔진
+- Playwright 드라이버 1개와 Chromium 1개를 모든 계정이 공유, 계정별로 BrowserContext 분리 (쿠키 분리)
+- CDP 모드는 기존과 같이 계정별 debug_port의 Chrome에 연결
+- 계정별 카페/키워드/게시글 작업을 하나의 이벤트 루프에서 실행 (네트워크 대기 중 다른 계정 진행)
+- 선택자/스크립트/파싱/저장소/체크포인트/수집 이력은 NaverCafeCrawler와 공유
+
+config.json의 "engine": "async"로 사용 (crawler.main()에서 로드)
+"""
+
+import asyncio
+import inspect
+import json
+import random
+import time
+from collections import deque
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
+from playwright_stealth import Stealth
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+
+from crawler import (
+    NaverCafeCrawler, CrawlerSettings, AccountConfig, Flow, ResourceBlocker,
+    RetryConfig, Scripts, get_context_options, get_launch_options, get_viewport, open_work_run, merge_comment_results,
+    record_retry
+)
+from http_fetcher import (
+    NaverCafeHttpFetcher, ArticleFetchError, COMMENTS_PARAMS, MAX_COMMENT_PAGES,
+    comment_items, parse_comment_items, unwrap_result
+)
+from memory_monitor import (
+    MemorySample, RECYCLE_BROWSER, RECYCLE_CONTEXT, RECYCLE_PAGE,
+    js_heap_mb, process_rss_mb, renderer_pids, rss_mb_of_pids
+)
+from metrics import export_aggregate
+from profiling import CrawlProfiler
+from models import CAFE_BASE_URL, CommentRecord
+
+LOGIN_PAGES = ['nid.naver.com/nidlogin', 'nid.naver.com/login', 'nid.naver.com/otp', 'nid.naver.com/user2']
+
+
+class AsyncResourceBlocker(ResourceBlocker):
+    """ResourceBlocker의 async API 버전 (route 처리만 코루틴)"""
+
+    async def _handle_route(self, route):
+        request = route.request
+        category = self.classify(request.url, request.resource_type)
+        if category:
+            self.blocked[category] = self.blocked.get(category, 0) + 1
+            await route.abort('blockedbyclient')
+        else:
+            await route.continue_()
+
+    async def attach(self, context):
+        """컨텍스트에 차단 정책 적용"""
+        if not self.policy.enabled:
+            return
+        pattern = self.route_pattern()
+        if pattern:
+            await context.route(pattern, self._handle_route)
+        context.on('response', self._on_response)
+
+
+class AsyncNaverCafeCrawler(NaverCafeCrawler):
+    """계정 1개 분량의 async 크롤러 (브라우저는 AsyncCrawlEngine이 공유)
+
+    브라우저를 다루는 메서드만 코루틴으로 재정의하고, 카페/키워드 흐름(NaverCafeCrawler의 흐름 제너레이터)과
+    레코드 생성/저장/체크포인트/인덱스는 NaverCafeCrawler의 것을 그대로 사용한다 (SQLite/파일 I/O는 짧은 동기 호출).
+    """
+
+    # 여러 계정이 동시에 로그인 화면을 띄우지 않도록 화면 모드에서도 저장된 쿠키 우선
+    prefer_saved_cookies = True
+
+    def __init__(
+        self,
+        engine: 'AsyncCrawlEngine',
+        config_path: str,
+        account_info: AccountConfig,
+        group_name: str,
+        run_id: Optional[str] = None
+    ):
+        super().__init__(config_path=config_path, account_info=account_info, group_name=group_name, run_id=run_id)
+        self.engine = engine
+        self.resource_blocker = AsyncResourceBlocker(self.config.resource_blocking)
+        # 모든 계정이 한 스레드에서 실행되므로 cProfile은 엔진이 한 번만 실행
+        self.profiler.cprofile = False
+        # requests 세션/요청 간격 제어기/지표는 스레드 안전하지 않으므로 HTTP 수집은 한 번에 하나씩
+        self.http_lock = asyncio.Lock()
+
+    async def _wait(self, milliseconds: float):
+        """밀리초 단위 대기 (다른 계정에 양보)"""
+        await asyncio.sleep(milliseconds / 1000.0)
+
+    async def _pace(self):
+        """다음 요청 전 대기 (요청 간격 제어기 기준, 탭끼리 슬롯을 나눠 씀)"""
+        wait = self.rate_controller.reserve()
+        self.metrics.observe('rate_limit_sleep', max(wait, 0))
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _paced_http_request_from_thread(self, loop: asyncio.AbstractEventLoop, request):
+        """작업 스레드의 HTTP API 요청 1건 - 요청 간격 대기와 결과 기록은 이벤트 루프에서 (제어기 공유)"""
+        asyncio.run_coroutine_threadsafe(self._pace(), loop).result()
+        started = time.time()
+        try:
+            result = request()
+        except Exception as e:
+            loop.call_soon_threadsafe(self._record_http_request, (time.time() - started) * 1000, e)
+            raise
+        loop.call_soon_threadsafe(self._record_http_request, (time.time() - started) * 1000)
+        return result
+
+    async def _navigate(self, page: Page, url: str, wait_until: str = 'domcontentloaded'):
+        """요청 간격을 지켜 페이지 이동 후 결과 기록 (재시작 때 미리 이동해 둔 URL이면 로딩만 대기)"""
+        pending, self.pending_navigation = self.pending_navigation, None
+        if pending and pending[0] is page and pending[1] == url:
+            _, _, started, response = pending
+            try:
+                await page.wait_for_load_state(wait_until, timeout=self.timeouts.PAGE_LOAD)
+            except Exception:
+                self._record_navigation_error(started)
+                raise
+            self._record_navigation(page, response, started)
+            return response
+
+        await self._pace()
+        started = time.time()
+        try:
+            response = await page.goto(url, wait_until=wait_until, timeout=self.timeouts.PAGE_LOAD)
+        except Exception:
+            self._record_navigation_error(started)
+            raise
+        self._record_navigation(page, response, started)
+        return response
+
+    async def _poll_ready(self, name: str, condition, timeout_ms: int) -> bool:
+        """await condition()이 참이 될 때까지 READY_POLL 간격으로 확인"""
+        started = time.time()
+        deadline = started + timeout_ms / 1000
+        ready = False
+        while True:
+            try:
+                ready = bool(await condition())
+            except Exception:
+                ready = False
+            if ready or time.time() >= deadline:
+                break
+            await self._wait(self.wait_times.READY_POLL)
+        self._record_wait(name, started, ready)
+        return ready
+
+    async def _wait_dom_settled(self, frame, name: str = 'dom_settled') -> bool:
+        """DOM 변경이 멈출 때까지 대기 (MutationObserver)"""
+        started = time.time()
+        try:
+            settled = bool(await frame.evaluate(Scripts.WAIT_DOM_SETTLED, self._dom_settle_args()))
+        except Exception:
+            settled = False
+        self._record_wait(name, started, settled)
+        return settled
+
+    # ---- 브라우저 ----
+
+    async def _start_browser(self):
+        """CDP 연결 또는 공유 브라우저에 계정 컨텍스트 생성"""
+        debug_port = self.account_info.debug_port
+
+        if self.config.headless:
+            # 서버 모드: 외부 Chrome 없이 공유 브라우저에 컨텍스트 생성
+            self.cdp_mode = False
+            self.browser = await self.engine.get_shared_browser()
+            await self._new_context()
+            await self.resource_blocker.attach(self.context)
+            self._attach_comment_capture(self.context)
+            return
+
+        try:
+            self.browser = await self.engine.playwright.chromium.connect_over_cdp(f"http://localhost:{debug_port}")
+            if self.browser.contexts:
+                self.context = self.browser.contexts[0]
+                self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
+                self.owns_context = False
+            else:
+                self.context = await self.browser.new_context(viewport=self.engine.viewport)
+                self.page = await self.context.new_page()
+                self.owns_context = True
+            self.cdp_mode = True
+            self.logger.info(f"Chrome CDP 연결 성공 (포트: {debug_port}, {self.account_info.naver_id})")
+            print(f"\n[{self.group_name}] Chrome CDP 연결 성공 (포트: {debug_port})\n")
+
+        except Exception as e:
+            self.cdp_mode = False
+            self.logger.warning(f"CDP 연결 실패 ({e}), 공유 브라우저에 컨텍스트 생성")
+            print(f"\n[{self.group_name}] CDP 연결 실패, 공유 브라우저 사용\n")
+            self.browser = await self.engine.get_shared_browser()
+            await self._new_context()
+
+        await self.resource_blocker.attach(self.context)
+        self._attach_comment_capture(self.context)
+
+    async def _new_context(self, storage_state: Optional[Dict[str, Any]] = None):
+        """공유 브라우저에 이 계정 전용 컨텍스트/페이지 생성 (storage_state: 쿠키 + localStorage 스냅샷)"""
+        self.context = await self.browser.new_context(
+            **get_context_options(self.config),
+            storage_state=storage_state
+        )
+        self.page = await self.context.new_page()
+        await Stealth().apply_stealth_async(self.page)
+        self.owns_context = True
+        self.logger.info(f"브라우저 컨텍스트 생성 ({self.account_info.naver_id})")
+
+    async def _close_tabs(self):
+        for tab in self.tab_pages:
+            try:
+                await tab.close()
+            except Exception:
+                pass
+        self.tab_pages = []
+
+    async def _close_browser(self):
+        """계정 컨텍스트 정리 (공유 브라우저는 엔진이 종료)"""
+        await self._stop_tracing()
+        try:
+            await self._close_tabs()
+
+            if self.resource_blocker.policy.enabled:
+                self.logger.info(f"리소스 차단 통계: {self.resource_blocker.summary()}")
+
+            if self.cdp_mode:
+                # CDP 모드: Chrome을 닫지 않고 연결만 해제
+                if self.browser:
+                    await self.browser.close()
+                self.logger.info("CDP 연결 해제 (Chrome은 유지)")
+                return
+
+            if self.context:
+                await self.context.close()
+                self.logger.info("브라우저 컨텍스트 종료")
+
+        except Exception as e:
+            self.logger.warning(f"브라우저 종료 중 오류: {e}")
+
+    async def _load_cookies(self) -> bool:
+        """저장된 쿠키 로드"""
+        try:
+            cookies = self._read_valid_cookies()
+            if not cookies:
+                return False
+
+            await self.context.add_cookies(cookies)
+            self.logger.info("쿠키 로드 완료 (유효)")
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"쿠키 로드 실패: {e}")
+            return False
+
+    async def _save_cookies(self):
+        """브라우저 쿠키와 storage_state 스냅샷 저장"""
+        try:
+            state = await self.context.storage_state()
+            self._write_cookie_file(state['cookies'])
+            self._write_storage_state(state)
+        except Exception as e:
+            self.logger.warning(f"쿠키 저장 실패: {e}")
+
+    async def _snapshot_storage_state(self) -> Optional[Dict[str, Any]]:
+        """재시작용 storage_state - 현재 컨텍스트 우선, 실패 시 저장된 스냅샷"""
+        try:
+            state = await self.context.storage_state()
+            if self._has_valid_auth_cookies(state.get('cookies') or []):
+                self._write_storage_state(state)
+                return state
+        except Exception as e:
+            self.logger.debug(f"storage_state 스냅샷 실패: {e}")
+        return self._read_storage_state()
+
+    async def _init_http_fetcher(self):
+        """HTTP 수집기 생성 및 브라우저 세션 쿠키 적용"""
+        if self.config.fetch_engine != 'http':
+            return
+
+        if not self.http_fetcher:
+            self.http_fetcher = NaverCafeHttpFetcher(
+                api_base_url=self.config.api_base_url,
+                pool_size=self.config.http_pool_size,
+                timeout=self.timeouts.PAGE_LOAD / 1000
+            )
+
+        try:
+            cookies = await self.context.cookies()
+        except Exception as e:
+            self.logger.debug(f"컨텍스트 쿠키 조회 실패: {e}")
+            cookies = []
+        if not cookies:
+            cookies = self._read_cookie_file()
+
+        count = self.http_fetcher.load_cookies(cookies)
+        self.logger.info(f"HTTP 수집기 준비 완료 (쿠키 {count}개)")
+
+    async def _restart_browser_if_needed(self, next_url: Optional[str] = None) -> bool:
+        """필요시 이 계정의 탭/컨텍스트만 새로 생성 (공유 브라우저는 엔진이 관리)
+
+        memory_policy 비활성 시에는 기존처럼 30분마다 컨텍스트 재생성 (CDP 모드 제외)
+        next_url: 재생성 직후 미리 이동해 둘 다음 대상
+        """
+        policy_enabled = self.config.memory_policy.enabled
+        if not policy_enabled:
+            if self.cdp_mode or not self._should_restart_browser():
+                return False
+            action = RECYCLE_CONTEXT
+        else:
+            sample = await self._sample_memory()
+            action = self.memory_policy.decide(sample, age_seconds=time.time() - self.last_restart_time)
+            self.logger.debug(f"메모리: {sample.describe()}")
+            if not action:
+                return False
+            self.logger.info(f"메모리 기준 초과 ({sample.describe()}) → {action} 재생성")
+            if action == RECYCLE_BROWSER:
+                action = RECYCLE_CONTEXT
+
+        if action == RECYCLE_PAGE:
+            await self._recycle_pages(next_url)
+        else:
+            await self._recycle_context(next_url)
+        if policy_enabled:
+            self.memory_policy.record(action)
+        self.metrics.inc(f"recycle_{action}")
+        return True
+
+    async def _sample_memory(self) -> MemorySample:
+        """탭 JS 힙(최댓값), 렌더러 RSS 합계, 파이썬 프로세스 RSS 측정"""
+        heaps = []
+        for page in [self.page] + self.tab_pages:
+            heap = await self._page_heap_mb(page)
+            if heap is not None:
+                heaps.append(heap)
+        return MemorySample(max(heaps) if heaps else None, await self._renderer_rss_mb(), process_rss_mb())
+
+    async def _page_heap_mb(self, page: Page) -> Optional[float]:
+        try:
+            session = await self.context.new_cdp_session(page)
+            try:
+                await session.send('Performance.enable')
+                return js_heap_mb(await session.send('Performance.getMetrics'))
+            finally:
+                await session.detach()
+        except Exception as e:
+            self.logger.debug(f"JS 힙 측정 실패: {e}")
+            return None
+
+    async def _renderer_rss_mb(self) -> Optional[float]:
+        try:
+            session = await self.browser.new_browser_cdp_session()
+            try:
+                info = await session.send('SystemInfo.getProcessInfo')
+            finally:
+                await session.detach()
+        except Exception as e:
+            self.logger.debug(f"렌더러 프로세스 조회 실패: {e}")
+            return None
+        return rss_mb_of_pids(renderer_pids(info))
+
+    async def _recycle_pages(self, next_url: Optional[str] = None):
+        """게시글 탭과 메인 페이지만 새로 생성 (컨텍스트/로그인 유지)"""
+        await self._close_tabs()
+        old_page = self.page
+        self.page = await self.context.new_page()
+        if not self.cdp_mode:
+            await Stealth().apply_stealth_async(self.page)
+        await self._prenavigate(next_url)
+        try:
+            await old_page.close()
+        except Exception:
+            pass
+
+    async def _recycle_context(self, next_url: Optional[str] = None):
+        """컨텍스트만 storage_state 스냅샷으로 재생성 (재로그인 없음, CDP 기본 컨텍스트는 닫지 않고 전용 컨텍스트로 옮겨 감)"""
+        started = time.time()
+        await self._stop_tracing()
+        state = await self._snapshot_storage_state()
+        old_context, old_owned, old_tabs = self.context, self.owns_context, self.tab_pages
+        self.tab_pages = []
+
+        if not self.cdp_mode:
+            self.browser = await self.engine.get_shared_browser()
+        await self._new_context(state)
+        await self.resource_blocker.attach(self.context)
+        self._attach_comment_capture(self.context)
+        if state is None and not await self._load_cookies():
+            self.logger.warning("로그인 스냅샷/쿠키 없음 - 재로그인 없이 계속 (차단 신호 시 간격 제어)")
+        await self._prenavigate(next_url)
+
+        # 새 컨텍스트가 다음 페이지를 로딩하는 동안 이전 컨텍스트 정리
+        for tab in old_tabs:
+            try:
+                await tab.close()
+            except Exception:
+                pass
+        if old_owned:
+            try:
+                await old_context.close()
+            except Exception:
+                pass
+
+        await self._init_http_fetcher()
+        self.restart_count += 1
+        self.last_restart_time = time.time()
+        self.metrics.observe('restart', time.time() - started)
+        elapsed_ms = (time.time() - started) * 1000
+        self.logger.info(f"브라우저 컨텍스트 재생성 #{self.restart_count} 완료 ({elapsed_ms:.0f}ms)")
+        print(f"🔄 [{self.group_name}] 브라우저 컨텍스트 재생성 #{self.restart_count} ({elapsed_ms:.0f}ms)")
+        self._snapshot_python_memory('컨텍스트 재생성')
+
+    async def _update_trace_window(self):
+        """처리한 게시글 수에 따라 Playwright 트레이싱 구간 시작/종료"""
+        action = self.profiler.trace_action()
+        if action == 'start':
+            await self._start_tracing()
+        elif action == 'stop':
+            await self._stop_tracing()
+
+    async def _start_tracing(self):
+        path = self.profiler.trace_started()
+        try:
+            await self.context.tracing.start(
+                title=f"{self.group_name} 게시글 {self.profiler.articles_seen + 1}~",
+                screenshots=self.config.profiling.trace_screenshots,
+                snapshots=True
+            )
+            self.logger.info(f"Playwright 트레이싱 시작 (게시글 {self.profiler.trace_articles}개): {path}")
+        except Exception as e:
+            self.profiler.trace_stopped()
+            self.logger.warning(f"Playwright 트레이싱 시작 실패: {e}")
+
+    async def _stop_tracing(self):
+        """트레이싱 중이면 저장 (컨텍스트를 닫기 전에 호출)"""
+        if not self.profiler.tracing:
+            return
+        path = self.profiler.trace_stopped()
+        try:
+            await self.context.tracing.stop(path=str(path))
+            self.logger.info(f"Playwright 트레이스 저장 (게시글 {self.profiler.articles_seen}개까지): {path}")
+        except Exception as e:
+            self.logger.warning(f"Playwright 트레이스 저장 실패: {e}")
+
+    async def _prenavigate(self, url: Optional[str]):
+        """다음 이동 대상을 미리 요청 (commit까지만, _navigate에서 이어서 대기)"""
+        self.pending_navigation = None
+        if not url:
+            return
+        await self._pace()
+        started = time.time()
+        try:
+            response = await self.page.goto(url, wait_until='commit', timeout=self.timeouts.PAGE_LOAD)
+            self.pending_navigation = (self.page, url, started, response)
+        except Exception as e:
+            self._record_navigation_error(started)
+            self.logger.debug(f"사전 이동 실패 ({url}): {e}")
+
+    async def login_naver(self) -> bool:
+        """네이버 로그인 (NaverCafeCrawler.login_naver와 같은 절차)"""
+        self.logger.info("네이버 로그인 시작")
+        page = self.page
+
+        try:
+            await page.goto('https://nid.naver.com/nidlogin.login', wait_until='domcontentloaded')
+            await self._wait(self.wait_times.AFTER_PAGE_LOAD)
+
+            # 아이디/비밀번호 입력 (사람처럼 한 글자씩 타이핑)
+            await page.click(self.selectors.LOGIN_ID)
+            await self._wait(random.randint(300, 600))
+            await page.type(self.selectors.LOGIN_ID, self.account_info.naver_id, delay=random.randint(80, 160))
+            await self._wait(random.randint(400, 800))
+
+            await page.click(self.selectors.LOGIN_PW)
+            await self._wait(random.randint(300, 600))
+            await page.type(self.selectors.LOGIN_PW, self.account_info.naver_password, delay=random.randint(80, 160))
+            await self._wait(random.randint(400, 800))
+
+            # 로그인 상태 유지 체크박스 클릭
+            try:
+                keep_login = page.locator('#keep')
+                if await keep_login.count() > 0:
+                    await keep_login.click()
+            except Exception as e:
+                self.logger.debug(f"로그인 상태 유지 체크 실패 (무시): {e}")
+
+            # 로그인 버튼 클릭
+            try:
+                login_button = page.locator(self.selectors.LOGIN_BUTTON)
+                if await login_button.count() > 0:
+                    await login_button.click()
+                else:
+                    await page.click(self.selectors.LOGIN_BUTTON_ALT)
+            except Exception as e:
+                self.logger.debug(f"버튼 클릭 실패, Enter 키 사용: {e}")
+                await page.press(self.selectors.LOGIN_PW, 'Enter')
+
+            await self._wait(self.wait_times.AFTER_LOGIN)
+
+            # 로그인 완료 대기 (보안인증은 브라우저에서 직접 처리)
+            self.logger.info("로그인 완료 대기 (최대 120초)")
+            print(f"\n⚠️  [{self.group_name}] 로그인 처리 중... 보안인증이 필요하면 브라우저에서 직접 처리해주세요\n")
+
+            max_checks = self.constants.LOGIN_TIMEOUT_SECONDS // self.constants.LOGIN_CHECK_INTERVAL
+            for i in range(max_checks):
+                await self._wait(self.constants.LOGIN_CHECK_INTERVAL * 1000)
+                if not any(lp in page.url for lp in LOGIN_PAGES):
+                    elapsed = (i + 1) * self.constants.LOGIN_CHECK_INTERVAL
+                    self.logger.info(f"로그인 성공 (소요: {elapsed}초)")
+                    print(f"\n✅ [{self.group_name}] 로그인 성공 (소요: {elapsed}초)\n")
+                    await self._save_cookies()
+                    return True
+
+            self.logger.error("로그인 실패: 타임아웃")
+            print(f"\n❌ [{self.group_name}] 로그인 실패: 타임아웃\n")
+            return False
+
+        except Exception as e:
+            self.logger.error(f"로그인 오류: {e}")
+            return False
+
+    # ---- 검색 / 상세 수집 ----
+
+    @retry(
+        stop=stop_after_attempt(RetryConfig.MAX_ATTEMPTS),
+        wait=wait_exponential(min=RetryConfig.MIN_WAIT, max=RetryConfig.MAX_WAIT),
+        retry=retry_if_exception_type((PlaywrightTimeoutError,)),
+        before_sleep=record_retry,
+        reraise=True
+    )
+    async def search_keyword_in_cafe(self, cafe_id: str, keyword: str, page_num: int) -> List[Dict[str, Any]]:
+        """카페 내 키워드 검색 (재시도 포함)"""
+        await self._navigate(self.page, self._search_url(cafe_id, keyword, page_num))
+
+        links_selector = ', '.join(self.selectors.ARTICLE_LINKS)
+        found = []
+
+        async def links_ready():
+            # 프레임 목록/URL은 async API에서도 동기 속성
+            frame = self._find_iframe(['ArticleSearchList', 'menus']) or self.page
+            if await frame.locator(links_selector).count() > 0:
+                found.append(frame)
+                return True
+            return False
+
+        if not await self._poll_ready('search_links', links_ready, self.timeouts.LIST_LOAD):
+            self.logger.debug(f"'{keyword}' {page_num}페이지 결과 없음")
+            return []
+
+        raw_links = await found[0].evaluate(Scripts.EXTRACT_ARTICLE_LINKS, self._link_script_args())
+        posts = self._posts_from_links(self._parse_article_links(raw_links), cafe_id, keyword)
+        self.logger.debug(f"'{keyword}' {page_num}페이지: {len(posts)}개 URL 수집")
+        return posts
+
+    @retry(
+        stop=stop_after_attempt(RetryConfig.MAX_ATTEMPTS),
+        wait=wait_exponential(min=RetryConfig.MIN_WAIT, max=RetryConfig.MAX_WAIT),
+        retry=retry_if_exception_type((PlaywrightTimeoutError, Exception)),
+        before_sleep=record_retry,
+        reraise=True
+    )
+    async def _collect_comments(self, article_frame, url: str, expected_count: Optional[int] = None):
+        """댓글 수집 (재시도 포함) - 댓글 API 응답/댓글 요소 대기 후 DOM 안정화까지
+
+        대기/추출 오류는 재시도하지 않는다 (재시도하면 토글인 댓글 버튼을 다시 눌러 목록이 닫힘).
+        """
+        if expected_count == 0:
+            self.logger.debug(f"목록상 댓글 0개, 댓글 수집 생략: {url}")
+            return []
+
+        page = self._page_of(article_frame)
+        comment_responses = []
+
+        def on_response(response):
+            if self._is_comment_response(response.url):
+                comment_responses.append(response.url)
+
+        page.on('response', on_response)
+        try:
+            # 댓글 버튼 클릭, 없으면 스크롤
+            button = article_frame.locator(', '.join(self.selectors.COMMENT_BUTTON)).first
+            clicked = False
+            try:
+                if await self._poll_ready('comment_button', button.count, self.timeouts.COMMENT_LOAD // 6):
+                    await button.click(timeout=self.timeouts.ELEMENT_WAIT)
+                    clicked = True
+            except Exception as e:
+                self.logger.debug(f"댓글 버튼 클릭 실패: {e}, 스크롤로 대체")
+            if not clicked:
+                await article_frame.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+
+            items = article_frame.locator(self.selectors.COMMENT_ITEMS[0])
+
+            async def comments_ready():
+                return bool(comment_responses) or await items.count() > 0
+
+            try:
+                if not await self._poll_ready('comment_ready', comments_ready, self.timeouts.COMMENT_LOAD):
+                    self.logger.debug(f"댓글 없음: {url}")
+                    return []
+
+                await self._wait_dom_settled(article_frame, 'comment_settled')
+                if not clicked:
+                    await self._scroll_for_more_comments(article_frame, items)
+
+                raw_comments = await article_frame.evaluate(Scripts.EXTRACT_COMMENTS, self._comment_script_args())
+                return self._parse_comment_records(raw_comments)
+
+            except Exception as e:
+                self.logger.debug(f"댓글 수집 실패: {e}")
+                return []
+
+        finally:
+            page.remove_listener('response', on_response)
+
+    async def _scroll_for_more_comments(self, article_frame, items):
+        """스크롤로 지연 로딩되는 댓글 불러오기 (댓글 수가 더 늘지 않으면 중단)"""
+        count = await items.count()
+
+        async def grew():
+            return await items.count() > count
+
+        for _ in range(self.constants.MAX_SCROLL_ATTEMPTS):
+            await article_frame.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+            if not await self._poll_ready('comment_scroll', grew, self.wait_times.SCROLL_INTERVAL):
+                break
+            count = await items.count()
+
+    async def _resolve_article_frame(self, page: Page, post_info: Dict[str, Any]):
+        """제목이 나타난 게시글 프레임 대기 (직전에 찾은 위치 우선, 없으면 전체 프레임)"""
+        selector = self.selectors.ARTICLE_READY
+        found = []
+
+        async def condition():
+            # 프레임 목록/URL은 async API에서도 동기 속성
+            frame = self._cached_article_frame(page, post_info)
+            if frame and await frame.locator(selector).count() > 0:
+                found.append(frame)
+                return True
+            for frame in page.frames:
+                try:
+                    if await frame.locator(selector).count() > 0:
+                        found.append(frame)
+                        return True
+                except Exception:
+                    continue
+            return False
+
+        await self._poll_ready('article_ready', condition, self.timeouts.ARTICLE_READY)
+        if not found:
+            return None
+        self._remember_article_frame(page, found[0])
+        return found[0]
+
+    async def _extract_post_details(self, page: Page, post_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """이동이 끝난 게시글 페이지에서 상세 정보 추출"""
+        url = post_info['url']
+
+        article_frame = await self._resolve_article_frame(page, post_info)
+        if not article_frame:
+            self.logger.warning(f"게시글 프레임 미발견, 메인 페이지 사용 ({url})")
+            article_frame = page
+
+        try:
+            article = self._parse_article_record(
+                await article_frame.evaluate(Scripts.EXTRACT_ARTICLE, self._article_script_args())
+            )
+        except Exception as e:
+            self.logger.error(f"기본 정보 수집 실패 ({url}): {e}")
+            return None
+
+        with self.metrics.timer('comments'):
+            comments = None
+            if self.config.comment_source == 'network':
+                comments = await self._collect_comments_network(page, post_info)
+            if comments is None:
+                comments = []
+                try:
+                    comments = await self._collect_comments(article_frame, url, post_info.get('comment_count'))
+                except Exception as comment_err:
+                    self.logger.debug(f"댓글 수집 실패: {comment_err}")
+
+        return self._build_post_record(post_info, article, comments)
+
+    async def _collect_comments_network(self, page: Page, post_info: Dict[str, Any]) -> Optional[List[CommentRecord]]:
+        """캡처한 게시글/댓글 API 응답으로 댓글 수집 (실패 시 None → 화면 추출)"""
+        key = post_info['article_key']
+        if post_info.get('comment_count') == 0:
+            self.comment_capture.take(key)
+            return []
+
+        captured = []
+
+        async def condition():
+            captured.extend(self.comment_capture.take(key))
+            return bool(captured)
+
+        if not await self._poll_ready('comment_response', condition, self.timeouts.COMMENT_LOAD):
+            self.logger.debug(f"댓글 API 응답 없음, 화면 추출로 대체: {post_info['url']}")
+            return None
+
+        try:
+            results = {}
+            for page_no, response in captured:
+                if not response.ok:
+                    raise ArticleFetchError(f"HTTP {response.status}: {response.url}", status=response.status)
+                results[page_no] = unwrap_result(await response.json(), response.url)
+
+            comments, seen_ids = merge_comment_results(results)
+            # 남은 페이지는 마지막 페이지 이후 빈 목록이 나올 때까지 (collect_comment_pages와 동일 규칙)
+            start_page = max(results) + 1 if seen_ids else MAX_COMMENT_PAGES + 1
+            for page_no in range(start_page, MAX_COMMENT_PAGES + 1):
+                items = comment_items(await self._request_comment_page(page, key, page_no))
+                new_items = [item for item in items if item.get('id') not in seen_ids]
+                if not new_items:
+                    break
+                seen_ids.update(item.get('id') for item in new_items)
+                comments.extend(parse_comment_items(new_items))
+            return comments
+
+        except Exception as e:
+            self.logger.debug(f"댓글 API 응답 처리 실패, 화면 추출로 대체: {e}")
+            return None
+
+    async def _request_comment_page(self, page: Page, key, page_no: int) -> Dict[str, Any]:
+        """브라우저 컨텍스트(쿠키 공유)로 댓글 페이지 조회"""
+        url = self._comment_page_url(key, page_no)
+        await self._pace()
+        response = await page.context.request.get(url, params=COMMENTS_PARAMS, headers={'Referer': f"{CAFE_BASE_URL}/"})
+        if not response.ok:
+            raise ArticleFetchError(f"HTTP {response.status}: {url}", status=response.status)
+        return unwrap_result(await response.json(), url)
+
+    async def collect_post_details(self, page: Page, post_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """게시글 상세 정보 수집 (page: 이 게시글을 열 탭)"""
+        url = post_info['url']
+        article_key = str(post_info['article_key'])
+
+        if article_key in self.article_index:
+            self.article_index.touch(article_key)
+            self.logger.debug(f"중복 게시글 건너뛰기: {url}")
+            self.metrics.inc('duplicate_skipped')
+            return None
+
+        # HTTP 수집 우선 (requests는 동기 → 스레드에서 실행, 요청마다 간격 대기/기록은 이벤트 루프에서)
+        if self.http_fetcher:
+            loop = asyncio.get_running_loop()
+            async with self.http_lock:
+                record = await asyncio.to_thread(
+                    self._fetch_post_details_http, post_info,
+                    lambda request: self._paced_http_request_from_thread(loop, request)
+                )
+            if record:
+                return record
+
+        await self._navigate(page, self._article_nav_url(post_info))
+        with self.metrics.timer('extract'):
+            return await self._extract_post_details(page, post_info)
+
+    async def _get_tab_pages(self) -> List[Page]:
+        """게시글 탭 풀 (tab_pool_size가 1이면 메인 페이지만)"""
+        if self.account_info.tab_pool_size <= 1:
+            return [self.page]
+        while len(self.tab_pages) < self.account_info.tab_pool_size:
+            tab = await self.context.new_page()
+            if not self.cdp_mode:
+                await Stealth().apply_stealth_async(tab)
+            self.tab_pages.append(tab)
+        return self.tab_pages
+
+    async def _collect_posts(self, posts: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], Any]]:
+        """탭마다 작업자 1개가 게시글 큐를 나눠 처리 - (post_info, 레코드/None/예외)를 목록 순서대로 반환"""
+        pending = deque(enumerate(posts))
+        results: List[Any] = [None] * len(posts)
+
+        async def worker(tab: Page):
+            while pending:
+                idx, post_info = pending.popleft()
+                try:
+                    results[idx] = await self.collect_post_details(tab, post_info)
+                except Exception as e:
+                    results[idx] = e
+
+        await asyncio.gather(*(worker(tab) for tab in await self._get_tab_pages()))
+        return list(zip(posts, results))
+
+    # ---- 카페/키워드 흐름 (NaverCafeCrawler의 흐름 제너레이터를 await로 실행) ----
+
+    async def _drive(self, flow: Flow) -> Any:
+        """흐름 제너레이터 실행 - yield된 I/O 호출이 코루틴이면 await해서 결과/예외를 돌려보냄"""
+        result, error = None, None
+        while True:
+            try:
+                call = flow.throw(error) if error is not None else flow.send(result)
+            except StopIteration as stop:
+                return stop.value
+            result, error = None, None
+            try:
+                result = getattr(self, call.method)(*call.args, **call.kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+            except BaseException as e:
+                # 취소(CancelledError)도 흐름에 전달해 finally(컨텍스트 정리 등)가 실행되도록
+                error = e
+
+    async def run(self):
+        """계정 1개 실행 (흐름은 NaverCafeCrawler._run_steps)"""
+        await self._drive(self._run_steps())
+
+
+class AsyncCrawlEngine:
+    """모든 계정을 하나의 이벤트 루프에서 실행 (Playwright 드라이버/Chromium 공유)"""
+
+    def __init__(self, config_path: str = "config.json"):
+        self.config_path = config_path
+        with open(config_path, 'r', encoding='utf-8') as f:
+            self.config = CrawlerSettings(**json.load(f))
+
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self.browser_lock = asyncio.Lock()
+
+        self.viewport = get_viewport(self.config)
+
+    async def get_shared_browser(self) -> Browser:
+        """CDP를 쓰지 않는 계정들이 공유하는 Chromium (최초 요청 시 실행)"""
+        async with self.browser_lock:
+            if self.browser is None or not self.browser.is_connected():
+                self.browser = await self.playwright.chromium.launch(**get_launch_options(self.config))
+                print(f"\n공유 브라우저 시작됨{' (headless)' if self.config.headless else ''}\n")
+            return self.browser
+
+    async def run(self):
+        run_id = open_work_run(self.config)
+        started_at = time.time()
+
+        # cProfile/tracemalloc은 모든 계정이 공유하는 이벤트 루프 전체에 한 번만 (계정별 스냅샷은 각 크롤러가 저장)
+        profiling = self.config.profiling
+        profiler = CrawlProfiler(
+            Path(self.config.log_folder),
+            'async',
+            cprofile=profiling.cprofile,
+            tracemalloc_frames=profiling.tracemalloc_frames if profiling.tracemalloc else 0
+        )
+        for warning in profiler.start():
+            print(f"⚠️ {warning}")
+
+        async with async_playwright() as playwright:
+            self.playwright = playwright
+
+            crawlers = []
+            for account in self.config.accounts:
+                print(f"✅ [{account.group_name}] 시작 (계정: {account.naver_id})")
+                crawlers.append(AsyncNaverCafeCrawler(self, self.config_path, account, account.group_name, run_id))
+
+            results = await asyncio.gather(*(crawler.run() for crawler in crawlers), return_exceptions=True)
+            for crawler, result in zip(crawlers, results):
+                if isinstance(result, Exception):
+                    print(f"\n❌ [{crawler.group_name}] 오류: {result}\n")
+
+            if self.browser:
+                await self.browser.close()
+
+        for path in profiler.stop():
+            print(f"📈 프로파일 저장: {path}")
+
+        # 계정별 지표 스냅샷을 합쳐 저장
+        if export_aggregate(Path(self.config.log_folder), [a.group_name for a in self.config.accounts], since=started_at):
+            print(f"📊 지표 저장: {Path(self.config.log_folder) / 'metrics.prom'}")
+
+
+def run_async_engine(config_path: str = "config.json"):
+    """asyncio 엔진 실행 (crawler.main()에서 호출)"""
+    asyncio.run(AsyncCrawlEngine(config_path).run())
@@ -0,0 +1,315 @@
+"""
+오프라인 크롤러 벤치마크
+- mock_cafe_server로 모의 카페를 띄우고 NaverCafeCrawler를 검색부터 저장까지 그대로 실행 (로그인 생략, 기본 headless)
+- 처리량(게시글/초), 단계별 지연(metrics), 최대 메모리, 수집 결과 검증(게시글 수/댓글 수) 출력
+- --report로 결과 JSON 저장, --baseline으로 이전 결과와 비교
+
+사용 예:
+  python benchmark.py --articles-per-keyword 100 --keywords 3 --latency-ms 80
+  python benchmark.py --fetch-engine http --report after.json --baseline before.json
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from crawler import AccountConfig, NaverCafeCrawler
+from memory_monitor import MB, psutil
+from mock_cafe_server import MockCafeServer, add_option_arguments, options_from_args
+from rate_controller import AimdRateController
+
+GROUP_NAME = 'bench'
+CAFE_ID_BASE = 10000000
+
+
+class BenchmarkCrawler(NaverCafeCrawler):
+    """모의 서버용 크롤러 (모의 서버에는 인증이 없으므로 로그인 생략, 요청 간격 고정 가능)"""
+
+    def __init__(self, *args, delay_ms: Optional[float] = None, **kwargs):
+        self.delay_ms = delay_ms
+        super().__init__(*args, **kwargs)
+
+    def _create_rate_controller(self) -> AimdRateController:
+        if self.delay_ms is None:
+            return super()._create_rate_controller()
+        return AimdRateController(
+            initial_delay_ms=self.delay_ms,
+            floor_ms=self.delay_ms,
+            ceiling_ms=self.delay_ms,
+            jitter=0,
+            adaptive=False
+        )
+
+    def login_naver(self) -> bool:
+        self.logger.info("벤치마크: 모의 서버 사용, 로그인 생략")
+        return True
+
+
+class PeakMemorySampler:
+    """파이썬 프로세스 + 자식 프로세스(Playwright 드라이버, Chromium) RSS 합계의 최댓값 (psutil 필요)"""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.peak_mb: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> float:
+        process = psutil.Process()
+        total = process.memory_info().rss
+        for child in process.children(recursive=True):
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / MB
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.peak_mb = max(self.peak_mb or 0.0, self._sample())
+            except psutil.Error:
+                pass
+            self._stop.wait(self.interval)
+
+    def start(self):
+        if psutil is None:
+            return
+        self._thread = threading.Thread(target=self._run, name='peak-memory-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+
+def max_rss_mb(who: int) -> Optional[float]:
+    """getrusage 최대 RSS (MB, 자식은 종료된 프로세스 중 최댓값)"""
+    if resource is None:
+        return None
+    value = resource.getrusage(who).ru_maxrss
+    # 리눅스는 KB, macOS는 바이트
+    return value / MB if sys.platform == 'darwin' else value / 1024
+
+
+def event_totals(counters: Dict[Any, float]) -> Dict[str, float]:
+    """(이벤트, 계정, 카페)별 횟수를 이벤트별로 합산"""
+    totals: Dict[str, float] = {}
+    for (event, _, _), value in counters.items():
+        totals[event] = totals.get(event, 0) + value
+    return totals
+
+
+def build_config(args: argparse.Namespace, base_url: str, work_dir: Path) -> Dict[str, Any]:
+    cafes = [
+        {'cafe_id': str(CAFE_ID_BASE + index), 'cafe_name': f"벤치카페{index + 1}", 'cafe_url': f"{base_url}/bench{index + 1}"}
+        for index in range(args.cafes)
+    ]
+    return {
+        'accounts': [{
+            'naver_id': 'benchmark',
+            'naver_password': 'benchmark',
+            'assigned_cafes': [cafe['cafe_name'] for cafe in cafes],
+            'group_name': GROUP_NAME,
+            'tab_pool_size': args.tab_pool_size
+        }],
+        'cafes': cafes,
+        'keywords': [f"키워드{index + 1}" for index in range(args.keywords)],
+        'output_prefix': 'benchmark',
+        'output_folder': str(work_dir / 'results'),
+        'log_folder': str(work_dir / 'logs'),
+        'headless': not args.headed,
+        'cafe_base_url': base_url,
+        'api_base_url': base_url,
+        'fetch_engine': args.fetch_engine,
+        'article_navigation': args.article_navigation,
+        'comment_source': args.comment_source,
+        'result_sinks': ['jsonl'],
+        'resume': False
+    }
+
+
+def verify_results(server: MockCafeServer, config: Dict[str, Any], output_folder: Path) -> Dict[str, Any]:
+    """저장된 JSONL 결과를 모의 서버 데이터와 비교 (누락 게시글, 댓글 수 불일치)"""
+    cafe = server.cafe
+    expected = set()
+    for cafe_info in config['cafes']:
+        for keyword in config['keywords']:
+            expected.update(f"{cafe_info['cafe_id']}:{article_id}" for article_id in cafe.article_ids(cafe_info['cafe_id'], keyword))
+
+    records: Dict[str, Dict[str, Any]] = {}
+    for path in output_folder.glob(f"*.{GROUP_NAME}.jsonl"):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    records[record['게시글키']] = record
+
+    comment_mismatch = 0
+    for key, record in records.items():
+        cafe_id, article_id = key.split(':')
+        if len(record['댓글']) != cafe.comment_count(cafe_id, int(article_id)):
+            comment_mismatch += 1
+
+    return {
+        'expected_articles': len(expected),
+        'collected_articles': len(records),
+        'missing_articles': len(expected - set(records)),
+        'comment_mismatch': comment_mismatch
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    work_dir = Path(args.work_dir) if args.work_dir else Path(tempfile.mkdtemp(prefix='cafe_benchmark_'))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    options = options_from_args(args)
+
+    with MockCafeServer(options) as server:
+        config = build_config(args, server.base_url, work_dir)
+        config_path = work_dir / 'config.json'
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f, ensure_ascii=False, indent=2)
+
+        crawler = BenchmarkCrawler(
+            config_path=str(config_path),
+            account_info=AccountConfig(**config['accounts'][0]),
+            group_name=GROUP_NAME,
+            delay_ms=None if args.real_pacing else args.delay_ms
+        )
+
+        sampler = PeakMemorySampler()
+        sampler.start()
+        started = time.perf_counter()
+        try:
+            crawler.run()
+        finally:
+            elapsed = time.perf_counter() - started
+            sampler.stop()
+
+        verification = verify_results(server, config, Path(config['output_folder']))
+        request_counts = dict(server.request_counts)
+
+    collected = verification['collected_articles']
+    peak = crawler.memory_policy.peak
+    report = {
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'settings': {
+            'cafes': args.cafes,
+            'keywords': args.keywords,
+            'tab_pool_size': args.tab_pool_size,
+            'fetch_engine': args.fetch_engine,
+            'article_navigation': args.article_navigation,
+            'comment_source': args.comment_source,
+            'delay_ms': None if args.real_pacing else args.delay_ms,
+            'headless': not args.headed,
+            'mock': options.model_dump()
+        },
+        'elapsed_seconds': elapsed,
+        'articles_per_second': collected / elapsed if elapsed else 0.0,
+        'verification': verification,
+        'requests': request_counts,
+        'stages': crawler.metrics.stage_stats(),
+        'counters': event_totals(crawler.metrics.counters),
+        'memory_mb': {
+            'process_tree_peak': sampler.peak_mb,
+            'python_max_rss': max_rss_mb(resource.RUSAGE_SELF) if resource else None,
+            'children_max_rss': max_rss_mb(resource.RUSAGE_CHILDREN) if resource else None,
+            'js_heap_peak': peak['js_heap_mb'] or None,
+            'renderer_rss_peak': peak['renderer_rss_mb'] or None
+        },
+        'work_dir': str(work_dir)
+    }
+
+    if not args.keep and not args.work_dir:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return report
+
+
+def _fmt_seconds(value: float) -> str:
+    return '>60s' if value == float('inf') else f"{value * 1000:.0f}ms"
+
+
+def _fmt_mb(value: Optional[float]) -> str:
+    return f"{value:.0f}MB" if value is not None else '-'
+
+
+def _change(current: float, previous: Optional[float]) -> str:
+    if not previous:
+        return ''
+    return f" ({(current - previous) / previous * 100:+.1f}%)"
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    base_stages = (baseline or {}).get('stages', {})
+    verification = report['verification']
+    memory = report['memory_mb']
+
+    print(f"\n{'='*80}")
+    print("벤치마크 결과")
+    print(f"{'='*80}")
+    print(f"소요 시간: {report['elapsed_seconds']:.1f}초{_change(report['elapsed_seconds'], (baseline or {}).get('elapsed_seconds'))}")
+    print(f"처리량: {report['articles_per_second']:.2f} 게시글/초{_change(report['articles_per_second'], (baseline or {}).get('articles_per_second'))}")
+    print(f"수집: {verification['collected_articles']}/{verification['expected_articles']}개 "
+          f"(누락 {verification['missing_articles']}개, 댓글 수 불일치 {verification['comment_mismatch']}개)")
+    print(f"요청 수: {report['requests']}")
+    print(f"메모리: 프로세스 트리 최대 {_fmt_mb(memory['process_tree_peak'])}, 파이썬 최대 {_fmt_mb(memory['python_max_rss'])}, "
+          f"자식 최대 {_fmt_mb(memory['children_max_rss'])}, JS 힙 최대 {_fmt_mb(memory['js_heap_peak'])}")
+
+    print(f"\n{'단계':<28}{'횟수':>8}{'합계':>10}{'평균':>10}{'p50':>10}{'p95':>10}")
+    for stage, values in sorted(report['stages'].items(), key=lambda item: item[1]['total'], reverse=True):
+        previous = base_stages.get(stage, {}).get('mean')
+        print(f"{stage:<28}{values['count']:>8}{values['total']:>9.1f}s{_fmt_seconds(values['mean']):>10}"
+              f"{_fmt_seconds(values['p50']):>10}{_fmt_seconds(values['p95']):>10}{_change(values['mean'], previous)}")
+
+    if report['counters']:
+        print(f"\n이벤트: {', '.join(f'{event} {value:g}' for event, value in sorted(report['counters'].items()))}")
+    print(f"{'='*80}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 카페 서버 기반 크롤러 벤치마크")
+    parser.add_argument('--cafes', type=int, default=1, help="카페 수")
+    parser.add_argument('--keywords', type=int, default=2, help="키워드 수")
+    parser.add_argument('--tab-pool-size', type=int, default=1, help="게시글 동시 로딩 탭 수")
+    parser.add_argument('--fetch-engine', choices=['browser', 'http'], default='browser')
+    parser.add_argument('--article-navigation', choices=['shell', 'direct'], default='shell')
+    parser.add_argument('--comment-source', choices=['dom', 'network'], default='dom')
+    parser.add_argument('--delay-ms', type=float, default=0, help="고정 요청 간격 (크롤러 자체 비용만 측정, 기본값 0)")
+    parser.add_argument('--real-pacing', action='store_true', help="고정 간격 대신 계정 기본 요청 간격 제어 사용")
+    parser.add_argument('--headed', action='store_true', help="브라우저 화면 표시")
+    parser.add_argument('--work-dir', help="설정/결과/로그 폴더 (지정 시 삭제하지 않음)")
+    parser.add_argument('--keep', action='store_true', help="임시 작업 폴더 유지")
+    parser.add_argument('--report', help="결과 JSON 저장 경로")
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON")
+    add_option_arguments(parser)
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    report = run_benchmark(args)
+    print_report(report, baseline)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        print(f"결과 저장: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
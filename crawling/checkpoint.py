@@ -0,0 +1,168 @@
+"""
+크롤링 진행 상황 체크포인트
+- 계정(그룹)별 JSON 파일 1개 (log_folder/checkpoint_<그룹>.json)
+- 임시 파일에 쓰고 os.replace로 교체 (쓰는 도중 종료되어도 이전 체크포인트 유지)
+- 완료된 카페, 현재 카페의 단계(discover/fetch), 키워드/페이지, 후보 게시글 큐 저장
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from models import ArticleKey
+
+CHECKPOINT_VERSION = 1
+
+
+def _encode_post(post: Dict[str, Any]) -> Dict[str, Any]:
+    """후보 게시글 dict를 JSON 저장용으로 변환 (ArticleKey → 문자열)"""
+    encoded = dict(post)
+    encoded['article_key'] = str(post['article_key'])
+    return encoded
+
+
+def _decode_post(post: Dict[str, Any]) -> Dict[str, Any]:
+    decoded = dict(post)
+    cafe_id, article_id = post['article_key'].split(':', 1)
+    decoded['article_key'] = ArticleKey(cafe_id, article_id)
+    return decoded
+
+
+class CrawlCheckpoint:
+    """계정별 크롤링 체크포인트"""
+
+    def __init__(self, log_folder: Path, group_name: str):
+        self.path = Path(log_folder) / f"checkpoint_{group_name}.json"
+        self.group_name = group_name
+        self.state: Dict[str, Any] = {}
+
+    def load(self, output: str) -> bool:
+        """체크포인트 읽기 (다른 주차 출력용이거나 손상된 파일이면 무시)"""
+        if not self.path.exists():
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if state.get('version') != CHECKPOINT_VERSION or state.get('output') != output:
+            return False
+        self.state = state
+        return True
+
+    def start(self, output: str):
+        """새 실행 시작 (기존 체크포인트 대체)"""
+        self.state = {
+            'version': CHECKPOINT_VERSION,
+            'group': self.group_name,
+            'output': output,
+            'completed_cafes': [],
+            'cafe': None
+        }
+        self.save()
+
+    def save(self):
+        """원자적 저장 (임시 파일 → fsync → 교체)"""
+        self.state['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """전체 완료 후 삭제"""
+        self.state = {}
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    # ---- 카페 단위 ----
+
+    def is_cafe_done(self, cafe_name: str) -> bool:
+        return cafe_name in self.state.get('completed_cafes', [])
+
+    def cafe_state(self, cafe_name: str) -> Optional[Dict[str, Any]]:
+        """진행 중이던 카페 상태 (다른 카페면 None)"""
+        cafe = self.state.get('cafe')
+        if cafe and cafe.get('name') == cafe_name:
+            return cafe
+        return None
+
+    def begin_cafe(self, cafe_name: str):
+        self.state['cafe'] = {
+            'name': cafe_name,
+            'phase': 'discover',
+            'keyword': None,
+            'page': 1,
+            'done_keywords': [],
+            'newest_ids': {},
+            'candidates': [],
+            'fetched': 0
+        }
+        self.save()
+
+    def finish_cafe(self, cafe_name: str):
+        self.state.setdefault('completed_cafes', []).append(cafe_name)
+        self.state['cafe'] = None
+        self.save()
+
+    # ---- 검색 단계 ----
+
+    def record_page(
+        self,
+        keyword: str,
+        next_page: int,
+        candidates: Dict[str, Dict[str, Any]],
+        newest_id: Optional[int]
+    ):
+        """검색 페이지 처리 후 기록 (다음에 검색할 페이지와 지금까지의 후보)"""
+        cafe = self.state['cafe']
+        cafe['keyword'] = keyword
+        cafe['page'] = next_page
+        cafe['candidates'] = [_encode_post(post) for post in candidates.values()]
+        if newest_id:
+            cafe['newest_ids'][keyword] = max(newest_id, cafe['newest_ids'].get(keyword, 0))
+        self.save()
+
+    def finish_keyword(self, keyword: str, newest_id: Optional[int]):
+        cafe = self.state['cafe']
+        cafe['done_keywords'].append(keyword)
+        cafe['keyword'] = None
+        cafe['page'] = 1
+        if newest_id:
+            cafe['newest_ids'][keyword] = max(newest_id, cafe['newest_ids'].get(keyword, 0))
+        self.save()
+
+    def fail_keyword(self, keyword: str):
+        """검색이 중간에 끊긴 키워드 (이미 찾은 후보는 수집하되 워터마크는 갱신하지 않음)"""
+        cafe = self.state['cafe']
+        cafe['done_keywords'].append(keyword)
+        cafe['keyword'] = None
+        cafe['page'] = 1
+        cafe['newest_ids'].pop(keyword, None)
+        self.save()
+
+    def restored_candidates(self, cafe_state: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        return {post['article_key']: _decode_post(post) for post in cafe_state.get('candidates', [])}
+
+    # ---- 상세 수집 단계 ----
+
+    def begin_fetch(self, candidates: List[Dict[str, Any]]):
+        cafe = self.state['cafe']
+        cafe['phase'] = 'fetch'
+        cafe['candidates'] = [_encode_post(post) for post in candidates]
+        cafe['fetched'] = 0
+        cafe['failed_ids'] = {}
+        self.save()
+
+    def record_fetched(self, fetched: int, failed_ids: Dict[str, int]):
+        """배치 저장 완료 후 처리한 후보 수와 키워드별 가장 오래된 실패 게시글 ID 기록"""
+        self.state['cafe']['fetched'] = fetched
+        self.state['cafe']['failed_ids'] = dict(failed_ids)
+        self.save()
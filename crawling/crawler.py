@@ -16,20 +16,37 @@ import re
 import sys
 import time
 import traceback
+from collections import OrderedDict, deque
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
-from urllib.parse import quote
+from typing import Callable, List, Dict, Any, Optional, Union, Iterator, Tuple, Generator, NamedTuple
+from urllib.parse import quote, urlparse
 
 from playwright.sync_api import sync_playwright, Page, Browser, Frame, TimeoutError as PlaywrightTimeoutError
 from playwright_stealth import Stealth
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font, Alignment
+from openpyxl import load_workbook
 from pydantic import BaseModel, Field, field_validator
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from article_index import ArticleIndex
+from http_fetcher import (
+    NaverCafeHttpFetcher, ArticleFetchError, RequestHook, DEFAULT_API_BASE_URL, COMMENTS_PATH, COMMENTS_PARAMS,
+    collect_comment_pages, comment_items, match_api_url, parse_comment_items, unwrap_result
+)
+from models import CAFE_BASE_URL, ArticleKey, ArticleRecord, CommentRecord
+from rate_controller import AimdRateController
+from checkpoint import CrawlCheckpoint
+from metrics import CrawlMetrics, export_aggregate
+from profiling import CrawlProfiler
+from memory_monitor import (
+    MemoryPolicy, MemorySample, RECYCLE_BROWSER, RECYCLE_CONTEXT, RECYCLE_PAGE,
+    js_heap_mb, process_rss_mb, renderer_pids, rss_mb_of_pids
+)
+from result_sinks import ResultSink, ExcelSink, SINK_TYPES, create_sink
+from work_queue import WorkQueue, WorkUnit
+
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
@@ -45,6 +62,9 @@ class Timeouts:
     PAGE_LOAD = 30000  # 30초
     ELEMENT_WAIT = 5000  # 5초
     COMMENT_LOAD = 3000  # 3초
+    LIST_LOAD = 3000  # 3초
+    ARTICLE_READY = 3000  # 게시글 제목 표시 대기
+    DOM_SETTLE = 1500  # DOM 변경이 멈출 때까지 최대 대기
     NETWORK_IDLE = 10000  # 10초
 
 
@@ -54,9 +74,10 @@ class WaitTimes:
     AFTER_LOGIN = 2000
     AFTER_PAGE_LOAD = 500
     AFTER_IFRAME_SWITCH = 1000
-    AFTER_COMMENT_CLICK = 2000
     BETWEEN_PAGES = 1000
-    SCROLL_INTERVAL = 300
+    READY_POLL = 100  # 준비 상태 확인 간격
+    SCROLL_INTERVAL = 300  # 스크롤 후 댓글이 더 나타나는지 기다리는 최대 시간
+    DOM_QUIET = 200  # 이 시간 동안 DOM 변경이 없으면 렌더링 완료로 판단
 
 
 @dataclass(frozen=True)
@@ -70,9 +91,93 @@ class RetryConfig:
 @dataclass(frozen=True)
 class CrawlerConstants:
     """크롤러 상수"""
-    MAX_SCROLL_ATTEMPTS = 5
     LOGIN_TIMEOUT_SECONDS = 120
     LOGIN_CHECK_INTERVAL = 10
+    FETCH_BATCH_SIZE = 50  # 상세 수집 후 저장 단위
+    MAX_SCROLL_ATTEMPTS = 5  # 댓글 버튼이 없을 때 지연 로딩 댓글 스크롤 횟수
+    WORK_QUEUE_POLL_SECONDS = 30  # 다른 작업자가 임대 중인 작업만 남았을 때 확인 간격
+    # 이동 후 이 URL로 바뀌면 차단 신호 (로그인 만료/보안 확인)
+    BLOCK_URL_PATTERNS = ('nid.naver.com', 'captcha')
+    BLOCK_STATUS_CODES = (403, 429)
+    # 댓글 목록 API 응답 URL 판별
+    COMMENT_API_MARKERS = ('cafe-articleapi', '/comments')
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+# Chromium 실행 옵션 (창 위치/크기 제외)
+CHROMIUM_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-software-rasterizer',
+    '--disable-extensions',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-features=TranslateUI',
+    '--disable-features=Translate',
+    # 백그라운드 탭 로딩 지연 방지 (게시글 탭 풀)
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--js-flags=--expose-gc'
+]
+
+# headless 서버 모드 추가 옵션 (디스플레이/오디오/첫 실행 화면/백그라운드 서비스 없음)
+HEADLESS_CHROMIUM_ARGS = [
+    '--mute-audio',
+    '--hide-scrollbars',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-breakpad',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--password-store=basic',
+    '--use-mock-keychain'
+]
+
+
+def get_window_size() -> Tuple[int, int]:
+    """창 크기 (화면 해상도의 절반, Windows 외에는 1920x1080 기준)"""
+    screen_w, screen_h = 1920, 1080
+    if sys.platform == 'win32':
+        try:
+            screen_w = ctypes.windll.user32.GetSystemMetrics(0)
+            screen_h = ctypes.windll.user32.GetSystemMetrics(1)
+        except Exception:
+            pass
+    return screen_w // 2, screen_h // 2
+
+
+def get_viewport(config: 'CrawlerSettings') -> Dict[str, int]:
+    """컨텍스트 뷰포트 (headless는 설정값 고정, 창 모드는 화면 해상도 절반)"""
+    if config.headless:
+        return {'width': config.viewport_width, 'height': config.viewport_height}
+    win_w, win_h = get_window_size()
+    return {'width': win_w, 'height': win_h}
+
+
+def get_launch_options(config: 'CrawlerSettings', window_position: Optional[str] = None) -> Dict[str, Any]:
+    """chromium.launch 옵션 (headless 서버 모드 / 창 모드)"""
+    viewport = get_viewport(config)
+    window_size = f"--window-size={viewport['width']},{viewport['height']}"
+    if config.headless:
+        return {'headless': True, 'args': [window_size] + CHROMIUM_ARGS + HEADLESS_CHROMIUM_ARGS}
+
+    args = [window_size] + CHROMIUM_ARGS
+    if window_position:
+        x = 0 if window_position == 'left' else viewport['width']
+        args.insert(0, f'--window-position={x},0')
+    return {'headless': False, 'args': args}
+
+
+def get_context_options(config: 'CrawlerSettings') -> Dict[str, Any]:
+    """new_context 옵션 (headless는 서버 환경과 무관하게 같은 화면/언어/시간대)"""
+    options = {'viewport': get_viewport(config), 'user_agent': CrawlerConstants.USER_AGENT}
+    if config.headless:
+        options.update(device_scale_factor=1, locale=config.locale, timezone_id=config.timezone_id)
+    return options
 
 
 class CafeInfo(BaseModel):
@@ -90,8 +195,76 @@ class AccountConfig(BaseModel):
     group_name: str = Field(..., min_length=1, description="그룹 이름")
     debug_port: int = Field(default=9222, description="Chrome 원격 디버깅 포트")
     window_position: str = Field(default="left", description="창 위치 (left/right)")
-    rate_limit_min_ms: int = Field(default=300, description="페이지 간 최소 대기 시간 (ms)")
-    rate_limit_max_ms: int = Field(default=800, description="페이지 간 최대 대기 시간 (ms)")
+    rate_limit_min_ms: int = Field(default=300, description="요청 간 최소 간격 (ms, rate_control.floor_ms 기본값)")
+    rate_limit_max_ms: int = Field(default=800, description="초기 요청 간격 산정용 (BETWEEN_PAGES + 최소/최대 평균)")
+    tab_pool_size: int = Field(default=1, ge=1, description="게시글 동시 로딩 탭 수 (1이면 순차 처리)")
+    accessible_cafes: Optional[List[str]] = Field(default=None, description="작업 큐 모드에서 처리 가능한 카페 (없으면 전체)")
+
+
+class ResourceBlockingConfig(BaseModel):
+    """네트워크 리소스 차단 정책 (도메인 허용 > 도메인 차단 > 타입 허용/차단 순)
+
+    Playwright는 route를 하나라도 등록하면 컨텍스트의 HTTP 캐시를 끄므로 (카페 JS/CSS를 매번 다시 받음)
+    기본값은 꺼져 있다. 켜면 차단 도메인과 차단 타입의 확장자에 해당하는 URL만 route로 가로챈다.
+    """
+    enabled: bool = Field(default=False, description="리소스 차단 사용 여부 (켜면 HTTP 캐시가 꺼짐)")
+    block_resource_types: List[str] = Field(
+        default=['image', 'media', 'font'],
+        description="차단할 리소스 타입 (Playwright resource_type)"
+    )
+    allow_resource_types: List[str] = Field(
+        default_factory=list,
+        description="허용할 리소스 타입 (지정 시 목록 외 타입은 모두 차단, 모든 요청을 route로 가로챔)"
+    )
+    block_domains: List[str] = Field(
+        default=[
+            'doubleclick.net',
+            'googlesyndication.com',
+            'google-analytics.com',
+            'googletagmanager.com',
+            'adcr.naver.com',
+            'veta.naver.com',
+            'lcs.naver.com',
+            'wcs.naver.net',
+            'tivan.naver.com'
+        ],
+        description="차단할 도메인 (하위 도메인 포함)"
+    )
+    allow_domains: List[str] = Field(
+        default=['nid.naver.com'],
+        description="항상 허용할 도메인 (로그인 보안문자 이미지 등)"
+    )
+
+
+class RateControlConfig(BaseModel):
+    """계정별 적응형 요청 간격 (AIMD)"""
+    enabled: bool = Field(default=True, description="응답 지연/오류/차단 신호에 따라 간격 자동 조정 (false면 초기 간격 고정)")
+    floor_ms: Optional[int] = Field(default=None, ge=0, description="최소 요청 간격 (없으면 계정의 rate_limit_min_ms)")
+    ceiling_ms: int = Field(default=30000, ge=0, description="최대 요청 간격")
+    additive_step: float = Field(default=2.0, gt=0, description="정상 응답마다 올리는 속도 (분당 요청 수)")
+    backoff_factor: float = Field(default=0.5, gt=0, lt=1, description="감속 시 속도에 곱하는 값")
+    latency_threshold_ms: int = Field(default=5000, ge=0, description="이 값을 넘는 응답은 지연 증가로 판단")
+    block_cooldown_ms: int = Field(default=60000, ge=0, description="차단 신호 후 최대 간격 유지 시간")
+
+
+class MemoryPolicyConfig(BaseModel):
+    """측정 메모리 기반 탭/컨텍스트/브라우저 재생성 (배치/검색 페이지마다 측정)"""
+    enabled: bool = Field(default=True, description="false면 30분마다 브라우저 재시작 (CDP 모드 제외)")
+    page_heap_mb: int = Field(default=256, ge=0, description="탭 JS 힙이 넘으면 탭 재생성 (0: 사용 안 함)")
+    renderer_rss_mb: int = Field(default=1536, ge=0, description="렌더러 RSS 합계가 넘으면 컨텍스트 재생성 (psutil 필요, 0: 사용 안 함)")
+    process_rss_mb: int = Field(default=1024, ge=0, description="파이썬 프로세스 RSS가 넘으면 컨텍스트 재생성 (0: 사용 안 함)")
+    browser_restart_after: int = Field(default=3, ge=1, description="RSS 초과가 이 횟수보다 연속되면 브라우저 재시작 (CDP 모드는 컨텍스트 재생성)")
+    max_age_seconds: Optional[int] = Field(default=None, ge=60, description="측정값과 무관한 컨텍스트 최대 사용 시간 (없으면 제한 없음)")
+
+
+class ProfilingConfig(BaseModel):
+    """선택적 프로파일링 (결과 파일은 log_folder에 <종류>_<그룹>_<시각> 이름으로 저장)"""
+    cprofile: bool = Field(default=False, description="실행 전체 cProfile (profile_*.prof + 누적 시간 상위 .txt)")
+    tracemalloc: bool = Field(default=False, description="브라우저 재시작/컨텍스트 재생성마다 tracemalloc 스냅샷 (tracemalloc_*.snapshot)")
+    tracemalloc_frames: int = Field(default=10, ge=1, description="tracemalloc 할당 위치 저장 프레임 수")
+    trace_articles: int = Field(default=0, ge=0, description="Playwright 트레이싱할 게시글 수 (0: 사용 안 함, trace_*.zip)")
+    trace_after_articles: int = Field(default=0, ge=0, description="이 수만큼 게시글을 처리한 뒤부터 트레이싱")
+    trace_screenshots: bool = Field(default=False, description="트레이스에 화면 캡처 포함")
 
 
 class CrawlerSettings(BaseModel):
@@ -102,6 +275,29 @@ class CrawlerSettings(BaseModel):
     output_prefix: str = Field(default='모니터링', description="출력 파일명 접두사")
     output_folder: str = Field(default='results', description="출력 폴더")
     log_folder: str = Field(default='logs', description="로그 폴더")
+    dedup_db: str = Field(default='crawled_articles.db', description="수집 이력 DB 파일명 (output_folder 기준)")
+    use_watermark: bool = Field(default=True, description="이미 처리한 게시글만 있는 페이지에서 검색 조기 종료")
+    fetch_engine: str = Field(default='browser', pattern=r'^(browser|http)$', description="게시글 수집 방식 (browser/http)")
+    article_navigation: str = Field(default='shell', pattern=r'^(shell|direct)$', description="게시글 이동 방식 (shell: 카페 화면 / direct: 게시글 iframe 문서 직접 로딩)")
+    comment_source: str = Field(default='dom', pattern=r'^(dom|network)$', description="브라우저 수집 시 댓글 수집 방식 (dom: 화면 추출 / network: 댓글 API 응답)")
+    api_base_url: str = Field(default=DEFAULT_API_BASE_URL, pattern=r'^https?://', description="HTTP 수집용 카페 API 주소")
+    cafe_base_url: str = Field(default=CAFE_BASE_URL, pattern=r'^https?://', description="검색/게시글 화면 주소 (로컬 테스트 서버 지정 가능)")
+    http_pool_size: int = Field(default=4, ge=1, description="HTTP 수집 커넥션 풀 크기")
+    resource_blocking: ResourceBlockingConfig = Field(default_factory=ResourceBlockingConfig, description="리소스 차단 정책")
+    engine: str = Field(default='process', pattern=r'^(process|async)$', description="실행 방식 (process: 계정별 프로세스 / async: 단일 프로세스 asyncio)")
+    scheduler: str = Field(default='static', pattern=r'^(static|queue)$', description="카페 배분 방식 (static: assigned_cafes / queue: 공유 작업 큐)")
+    work_queue_db: str = Field(default='work_queue.db', description="작업 큐 DB 파일명 (output_folder 기준)")
+    lease_seconds: int = Field(default=900, ge=60, description="작업 임대 시간 (초, 진행 중에는 자동 연장)")
+    resume: bool = Field(default=True, description="체크포인트가 있으면 중단된 위치부터 이어서 수집 (같은 주차 출력일 때만)")
+    rate_control: RateControlConfig = Field(default_factory=RateControlConfig, description="요청 간격 제어")
+    memory_policy: MemoryPolicyConfig = Field(default_factory=MemoryPolicyConfig, description="메모리 기반 재생성 정책")
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig, description="프로파일링 (기본 꺼짐)")
+    headless: bool = Field(default=False, description="화면 없는 서버 모드 (CDP 연결 생략, 고정 뷰포트)")
+    viewport_width: int = Field(default=1366, ge=320, description="headless 뷰포트 너비")
+    viewport_height: int = Field(default=768, ge=320, description="headless 뷰포트 높이")
+    locale: str = Field(default='ko-KR', description="headless 브라우저 언어")
+    timezone_id: str = Field(default='Asia/Seoul', description="headless 브라우저 시간대")
+    result_sinks: List[str] = Field(default=['excel'], min_length=1, description="결과 저장 형식 (excel/jsonl/sqlite/parquet)")
 
     @field_validator('keywords')
     @classmethod
@@ -110,6 +306,14 @@ class CrawlerSettings(BaseModel):
             raise ValueError("keywords must have at least one item")
         return v
 
+    @field_validator('result_sinks')
+    @classmethod
+    def validate_result_sinks(cls, v):
+        unknown = [name for name in v if name not in SINK_TYPES]
+        if unknown:
+            raise ValueError(f"unknown result_sinks: {unknown} (supported: {list(SINK_TYPES)})")
+        return list(dict.fromkeys(v))
+
     @field_validator('cafes')
     @classmethod
     def validate_cafes(cls, v):
@@ -138,8 +342,12 @@ class Selectors:
         '.article-board a.article',
         'a[href*="ArticleRead"]'
     )
+    LIST_ROW: str = 'tr, li, .article-board-item'
+    LIST_COMMENT_COUNT: str = '.cmt, .comment_count, .num_comment'
+    LIST_DATE: str = '.td_date, .date, .article_date'
 
     # 게시글 정보
+    ARTICLE_READY: str = 'h3.title_text'
     TITLE: str = 'h3.title_text, .title_text, .title_area'
     AUTHOR: str = 'button.nickname, .nickname, .nick_name, .article_writer .nickname'
     DATE: str = 'span.date, .date, .article_info .date, .write_date'
@@ -169,13 +377,320 @@ class Selectors:
     )
     COMMENT_AUTHOR: str = 'a.comment_nickname'
     COMMENT_TEXT: str = 'span.text_comment'
+    COMMENT_DATE: str = 'span.comment_info_date'
+    COMMENT_REPLY_CLASS: str = 'CommentItem--reply'
+
+
+@dataclass(frozen=True)
+class Scripts:
+    """페이지 내 실행 스크립트 (evaluate 1회로 여러 요소 수집)"""
+
+    # 게시글 기본 정보 - 선택자 우선순위는 locator(...).first와 동일
+    EXTRACT_ARTICLE: str = """
+    (sel) => {
+        const pick = (selector) => {
+            const el = document.querySelector(selector);
+            return el ? el.innerText : '';
+        };
+        let likes = '';
+        for (const selector of sel.likes) {
+            const el = document.querySelector(selector);
+            if (el) {
+                likes = el.innerText;
+                break;
+            }
+        }
+        return {
+            title: pick(sel.title),
+            author: pick(sel.author),
+            date: pick(sel.date),
+            content: pick(sel.content),
+            likes: likes
+        };
+    }
+    """
+
+    # 검색 결과 링크 일괄 수집 - ARTICLE_LINKS 전체를 순서대로, 게시글 ID 기준 중복 제거
+    # (/articles/<n> 및 ArticleRead ...articleid=<n> 형식)
+    EXTRACT_ARTICLE_LINKS: str = """
+    (sel) => {
+        const seen = new Set();
+        const results = [];
+        const pick = (row, selector) => {
+            const el = row ? row.querySelector(selector) : null;
+            return el ? el.innerText : '';
+        };
+        for (const selector of sel.links) {
+            for (const a of document.querySelectorAll(selector)) {
+                const href = a.href;
+                const match = href ? href.match(/(?:\\/articles\\/|articleid=)(\\d+)/i) : null;
+                if (!match || seen.has(match[1])) continue;
+                seen.add(match[1]);
+                const row = a.closest(sel.row);
+                results.push({
+                    url: href,
+                    title: a.innerText,
+                    commentCount: pick(row, sel.commentCount),
+                    date: pick(row, sel.date)
+                });
+            }
+        }
+        return results;
+    }
+    """
+
+    # DOM 변경이 quietMs 동안 없으면 true, timeoutMs까지 계속되면 false
+    WAIT_DOM_SETTLED: str = """
+    (opts) => new Promise((resolve) => {
+        const root = document.querySelector(opts.root) || document.body;
+        if (!root) {
+            resolve(false);
+            return;
+        }
+        let quietTimer = null;
+        let deadline = null;
+        const observer = new MutationObserver(() => {
+            clearTimeout(quietTimer);
+            quietTimer = setTimeout(() => finish(true), opts.quietMs);
+        });
+        const finish = (settled) => {
+            observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(deadline);
+            resolve(settled);
+        };
+        observer.observe(root, {childList: true, subtree: true, characterData: true});
+        quietTimer = setTimeout(() => finish(true), opts.quietMs);
+        deadline = setTimeout(() => finish(false), opts.timeoutMs);
+    })
+    """
+
+    # 댓글 일괄 수집 - COMMENT_ITEMS 중 처음 매칭되는 선택자 사용
+    EXTRACT_COMMENTS: str = """
+    (sel) => {
+        let items = [];
+        for (const selector of sel.items) {
+            items = document.querySelectorAll(selector);
+            if (items.length > 0) break;
+        }
+        const results = [];
+        for (const item of items) {
+            const author = item.querySelector(sel.author);
+            const text = item.querySelector(sel.text);
+            const date = item.querySelector(sel.date);
+            results.push({
+                author: author ? author.innerText : '',
+                text: text ? text.innerText : '',
+                depth: item.classList.contains(sel.replyClass) ? 1 : 0,
+                date: date ? date.innerText : null
+            });
+        }
+        return results;
+    }
+    """
+
+
+class ResourceBlocker:
+    """컨텍스트 단위 요청 차단 (route) 및 분류별 카운터"""
+
+    # 리소스 타입별 URL 확장자 (route 패턴을 좁혀 나머지 요청은 가로채지 않음)
+    TYPE_EXTENSIONS = {
+        'image': ['png', 'jpe?g', 'gif', 'webp', 'svg', 'ico', 'bmp', 'avif'],
+        'media': ['mp4', 'webm', 'm3u8', 'ts', 'mp3', 'm4a', 'ogg', 'wav'],
+        'font': ['woff2?', 'ttf', 'otf', 'eot'],
+        'stylesheet': ['css'],
+        'script': ['js']
+    }
+
+    def __init__(self, policy: ResourceBlockingConfig):
+        self.policy = policy
+        self.block_types = set(policy.block_resource_types)
+        self.allow_types = set(policy.allow_resource_types)
+        # 분류별 차단 요청 수
+        self.blocked: Dict[str, int] = {}
+        # 리소스 타입별 실제 전송 요청 수/바이트 (Content-Length 기준)
+        self.transferred: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def _match_domain(host: str, domains: List[str]) -> Optional[str]:
+        """호스트가 도메인 목록(하위 도메인 포함)에 해당하면 해당 항목 반환"""
+        for domain in domains:
+            if host == domain or host.endswith('.' + domain):
+                return domain
+        return None
+
+    def classify(self, url: str, resource_type: str) -> Optional[str]:
+        """차단 대상이면 분류명, 허용이면 None"""
+        host = urlparse(url).hostname or ''
+
+        if self._match_domain(host, self.policy.allow_domains):
+            return None
+        domain = self._match_domain(host, self.policy.block_domains)
+        if domain:
+            return f"domain:{domain}"
+        if self.allow_types and resource_type not in self.allow_types:
+            return f"type:{resource_type}"
+        if resource_type in self.block_types:
+            return f"type:{resource_type}"
+        return None
+
+    def route_pattern(self) -> Optional[Union[str, re.Pattern]]:
+        """route에 등록할 URL 패턴 - 차단 도메인 또는 차단 타입 확장자
+
+        allow_resource_types를 쓰거나 확장자로 알 수 없는 타입을 차단하면 전체('**/*')
+        """
+        if self.allow_types or any(t not in self.TYPE_EXTENSIONS for t in self.block_types):
+            return '**/*'
+        parts = []
+        if self.policy.block_domains:
+            domains = '|'.join(re.escape(d) for d in self.policy.block_domains)
+            parts.append(rf'^[a-z]+://([^/?#]*\.)?({domains})(:\d+)?([/?#]|$)')
+        extensions = [ext for t in sorted(self.block_types) for ext in self.TYPE_EXTENSIONS[t]]
+        if extensions:
+            parts.append(rf'\.({"|".join(extensions)})([?#]|$)')
+        if not parts:
+            return None
+        return re.compile('|'.join(parts), re.IGNORECASE)
+
+    def _handle_route(self, route):
+        # 패턴에 걸린 요청도 실제 타입/허용 도메인 기준으로 다시 판단
+        request = route.request
+        category = self.classify(request.url, request.resource_type)
+        if category:
+            self.blocked[category] = self.blocked.get(category, 0) + 1
+            route.abort('blockedbyclient')
+        else:
+            route.continue_()
+
+    def _on_response(self, response):
+        resource_type = response.request.resource_type
+        stats = self.transferred.setdefault(resource_type, {'requests': 0, 'bytes': 0})
+        stats['requests'] += 1
+        try:
+            stats['bytes'] += int(response.headers.get('content-length', 0))
+        except ValueError:
+            pass
+
+    def attach(self, context):
+        """컨텍스트에 차단 정책 적용"""
+        if not self.policy.enabled:
+            return
+        pattern = self.route_pattern()
+        if pattern:
+            context.route(pattern, self._handle_route)
+        context.on('response', self._on_response)
+
+    def summary(self) -> str:
+        """로그용 요약 문자열"""
+        blocked_total = sum(self.blocked.values())
+        blocked = ', '.join(f"{k}={v}" for k, v in sorted(self.blocked.items(), key=lambda x: -x[1]))
+        transferred_bytes = sum(v['bytes'] for v in self.transferred.values())
+        return (f"차단 {blocked_total}건 ({blocked or '-'}), "
+                f"전송 {transferred_bytes / 1024 / 1024:.1f}MB")
+
+
+def record_retry(retry_state):
+    """tenacity before_sleep - 재시도를 크롤러 지표에 기록 (첫 인자가 크롤러인 메서드용)"""
+    crawler = retry_state.args[0] if retry_state.args else None
+    metrics = getattr(crawler, 'metrics', None)
+    if metrics is not None:
+        metrics.inc(f"retry_{retry_state.fn.__name__}")
+
+
+class IoCall(NamedTuple):
+    """흐름 제너레이터가 요청하는 크롤러 메서드 호출 (sync 크롤러는 바로 실행, async 크롤러는 await)"""
+    method: str
+    args: tuple
+    kwargs: dict
+
+
+def io(method: str, *args, **kwargs) -> IoCall:
+    """흐름에서 yield할 I/O 호출 (예: posts = yield io('search_keyword_in_cafe', cafe_id, keyword, page_num))"""
+    return IoCall(method, args, kwargs)
+
+
+# 흐름 제너레이터 타입 (yield: IoCall, send: 호출 결과)
+Flow = Generator[IoCall, Any, Any]
+
+
+class WaitStats:
+    """준비 대기 종류별 실제 대기 시간과 타임아웃 횟수"""
+
+    def __init__(self):
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, name: str, waited_ms: float, ready: bool):
+        stats = self.stats.setdefault(name, {'count': 0, 'total_ms': 0.0, 'timeouts': 0})
+        stats['count'] += 1
+        stats['total_ms'] += waited_ms
+        if not ready:
+            stats['timeouts'] += 1
+
+    def summary(self) -> str:
+        """로그용 요약 문자열 (종류별 평균 대기/타임아웃)"""
+        parts = []
+        for name, stats in sorted(self.stats.items()):
+            avg = stats['total_ms'] / stats['count']
+            parts.append(f"{name} {stats['count']}회 평균 {avg:.0f}ms (타임아웃 {stats['timeouts']})")
+        return ', '.join(parts) or '-'
+
+
+class CommentResponseCapture:
+    """컨텍스트 응답 중 게시글/댓글 API 응답을 게시글별로 보관 (comment_source=network)
+
+    게시글 로딩 중에 오는 응답이라 추출 시점보다 먼저 도착하므로 컨텍스트 단위로 받아 두고,
+    추출할 때 게시글 키로 꺼내 간다. 꺼내 가지 않은 게시글은 오래된 순으로 버린다.
+    """
+
+    MAX_ARTICLES = 32
+
+    def __init__(self):
+        self.responses: 'OrderedDict[ArticleKey, List[Tuple[int, Any]]]' = OrderedDict()
+
+    def attach(self, context):
+        context.on('response', self.on_response)
+
+    def on_response(self, response):
+        matched = match_api_url(response.url)
+        if not matched:
+            return
+        cafe_id, article_id, page = matched
+        key = ArticleKey(cafe_id, article_id)
+        self.responses.setdefault(key, []).append((page, response))
+        self.responses.move_to_end(key)
+        while len(self.responses) > self.MAX_ARTICLES:
+            self.responses.popitem(last=False)
+
+    def take(self, key: ArticleKey) -> List[Tuple[int, Any]]:
+        """게시글의 (댓글 페이지, 응답) 목록을 꺼냄"""
+        return self.responses.pop(key, [])
+
+
+def merge_comment_results(results: Dict[int, Dict[str, Any]]) -> Tuple[List[CommentRecord], set]:
+    """페이지별 API result의 댓글을 페이지 순서대로 파싱 (중복 제외) - (댓글, 댓글 ID 집합)"""
+    comments = []
+    seen_ids = set()
+    for page in sorted(results):
+        items = [item for item in comment_items(results[page]) if item.get('id') not in seen_ids]
+        seen_ids.update(item.get('id') for item in items)
+        comments.extend(parse_comment_items(items))
+    return comments, seen_ids
 
 
 class NaverCafeCrawler:
     """네이버 카페 크롤러 클래스"""
 
-    def __init__(self, config_path: str = "config.json", account_info: AccountConfig = None, group_name: str = None):
-        """초기화"""
+    # 화면이 있는 모드에서도 저장된 쿠키로 로그인을 생략할지 (headless는 항상 쿠키 우선)
+    prefer_saved_cookies = False
+
+    def __init__(
+        self,
+        config_path: str = "config.json",
+        account_info: AccountConfig = None,
+        group_name: str = None,
+        run_id: Optional[str] = None
+    ):
+        """초기화 (run_id: 작업 큐 모드에서 main()이 등록한 실행 ID)"""
         # 설정 로드 및 검증
         with open(config_path, 'r', encoding='utf-8') as f:
             config_dict = json.load(f)
@@ -185,13 +700,16 @@ class NaverCafeCrawler:
         self.group_name = group_name
 
         self.logger = self._setup_logger()
+        self.checkpoint = CrawlCheckpoint(Path(self.config.log_folder), self.group_name)
         self.collected_data: List[Dict[str, Any]] = []
+        self.result_sinks: List[ResultSink] = []
 
         # 브라우저 관련
         self.playwright = None
         self.browser: Browser = None
         self.context = None
         self.page: Page = None
+        self.tab_pages: List[Page] = []  # 게시글 병렬 로딩용 탭
 
         # 상수
         self.selectors = Selectors()
@@ -204,12 +722,62 @@ class NaverCafeCrawler:
         self.last_restart_time = time.time()
         self.restart_interval = 1800  # 30분 (초 단위) - 메모리 최적화를 위해 필요시 1200 (20분) 또는 1500 (25분)으로 조정 가능
         self.restart_count = 0
+        policy = self.config.memory_policy
+        self.memory_policy = MemoryPolicy(
+            page_heap_mb=policy.page_heap_mb,
+            renderer_rss_mb=policy.renderer_rss_mb,
+            process_rss_mb=policy.process_rss_mb,
+            browser_restart_after=policy.browser_restart_after,
+            max_age_seconds=policy.max_age_seconds,
+            unmeasured_max_age_seconds=self.restart_interval
+        )
 
-        # 중복 URL 체크용
-        self.existing_urls = set()
+        # 중복 URL 체크용 (실행/주차 간 공유되는 SQLite 인덱스)
+        self.article_index: Optional[ArticleIndex] = None
 
         # CDP 연결 모드 여부
         self.cdp_mode = False
+        # 크롤러가 만든 컨텍스트인지 (CDP 기본 컨텍스트는 닫을 수 없음)
+        self.owns_context = True
+        # 재시작 때 미리 이동해 둔 (페이지, URL, 시작 시각, 응답)
+        self.pending_navigation: Optional[Tuple[Page, str, float, Any]] = None
+
+        # 직전에 게시글 프레임을 찾은 위치 (main: 최상위 문서 / iframe: 게시글 iframe)
+        self.article_frame_mode: Optional[str] = None
+
+        # 댓글 API 응답 캡처 (comment_source=network)
+        self.comment_capture = CommentResponseCapture()
+
+        # 준비 대기 통계 (고정 대기 대신 실제 신호를 기다린 시간)
+        self.wait_stats = WaitStats()
+
+        # 단계별 소요 시간/횟수 지표 (log_folder/metrics_<그룹>.json)
+        self.metrics = CrawlMetrics(group_name)
+
+        # 선택적 프로파일링 (cProfile / tracemalloc / Playwright 트레이싱)
+        profiling = self.config.profiling
+        self.profiler = CrawlProfiler(
+            Path(self.config.log_folder),
+            group_name,
+            cprofile=profiling.cprofile,
+            tracemalloc_frames=profiling.tracemalloc_frames if profiling.tracemalloc else 0,
+            trace_articles=profiling.trace_articles,
+            trace_after_articles=profiling.trace_after_articles
+        )
+
+        # 요청 간격 제어 (검색 페이지/게시글/HTTP 요청 공통)
+        self.rate_controller = self._create_rate_controller()
+
+        # 네트워크 리소스 차단 (모든 컨텍스트에 적용)
+        self.resource_blocker = ResourceBlocker(self.config.resource_blocking)
+
+        # HTTP 수집기 (fetch_engine == 'http'일 때만 사용)
+        self.http_fetcher: Optional[NaverCafeHttpFetcher] = None
+
+        # 작업 큐 (scheduler == 'queue'일 때만 사용)
+        self.run_id = run_id
+        self.work_queue: Optional[WorkQueue] = None
+        self.work_unit: Optional[WorkUnit] = None
 
     def _setup_logger(self) -> logging.Logger:
         """로거 설정"""
@@ -283,6 +851,82 @@ class NaverCafeCrawler:
         """밀리초 단위 대기"""
         time.sleep(milliseconds / 1000.0)
 
+    def _create_rate_controller(self) -> AimdRateController:
+        """계정 rate limit 기준 요청 간격 제어기 (초기 간격은 기존 페이지 간 평균 대기)"""
+        policy = self.config.rate_control
+        floor_ms = policy.floor_ms if policy.floor_ms is not None else self.account_info.rate_limit_min_ms
+        initial_ms = self.wait_times.BETWEEN_PAGES + (
+            self.account_info.rate_limit_min_ms + self.account_info.rate_limit_max_ms
+        ) / 2
+        return AimdRateController(
+            initial_delay_ms=initial_ms,
+            floor_ms=floor_ms,
+            ceiling_ms=policy.ceiling_ms,
+            additive_step=policy.additive_step,
+            backoff_factor=policy.backoff_factor,
+            latency_threshold_ms=policy.latency_threshold_ms,
+            block_cooldown_ms=policy.block_cooldown_ms,
+            adaptive=policy.enabled
+        )
+
+    def _pace(self):
+        """다음 요청 전 대기 (요청 간격 제어기 기준)"""
+        wait = self.rate_controller.reserve()
+        self.metrics.observe('rate_limit_sleep', max(wait, 0))
+        if wait > 0:
+            time.sleep(wait)
+
+    def _is_blocked(self, url: str, status: Optional[int]) -> bool:
+        """로그인/보안 확인 페이지로 이동했거나 403/429 응답이면 차단 신호"""
+        if status in self.constants.BLOCK_STATUS_CODES:
+            return True
+        return any(pattern in (url or '') for pattern in self.constants.BLOCK_URL_PATTERNS)
+
+    def _record_navigation(self, page: Page, response, started: float):
+        """이동 결과를 요청 간격 제어기에 반영"""
+        status = response.status if response else None
+        blocked = self._is_blocked(page.url, status)
+        elapsed = time.time() - started
+        self.metrics.observe('navigate', elapsed)
+        if blocked:
+            self.metrics.inc('blocked')
+            self.logger.warning(f"차단 신호 감지 (상태 {status}, {page.url}), 요청 간격 최대로")
+        self.rate_controller.record(
+            elapsed * 1000,
+            ok=status is None or status < 500,
+            blocked=blocked
+        )
+
+    def _record_navigation_error(self, started: float):
+        """이동 실패(타임아웃 등)를 요청 간격 제어기와 지표에 반영"""
+        elapsed = time.time() - started
+        self.metrics.observe('navigate', elapsed)
+        self.metrics.inc('navigate_error')
+        self.rate_controller.record(elapsed * 1000, ok=False)
+
+    def _navigate(self, page: Page, url: str, wait_until: str = 'domcontentloaded'):
+        """요청 간격을 지켜 페이지 이동 후 결과 기록 (재시작 때 미리 이동해 둔 URL이면 로딩만 대기)"""
+        pending, self.pending_navigation = self.pending_navigation, None
+        if pending and pending[0] is page and pending[1] == url:
+            _, _, started, response = pending
+            try:
+                page.wait_for_load_state(wait_until, timeout=self.timeouts.PAGE_LOAD)
+            except Exception:
+                self._record_navigation_error(started)
+                raise
+            self._record_navigation(page, response, started)
+            return response
+
+        self._pace()
+        started = time.time()
+        try:
+            response = page.goto(url, wait_until=wait_until, timeout=self.timeouts.PAGE_LOAD)
+        except Exception:
+            self._record_navigation_error(started)
+            raise
+        self._record_navigation(page, response, started)
+        return response
+
     def _wait_for_element(self, frame: FrameLike, selector: str, timeout: int = None) -> bool:
         """요소가 나타날 때까지 대기"""
         try:
@@ -292,28 +936,125 @@ class NaverCafeCrawler:
         except PlaywrightTimeoutError:
             return False
 
-    def _find_element_with_selectors(
-        self,
-        frame: FrameLike,
-        selectors: tuple,
-        description: str = "요소",
-        wait: bool = True
-    ) -> Optional[Any]:
-        """여러 선택자로 요소 찾기"""
-        for selector in selectors:
-            if wait:
-                self._wait_for_element(frame, selector, timeout=500)
-
-            elem = frame.locator(selector).first
-            if elem.count() > 0:
-                self.logger.debug(f"{description} 발견: {selector}")
-                return elem
-        return None
+    @staticmethod
+    def _page_of(frame: FrameLike) -> Page:
+        """프레임이 속한 페이지 (페이지면 그대로)"""
+        return getattr(frame, 'page', frame)
+
+    def _poll_ready(self, page: Page, name: str, condition, timeout_ms: int) -> bool:
+        """condition()이 참이 될 때까지 READY_POLL 간격으로 확인 (이벤트 처리는 계속됨)"""
+        started = time.time()
+        deadline = started + timeout_ms / 1000
+        ready = False
+        while True:
+            try:
+                ready = bool(condition())
+            except Exception:
+                ready = False
+            if ready or time.time() >= deadline:
+                break
+            page.wait_for_timeout(self.wait_times.READY_POLL)
+        self._record_wait(name, started, ready)
+        return ready
+
+    def _record_wait(self, name: str, started: float, ready: bool):
+        """준비 대기 결과를 대기 통계와 지표에 기록"""
+        waited = time.time() - started
+        self.wait_stats.record(name, waited * 1000, ready)
+        self.metrics.observe(f"wait_{name}", waited)
+        if not ready:
+            self.metrics.inc(f"wait_timeout_{name}")
+
+    def _wait_dom_settled(self, frame: FrameLike, name: str = 'dom_settled') -> bool:
+        """DOM 변경이 DOM_QUIET 동안 멈출 때까지 대기 (MutationObserver, DOM_SETTLE 초과 시 진행)"""
+        started = time.time()
+        try:
+            settled = bool(frame.evaluate(Scripts.WAIT_DOM_SETTLED, self._dom_settle_args()))
+        except Exception:
+            settled = False
+        self._record_wait(name, started, settled)
+        return settled
+
+    def _dom_settle_args(self) -> Dict[str, Any]:
+        """Scripts.WAIT_DOM_SETTLED 인자"""
+        return {'root': 'body', 'quietMs': self.wait_times.DOM_QUIET, 'timeoutMs': self.timeouts.DOM_SETTLE}
+
+    def _is_comment_response(self, url: str) -> bool:
+        return all(marker in url for marker in self.constants.COMMENT_API_MARKERS)
+
+    def _canonical_article_key(self, url: str, cafe_id: Optional[str] = None) -> Optional[ArticleKey]:
+        """URL 변형을 (cafe_id, article_id) 정규화 키로 변환"""
+        return ArticleKey.from_url(url, cafe_id)
 
     def _extract_article_id(self, url: str) -> Optional[str]:
         """URL에서 게시글 ID 추출"""
-        match = re.search(r'/articles/(\d+)', url)
-        return match.group(1) if match else None
+        article_key = self._canonical_article_key(url)
+        return article_key.article_id if article_key else None
+
+    def _article_script_args(self) -> Dict[str, Any]:
+        """Scripts.EXTRACT_ARTICLE 인자"""
+        return {
+            'title': self.selectors.TITLE,
+            'author': self.selectors.AUTHOR,
+            'date': self.selectors.DATE,
+            'content': self.selectors.CONTENT,
+            'likes': list(self.selectors.LIKES)
+        }
+
+    def _link_script_args(self) -> Dict[str, Any]:
+        """Scripts.EXTRACT_ARTICLE_LINKS 인자"""
+        return {
+            'links': list(self.selectors.ARTICLE_LINKS),
+            'row': self.selectors.LIST_ROW,
+            'commentCount': self.selectors.LIST_COMMENT_COUNT,
+            'date': self.selectors.LIST_DATE
+        }
+
+    def _comment_script_args(self) -> Dict[str, Any]:
+        """Scripts.EXTRACT_COMMENTS 인자"""
+        return {
+            'items': list(self.selectors.COMMENT_ITEMS),
+            'author': self.selectors.COMMENT_AUTHOR,
+            'text': self.selectors.COMMENT_TEXT,
+            'date': self.selectors.COMMENT_DATE,
+            'replyClass': self.selectors.COMMENT_REPLY_CLASS
+        }
+
+    def _extract_article_record(self, frame: FrameLike) -> ArticleRecord:
+        """게시글 기본 정보 수집 (제목/작성자/날짜/본문/좋아요를 evaluate 1회로)"""
+        return self._parse_article_record(frame.evaluate(Scripts.EXTRACT_ARTICLE, self._article_script_args()))
+
+    def _parse_article_record(self, raw: Dict[str, Any]) -> ArticleRecord:
+        """EXTRACT_ARTICLE 결과를 ArticleRecord로 변환"""
+        # 숫자가 없으면 0으로
+        likes = re.sub(r'\D', '', raw.get('likes') or '') or "0"
+
+        return ArticleRecord(
+            title=self._normalize_text(raw.get('title')),
+            author=(raw.get('author') or '').strip(),
+            date=(raw.get('date') or '').strip(),
+            content=self._normalize_text(raw.get('content')),
+            likes=likes
+        )
+
+    def _collect_article_links(self, frame: FrameLike) -> List[Dict[str, Any]]:
+        """검색 결과 게시글 링크와 목록 정보(제목/댓글 수/날짜)를 evaluate 1회로 수집"""
+        return self._parse_article_links(frame.evaluate(Scripts.EXTRACT_ARTICLE_LINKS, self._link_script_args()))
+
+    def _parse_article_links(self, raw_links: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """EXTRACT_ARTICLE_LINKS 결과 정규화"""
+        links = []
+        for raw in raw_links:
+            comment_count = re.sub(r'\D', '', raw.get('commentCount') or '')
+            links.append({
+                'url': raw['url'],
+                'title': self._normalize_text(raw.get('title')),
+                'comment_count': int(comment_count) if comment_count else None,
+                'list_date': (raw.get('date') or '').strip()
+            })
+
+        self.logger.debug(f"{len(links)}개 게시글 발견")
+        return links
 
     def _find_iframe(self, patterns: List[str], frame_name: str = None) -> Optional[Frame]:
         """iframe 찾기"""
@@ -359,71 +1100,108 @@ class NaverCafeCrawler:
 
         return None
 
+    def _extract_comment_records(self, frame: FrameLike) -> List[CommentRecord]:
+        """렌더링된 댓글 전체를 evaluate 1회로 수집"""
+        return self._parse_comment_records(frame.evaluate(Scripts.EXTRACT_COMMENTS, self._comment_script_args()))
+
+    def _parse_comment_records(self, raw_comments: List[Dict[str, Any]]) -> List[CommentRecord]:
+        """EXTRACT_COMMENTS 결과를 CommentRecord 목록으로 변환 (빈 댓글 제외)"""
+        comments = []
+        for raw in raw_comments:
+            text = self._normalize_text(raw.get('text'))
+            if not text:
+                continue
+            comments.append(CommentRecord(
+                author=(raw.get('author') or '').strip() or "익명",
+                text=text,
+                depth=raw.get('depth', 0),
+                date=(raw.get('date') or '').strip() or None
+            ))
+
+        self.logger.debug(f"댓글 {len(raw_comments)}개 중 {len(comments)}개 유효")
+        return comments
+
     @retry(
         stop=stop_after_attempt(RetryConfig.MAX_ATTEMPTS),
         wait=wait_exponential(min=RetryConfig.MIN_WAIT, max=RetryConfig.MAX_WAIT),
         retry=retry_if_exception_type((PlaywrightTimeoutError, Exception)),
+        before_sleep=record_retry,
         reraise=True
     )
-    def _collect_comments(self, article_frame: FrameLike, url: str) -> List[str]:
-        """댓글 수집 (재시도 포함)"""
-        comments = []
+    def _collect_comments(
+        self,
+        article_frame: FrameLike,
+        url: str,
+        expected_count: Optional[int] = None
+    ) -> List[CommentRecord]:
+        """댓글 수집 (재시도 포함)
+
+        expected_count: 검색 목록의 댓글 수 (0이면 대기 없이 종료)
+        댓글 버튼 클릭(없으면 스크롤) 후 댓글 API 응답 또는 댓글 요소가 나타나면
+        DOM 변경이 멈출 때까지 기다렸다가 추출한다.
+        대기/추출 오류는 재시도하지 않는다 (재시도하면 토글인 댓글 버튼을 다시 눌러 목록이 닫힘).
+        """
+        if expected_count == 0:
+            self.logger.debug(f"목록상 댓글 0개, 댓글 수집 생략: {url}")
+            return []
 
-        # 댓글 버튼 클릭
-        try:
-            self.logger.debug("댓글 버튼 클릭 시도")
-            comment_button = self._find_element_with_selectors(
-                article_frame, self.selectors.COMMENT_BUTTON, "댓글 버튼", wait=True
-            )
+        page = self._page_of(article_frame)
+        comment_responses = []
 
-            if comment_button:
-                comment_button.click()
-                self._wait(self.wait_times.AFTER_COMMENT_CLICK)
-                self.logger.debug("댓글 버튼 클릭 완료")
-            else:
-                self.logger.debug("댓글 버튼 없음, 스크롤 시도")
-                for _ in range(self.constants.MAX_SCROLL_ATTEMPTS):
-                    article_frame.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                    self._wait(self.wait_times.SCROLL_INTERVAL)
-        except Exception as e:
-            self.logger.debug(f"댓글 버튼 클릭 실패: {e}, 스크롤로 대체")
-            for _ in range(self.constants.MAX_SCROLL_ATTEMPTS):
-                article_frame.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                self._wait(self.wait_times.SCROLL_INTERVAL)
+        def on_response(response):
+            if self._is_comment_response(response.url):
+                comment_responses.append(response.url)
 
-        # 댓글 수집
+        page.on('response', on_response)
         try:
-            # 댓글 로딩 대기
-            if not self._wait_for_element(article_frame, self.selectors.COMMENT_ITEMS[0], timeout=self.timeouts.COMMENT_LOAD):
-                self.logger.debug(f"댓글 없음: {url}")
-                return comments
-
-            comment_count = article_frame.locator(self.selectors.COMMENT_ITEMS[0]).count()
-            self.logger.debug(f"댓글 {comment_count}개 수집 시작")
-
-            for i in range(comment_count):
-                try:
-                    comment_elem = article_frame.locator(self.selectors.COMMENT_ITEMS[0]).nth(i)
-
-                    author_elem = comment_elem.locator(self.selectors.COMMENT_AUTHOR).first
-                    author = author_elem.inner_text().strip() if author_elem.count() > 0 else "익명"
-
-                    text_elem = comment_elem.locator(self.selectors.COMMENT_TEXT).first
-                    text = self._normalize_text(text_elem.inner_text()) if text_elem.count() > 0 else ""
-
-                    if text:
-                        comments.append(f"{author} : {text}")
-
-                except Exception as e:
-                    self.logger.debug(f"댓글 {i} 수집 실패: {e}")
-                    continue
+            # 댓글 버튼 클릭 (없으면 스크롤)
+            button = article_frame.locator(', '.join(self.selectors.COMMENT_BUTTON)).first
+            clicked = False
+            try:
+                if self._poll_ready(page, 'comment_button', lambda: button.count() > 0, self.timeouts.COMMENT_LOAD // 6):
+                    button.click(timeout=self.timeouts.ELEMENT_WAIT)
+                    clicked = True
+                    self.logger.debug("댓글 버튼 클릭 완료")
+            except Exception as e:
+                self.logger.debug(f"댓글 버튼 클릭 실패: {e}, 스크롤로 대체")
+            if not clicked:
+                article_frame.evaluate('window.scrollTo(0, document.body.scrollHeight)')
 
-            self.logger.debug(f"댓글 {len(comments)}개 수집 완료")
+            try:
+                # 댓글 API 응답 또는 댓글 요소 대기
+                items = article_frame.locator(self.selectors.COMMENT_ITEMS[0])
+                if not self._poll_ready(
+                    page, 'comment_ready',
+                    lambda: bool(comment_responses) or items.count() > 0,
+                    self.timeouts.COMMENT_LOAD
+                ):
+                    self.logger.debug(f"댓글 없음: {url}")
+                    return []
+
+                # 렌더링이 끝날 때까지 (답글/추가 페이지 포함)
+                self._wait_dom_settled(article_frame, 'comment_settled')
+                if not clicked:
+                    self._scroll_for_more_comments(page, article_frame, items)
+
+                comments = self._extract_comment_records(article_frame)
+                self.logger.debug(f"댓글 {len(comments)}개 수집 완료")
+                return comments
 
-        except Exception as e:
-            self.logger.debug(f"댓글 수집 실패: {e}")
+            except Exception as e:
+                self.logger.debug(f"댓글 수집 실패: {e}")
+                return []
 
-        return comments
+        finally:
+            page.remove_listener('response', on_response)
+
+    def _scroll_for_more_comments(self, page: Page, article_frame: FrameLike, items):
+        """스크롤로 지연 로딩되는 댓글 불러오기 (댓글 수가 더 늘지 않으면 중단)"""
+        count = items.count()
+        for _ in range(self.constants.MAX_SCROLL_ATTEMPTS):
+            article_frame.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+            if not self._poll_ready(page, 'comment_scroll', lambda: items.count() > count, self.wait_times.SCROLL_INTERVAL):
+                break
+            count = items.count()
 
     @contextmanager
     def browser_context(self):
@@ -441,26 +1219,26 @@ class NaverCafeCrawler:
         # 계정별 CDP 디버깅 포트
         debug_port = self.account_info.debug_port
 
-        # 화면 해상도 자동 감지
-        try:
-            screen_w = ctypes.windll.user32.GetSystemMetrics(0)
-            screen_h = ctypes.windll.user32.GetSystemMetrics(1)
-        except Exception:
-            screen_w, screen_h = 1920, 1080
-        win_w = screen_w // 2
-        win_h = screen_h // 2
-
         self.playwright = sync_playwright().start()
 
+        if self.config.headless:
+            # 서버 모드: 외부 Chrome 없이 바로 실행
+            self.cdp_mode = False
+            self._launch_browser()
+            self._open_context()
+            return
+
         # CDP 연결 시도 (Chrome Remote Debugging)
         try:
             self.browser = self.playwright.chromium.connect_over_cdp(f"http://localhost:{debug_port}")
             if self.browser.contexts:
                 self.context = self.browser.contexts[0]
                 self.page = self.context.pages[0] if self.context.pages else self.context.new_page()
+                self.owns_context = False
             else:
-                self.context = self.browser.new_context(viewport={'width': win_w, 'height': win_h})
+                self.context = self.browser.new_context(viewport=get_viewport(self.config))
                 self.page = self.context.new_page()
+                self.owns_context = True
             self.cdp_mode = True
             self.logger.info(f"Chrome CDP 연결 성공 (포트: {debug_port}, {self.account_info.naver_id})")
             print(f"\n[{self.group_name}] Chrome CDP 연결 성공 (포트: {debug_port})\n")
@@ -471,37 +1249,55 @@ class NaverCafeCrawler:
             self.logger.warning(f"CDP 연결 실패 ({e}), 일반 브라우저 실행")
             print(f"\n[{self.group_name}] CDP 연결 실패, 일반 브라우저로 실행\n")
 
+            self._launch_browser()
+            self._open_context()
+            return
+
+        self._setup_context(self.context)
+
+    def _launch_browser(self):
+        """Playwright 드라이버로 브라우저 실행 (드라이버는 이미 시작된 상태)"""
+        self.browser = self.playwright.chromium.launch(
+            **get_launch_options(self.config, self.account_info.window_position)
+        )
+        if self.config.headless:
+            viewport = get_viewport(self.config)
+            self.logger.info(f"headless 브라우저 시작됨 ({viewport['width']}x{viewport['height']}, {self.account_info.naver_id})")
+        else:
             side = '좌측' if self.account_info.window_position == 'left' else '우측'
-            window_position = '--window-position=0,0' if self.account_info.window_position == 'left' else f'--window-position={win_w},0'
-
-            self.browser = self.playwright.chromium.launch(
-                headless=False,
-                args=[
-                    window_position,
-                    f'--window-size={win_w},{win_h}',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-software-rasterizer',
-                    '--disable-extensions',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-features=TranslateUI',
-                    '--disable-features=Translate',
-                    '--js-flags=--expose-gc'
-                ]
-            )
-            self.context = self.browser.new_context(
-                viewport={'width': win_w, 'height': win_h},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            self.page = self.context.new_page()
-            Stealth().apply_stealth_sync(self.page)
             self.logger.info(f"브라우저 시작됨 ({side}상단, {self.account_info.naver_id})")
 
+    def _open_context(self, storage_state: Optional[Dict[str, Any]] = None):
+        """크롤러 전용 컨텍스트/페이지 생성 (storage_state: 쿠키 + localStorage 스냅샷)"""
+        self.context = self.browser.new_context(
+            **get_context_options(self.config),
+            storage_state=storage_state
+        )
+        self.page = self.context.new_page()
+        if not self.cdp_mode:
+            Stealth().apply_stealth_sync(self.page)
+        self.owns_context = True
+        self._setup_context(self.context)
+
+    def _setup_context(self, context):
+        """크롤러가 사용하는 컨텍스트 공통 설정"""
+        self.resource_blocker.attach(context)
+        self._attach_comment_capture(context)
+
+    def _attach_comment_capture(self, context):
+        if self.config.comment_source == 'network':
+            self.comment_capture.attach(context)
+
     def _close_browser(self):
         """브라우저 종료 (메모리 정리 포함)"""
+        self._stop_tracing()
         try:
+            # 게시글 탭 정리 (CDP 모드에서도 추가로 연 탭은 닫음)
+            self._close_tab_pages()
+
+            if self.resource_blocker.policy.enabled:
+                self.logger.info(f"리소스 차단 통계: {self.resource_blocker.summary()}")
+
             if self.cdp_mode:
                 # CDP 모드: Chrome을 닫지 않고 연결만 해제
                 if self.playwright:
@@ -544,39 +1340,104 @@ class NaverCafeCrawler:
         """쿠키 파일 경로 반환"""
         return Path(self.config.log_folder) / f"cookies_{self.group_name}.json"
 
+    def _get_storage_state_path(self) -> Path:
+        """storage_state 스냅샷 경로 (쿠키 + localStorage, 빠른 재시작용)"""
+        return Path(self.config.log_folder) / f"storage_state_{self.group_name}.json"
+
     def _save_cookies(self):
-        """브라우저 쿠키 저장"""
+        """브라우저 쿠키와 storage_state 스냅샷 저장"""
         try:
-            cookies = self.context.cookies()
-            cookie_path = self._get_cookie_path()
-            with open(cookie_path, 'w', encoding='utf-8') as f:
-                json.dump(cookies, f)
-            self.logger.info(f"쿠키 저장 완료: {cookie_path}")
+            state = self.context.storage_state()
+            self._write_cookie_file(state['cookies'])
+            self._write_storage_state(state)
         except Exception as e:
             self.logger.warning(f"쿠키 저장 실패: {e}")
 
-    def _load_cookies(self) -> bool:
-        """저장된 쿠키 로드"""
+    def _write_storage_state(self, state: Dict[str, Any]):
+        """storage_state 스냅샷 원자적 저장 (임시 파일 → 교체)"""
+        path = self._get_storage_state_path()
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+    def _read_storage_state(self) -> Optional[Dict[str, Any]]:
+        """저장된 storage_state 스냅샷 (없거나 인증 쿠키가 만료되면 None)"""
+        path = self._get_storage_state_path()
         try:
-            cookie_path = self._get_cookie_path()
-            if not cookie_path.exists():
-                self.logger.info("저장된 쿠키 없음")
-                return False
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not self._has_valid_auth_cookies(state.get('cookies') or []):
+            return None
+        return state
 
+    def _snapshot_storage_state(self) -> Optional[Dict[str, Any]]:
+        """재시작용 storage_state - 현재 컨텍스트 우선, 실패 시 저장된 스냅샷"""
+        try:
+            state = self.context.storage_state()
+            if self._has_valid_auth_cookies(state.get('cookies') or []):
+                self._write_storage_state(state)
+                return state
+        except Exception as e:
+            self.logger.debug(f"storage_state 스냅샷 실패: {e}")
+        return self._read_storage_state()
+
+    def _write_cookie_file(self, cookies: List[Dict[str, Any]]):
+        """쿠키 파일 저장"""
+        cookie_path = self._get_cookie_path()
+        with open(cookie_path, 'w', encoding='utf-8') as f:
+            json.dump(cookies, f)
+        self.logger.info(f"쿠키 저장 완료: {cookie_path}")
+
+    def _read_cookie_file(self) -> List[Dict[str, Any]]:
+        """저장된 쿠키 파일 그대로 읽기 (없거나 깨졌으면 빈 목록)"""
+        cookie_path = self._get_cookie_path()
+        if not cookie_path.exists():
+            return []
+        try:
             with open(cookie_path, 'r', encoding='utf-8') as f:
                 cookies = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"쿠키 파일 읽기 실패 ({cookie_path}): {e}")
+            return []
+        return cookies if isinstance(cookies, list) else []
+
+    def _read_valid_cookies(self) -> Optional[List[Dict[str, Any]]]:
+        """저장된 쿠키 파일 읽기 (없거나 인증 쿠키가 만료되면 None)"""
+        cookie_path = self._get_cookie_path()
+        if not cookie_path.exists():
+            self.logger.info("저장된 쿠키 없음")
+            return None
 
-            # 쿠키 만료 여부를 파일에서 직접 확인 (브라우저 접속 없음)
-            now = time.time()
-            auth_cookies = [c for c in cookies if c.get('name') in ('NID_AUT', 'NID_SES')]
-            if not auth_cookies:
-                self.logger.warning("인증 쿠키 없음 (NID_AUT/NID_SES)")
+        with open(cookie_path, 'r', encoding='utf-8') as f:
+            cookies = json.load(f)
+
+        if not self._has_valid_auth_cookies(cookies):
+            return None
+        return cookies
+
+    def _has_valid_auth_cookies(self, cookies: List[Dict[str, Any]]) -> bool:
+        """인증 쿠키(NID_AUT/NID_SES)가 있고 만료되지 않았는지 (브라우저 접속 없이 확인)"""
+        now = time.time()
+        auth_cookies = [c for c in cookies if c.get('name') in ('NID_AUT', 'NID_SES')]
+        if not auth_cookies:
+            self.logger.warning("인증 쿠키 없음 (NID_AUT/NID_SES)")
+            return False
+        for c in auth_cookies:
+            expires = c.get('expires', 0)
+            if expires and expires < now:
+                self.logger.warning(f"쿠키 만료됨: {c['name']} (만료: {datetime.fromtimestamp(expires)})")
+                return False
+        return True
+
+    def _load_cookies(self) -> bool:
+        """저장된 쿠키 로드"""
+        try:
+            cookies = self._read_valid_cookies()
+            if not cookies:
                 return False
-            for c in auth_cookies:
-                expires = c.get('expires', 0)
-                if expires and expires < now:
-                    self.logger.warning(f"쿠키 만료됨: {c['name']} (만료: {datetime.fromtimestamp(expires)})")
-                    return False
 
             self.context.add_cookies(cookies)
             self.logger.info("쿠키 로드 완료 (유효)")
@@ -586,16 +1447,24 @@ class NaverCafeCrawler:
             self.logger.warning(f"쿠키 로드 실패: {e}")
             return False
 
-    def _load_existing_urls(self):
-        """엑셀 파일에서 기존 URL 로드"""
+    def _open_article_index(self):
+        """수집 이력 인덱스 열기"""
+        if self.article_index is None:
+            db_path = Path(self.config.output_folder) / self.config.dedup_db
+            self.article_index = ArticleIndex(db_path)
+            self.logger.info(f"수집 이력 인덱스 사용: {db_path} ({len(self.article_index)}개)")
+
+        self._import_excel_urls()
+
+    def _import_excel_urls(self):
+        """이번 주 엑셀 파일의 URL을 인덱스로 가져오기 (파일별 최초 1회)"""
         try:
             output_folder = Path(self.config.output_folder)
             filename = self._get_output_filename()
             filepath = output_folder / filename
 
-            if not filepath.exists():
-                self.logger.info("기존 엑셀 파일 없음, 처음부터 시작")
-                self.existing_urls = set()
+            meta_name = f"excel_imported_keys:{filename}"
+            if not filepath.exists() or self.article_index.get_meta(meta_name):
                 return
 
             wb = load_workbook(filepath, read_only=True)
@@ -609,78 +1478,238 @@ class NaverCafeCrawler:
                     break
 
             if url_col:
-                # 모든 URL 수집 (헤더 제외)
-                urls = set()
+                # 모든 URL을 정규화 키로 수집 (헤더 제외)
+                keys = set()
                 for row in ws.iter_rows(min_row=2, min_col=url_col, max_col=url_col):
-                    url = row[0].value
-                    if url:
-                        urls.add(url)
+                    article_key = self._canonical_article_key(row[0].value or '')
+                    if article_key:
+                        keys.add(str(article_key))
 
-                self.existing_urls = urls
-                self.logger.info(f"기존 URL {len(urls)}개 로드 완료")
+                self.article_index.add_many(keys)
+                self.logger.info(f"기존 엑셀 게시글 {len(keys)}개 인덱스로 가져오기 완료")
             else:
                 self.logger.warning("엑셀 파일에 URL 컬럼 없음")
-                self.existing_urls = set()
 
             wb.close()
+            self.article_index.set_meta(meta_name, datetime.now().isoformat(timespec='seconds'))
 
         except Exception as e:
-            self.logger.warning(f"기존 URL 로드 실패: {e}")
-            self.existing_urls = set()
+            self.logger.warning(f"기존 엑셀 URL 가져오기 실패: {e}")
 
     def _should_restart_browser(self) -> bool:
         """브라우저 재시작 필요 여부 확인"""
         elapsed = time.time() - self.last_restart_time
         return elapsed >= self.restart_interval
 
-    def _restart_browser_if_needed(self):
-        """필요시 브라우저 재시작"""
-        if self.cdp_mode:
-            # CDP 모드에서는 Chrome을 외부에서 관리하므로 재시작 생략
-            return False
+    def _restart_browser_if_needed(self, next_url: Optional[str] = None):
+        """필요시 탭/컨텍스트/브라우저 재생성 (memory_policy 비활성 시 30분 주기 브라우저 재시작)
 
-        if not self._should_restart_browser():
+        next_url: 재생성 직후 미리 이동해 둘 다음 대상 (이전 컨텍스트 정리와 겹침)
+        """
+        if not self.config.memory_policy.enabled:
+            if self.cdp_mode or not self._should_restart_browser():
+                # CDP 모드에서는 Chrome을 외부에서 관리하므로 재시작 생략
+                return False
+            self._restart_browser(next_url)
+            return True
+
+        sample = self._sample_memory()
+        action = self.memory_policy.decide(sample, age_seconds=time.time() - self.last_restart_time)
+        self.logger.debug(f"메모리: {sample.describe()}")
+        if not action:
             return False
+        if action == RECYCLE_BROWSER and self.cdp_mode:
+            # CDP 모드는 Chrome을 외부에서 관리하므로 컨텍스트까지만
+            action = RECYCLE_CONTEXT
+
+        self.logger.info(f"메모리 기준 초과 ({sample.describe()}) → {action} 재생성")
+        if action == RECYCLE_PAGE:
+            self._recycle_pages(next_url)
+        elif action == RECYCLE_CONTEXT:
+            self._recycle_context(next_url)
+        else:
+            self._restart_browser(next_url)
+        self.memory_policy.record(action)
+        self.metrics.inc(f"recycle_{action}")
+        return True
 
-        elapsed_minutes = int((time.time() - self.last_restart_time) / 60)
-        self.restart_count += 1
+    def _sample_memory(self) -> MemorySample:
+        """탭 JS 힙(최댓값), 렌더러 RSS 합계, 파이썬 프로세스 RSS 측정"""
+        heaps = [heap for heap in (self._page_heap_mb(page) for page in [self.page] + self.tab_pages) if heap is not None]
+        return MemorySample(max(heaps) if heaps else None, self._renderer_rss_mb(), process_rss_mb())
 
-        self.logger.info("="*80)
-        self.logger.info(f"브라우저 재시작 #{self.restart_count} (경과: {elapsed_minutes}분)")
-        self.logger.info("="*80)
-        print(f"\n{'='*80}")
-        print(f"🔄 [{self.group_name}] 브라우저 재시작 #{self.restart_count} (메모리 최적화)")
-        print(f"   경과 시간: {elapsed_minutes}분")
-        print(f"{'='*80}\n")
-
-        # 브라우저 종료
-        self._close_browser()
-        self._wait(2000)  # 2초 대기
-
-        # 브라우저 재시작
-        self._start_browser()
-
-        # 쿠키 로드 시도
-        cookie_loaded = self._load_cookies()
-
-        if not cookie_loaded:
-            # 쿠키 로드 실패 시 재로그인
-            self.logger.info("쿠키 로드 실패, 재로그인 필요")
-            print(f"[{self.group_name}] 재로그인 필요...\n")
-            if not self.login_naver():
-                raise Exception("재로그인 실패")
-            self._save_cookies()
-        else:
-            self.logger.info("쿠키로 로그인 생략")
-            print(f"[{self.group_name}] 쿠키 재사용 (로그인 생략)\n")
+    def _page_heap_mb(self, page: Page) -> Optional[float]:
+        try:
+            session = self.context.new_cdp_session(page)
+            try:
+                session.send('Performance.enable')
+                return js_heap_mb(session.send('Performance.getMetrics'))
+            finally:
+                session.detach()
+        except Exception as e:
+            self.logger.debug(f"JS 힙 측정 실패: {e}")
+            return None
+
+    def _renderer_rss_mb(self) -> Optional[float]:
+        try:
+            session = self.browser.new_browser_cdp_session()
+            try:
+                info = session.send('SystemInfo.getProcessInfo')
+            finally:
+                session.detach()
+        except Exception as e:
+            self.logger.debug(f"렌더러 프로세스 조회 실패: {e}")
+            return None
+        return rss_mb_of_pids(renderer_pids(info))
+
+    def _close_tab_pages(self):
+        for tab in self.tab_pages:
+            try:
+                tab.close()
+            except Exception:
+                pass
+        self.tab_pages = []
+
+    def _recycle_pages(self, next_url: Optional[str] = None):
+        """게시글 탭과 메인 페이지만 새로 생성 (컨텍스트/로그인 유지)"""
+        self._close_tab_pages()
+        old_page = self.page
+        self.page = self.context.new_page()
+        if not self.cdp_mode:
+            Stealth().apply_stealth_sync(self.page)
+        self._prenavigate(next_url)
+        try:
+            old_page.close()
+        except Exception:
+            pass
 
-        # 기존 URL 다시 로드
-        self._load_existing_urls()
+    def _recycle_context(self, next_url: Optional[str] = None):
+        """브라우저는 유지하고 컨텍스트만 storage_state 스냅샷으로 재생성 (재로그인 없음)
+
+        CDP 모드에서는 기본 컨텍스트를 닫을 수 없으므로 크롤러 전용 컨텍스트를 새로 만들어 옮겨 간다.
+        """
+        started = time.time()
+        self._stop_tracing()
+        state = self._snapshot_storage_state()
+        old_context, old_owned, old_tabs = self.context, self.owns_context, self.tab_pages
+        self.tab_pages = []
+
+        self._open_context(state)
+        self._restore_login(state)
+        self._prenavigate(next_url)
+
+        # 새 컨텍스트가 다음 페이지를 로딩하는 동안 이전 컨텍스트 정리
+        for tab in old_tabs:
+            try:
+                tab.close()
+            except Exception:
+                pass
+        if old_owned:
+            try:
+                old_context.close()
+            except Exception:
+                pass
+        gc.collect()
+
+        self._finish_restart('컨텍스트 재생성', started)
+
+    def _restart_browser(self, next_url: Optional[str] = None):
+        """브라우저 재시작 - Playwright 드라이버는 유지하고 storage_state 스냅샷으로 컨텍스트 복원"""
+        started = time.time()
+        self._stop_tracing()
+        state = self._snapshot_storage_state()
+
+        self._close_tab_pages()
+        try:
+            self.browser.close()
+        except Exception as e:
+            self.logger.warning(f"브라우저 종료 중 오류: {e}")
+        gc.collect()
 
-        # 타이머 리셋
+        self._launch_browser()
+        self._open_context(state)
+        self._restore_login(state)
+        self._prenavigate(next_url)
+
+        self._finish_restart('브라우저 재시작', started)
+
+    def _restore_login(self, state: Optional[Dict[str, Any]]):
+        """스냅샷이 없을 때 쿠키 파일로 복원 (재시작 중에는 로그인 창을 띄우지 않음)"""
+        if state is not None:
+            return
+        if not self._load_cookies():
+            self.logger.warning("로그인 스냅샷/쿠키 없음 - 재로그인 없이 계속 (차단 신호 시 간격 제어)")
+
+    def _prenavigate(self, url: Optional[str]):
+        """다음 이동 대상을 미리 요청 (commit까지만, _navigate에서 이어서 대기)"""
+        self.pending_navigation = None
+        if not url:
+            return
+        self._pace()
+        started = time.time()
+        try:
+            response = self.page.goto(url, wait_until='commit', timeout=self.timeouts.PAGE_LOAD)
+            self.pending_navigation = (self.page, url, started, response)
+        except Exception as e:
+            self._record_navigation_error(started)
+            self.logger.debug(f"사전 이동 실패 ({url}): {e}")
+
+    def _finish_restart(self, label: str, started: float):
+        self.metrics.observe('restart', time.time() - started)
+        self._init_http_fetcher()
+        self.restart_count += 1
         self.last_restart_time = time.time()
+        elapsed_ms = (time.time() - started) * 1000
+        self.logger.info(f"{label} #{self.restart_count} 완료 ({elapsed_ms:.0f}ms, 드라이버 유지)")
+        print(f"🔄 [{self.group_name}] {label} #{self.restart_count} ({elapsed_ms:.0f}ms)")
+        self._snapshot_python_memory(label)
 
-        return True
+    # ---- 프로파일링 ----
+
+    def _snapshot_python_memory(self, label: str):
+        """tracemalloc 스냅샷 저장 및 직전 스냅샷 대비 증가 상위 항목 기록"""
+        try:
+            result = self.profiler.snapshot_memory()
+        except Exception as e:
+            self.logger.warning(f"tracemalloc 스냅샷 실패: {e}")
+            return
+        if result:
+            path, growth = result
+            self.logger.info(f"tracemalloc 스냅샷 ({label}): {path}")
+            if growth:
+                self.logger.info(f"직전 스냅샷 대비 메모리 증가 상위:\n{growth}")
+
+    def _update_trace_window(self):
+        """처리한 게시글 수에 따라 Playwright 트레이싱 구간 시작/종료"""
+        action = self.profiler.trace_action()
+        if action == 'start':
+            self._start_tracing()
+        elif action == 'stop':
+            self._stop_tracing()
+
+    def _start_tracing(self):
+        path = self.profiler.trace_started()
+        try:
+            self.context.tracing.start(
+                title=f"{self.group_name} 게시글 {self.profiler.articles_seen + 1}~",
+                screenshots=self.config.profiling.trace_screenshots,
+                snapshots=True
+            )
+            self.logger.info(f"Playwright 트레이싱 시작 (게시글 {self.profiler.trace_articles}개): {path}")
+        except Exception as e:
+            self.profiler.trace_stopped()
+            self.logger.warning(f"Playwright 트레이싱 시작 실패: {e}")
+
+    def _stop_tracing(self):
+        """트레이싱 중이면 저장 (컨텍스트를 닫기 전에 호출, 구간 중간이면 거기까지만 저장)"""
+        if not self.profiler.tracing:
+            return
+        path = self.profiler.trace_stopped()
+        try:
+            self.context.tracing.stop(path=str(path))
+            self.logger.info(f"Playwright 트레이스 저장 (게시글 {self.profiler.articles_seen}개까지): {path}")
+        except Exception as e:
+            self.logger.warning(f"Playwright 트레이스 저장 실패: {e}")
 
     def login_naver(self) -> bool:
         """네이버 로그인"""
@@ -777,10 +1806,49 @@ class NaverCafeCrawler:
             self.logger.error(f"로그인 오류: {e}")
             return False
 
+    def _wait_for_search_frame(self) -> Optional[FrameLike]:
+        """검색 결과 링크가 있는 프레임 (LIST_LOAD 내에 나타나지 않으면 None)"""
+        links_selector = ', '.join(self.selectors.ARTICLE_LINKS)
+        found = []
+
+        def condition():
+            frame = self._find_iframe(['ArticleSearchList', 'menus']) or self.page
+            if frame.locator(links_selector).count() > 0:
+                found.append(frame)
+                return True
+            return False
+
+        self._poll_ready(self.page, 'search_links', condition, self.timeouts.LIST_LOAD)
+        return found[0] if found else None
+
+    def _cafe_url(self, url: str) -> str:
+        """정규 URL(cafe.naver.com)을 설정된 화면 주소로 변환 (출력/중복 체크는 정규 URL 유지)"""
+        base_url = self.config.cafe_base_url.rstrip('/')
+        if base_url == CAFE_BASE_URL or not url.startswith(CAFE_BASE_URL):
+            return url
+        return base_url + url[len(CAFE_BASE_URL):]
+
+    def _search_url(self, cafe_id: str, keyword: str, page_num: int) -> str:
+        """카페 내 검색 결과 URL"""
+        encoded_keyword = quote(keyword)
+        return self._cafe_url(f"{CAFE_BASE_URL}/f-e/cafes/{cafe_id}/menus/0?viewType=L&ta=ARTICLE_COMMENT&page={page_num}&q={encoded_keyword}&p=1d&size=50")
+
+    def _posts_from_links(self, links: List[Dict[str, Any]], cafe_id: str, keyword: str) -> List[Dict[str, Any]]:
+        """검색 결과 링크를 정규화 키/URL을 가진 게시글 후보로 변환"""
+        posts = []
+        for link in links:
+            article_key = self._canonical_article_key(link['url'], cafe_id)
+            if not article_key:
+                self.logger.debug(f"게시글 키 추출 실패, 건너뜀: {link['url']}")
+                continue
+            posts.append({**link, 'keyword': keyword, 'url': article_key.url, 'article_key': article_key})
+        return posts
+
     @retry(
         stop=stop_after_attempt(RetryConfig.MAX_ATTEMPTS),
         wait=wait_exponential(min=RetryConfig.MIN_WAIT, max=RetryConfig.MAX_WAIT),
         retry=retry_if_exception_type((PlaywrightTimeoutError,)),
+        before_sleep=record_retry,
         reraise=True
     )
     def search_keyword_in_cafe(self, cafe_id: str, keyword: str, page_num: int) -> List[Dict[str, Any]]:
@@ -790,50 +1858,18 @@ class NaverCafeCrawler:
         posts = []
 
         try:
-            encoded_keyword = quote(keyword)
-            search_url = f"https://cafe.naver.com/f-e/cafes/{cafe_id}/menus/0?viewType=L&ta=ARTICLE_COMMENT&page={page_num}&q={encoded_keyword}&p=1d&size=50"
-
-            self.page.goto(search_url, wait_until='domcontentloaded', timeout=self.timeouts.PAGE_LOAD)
-            self._wait(self.wait_times.AFTER_PAGE_LOAD)
+            search_url = self._search_url(cafe_id, keyword, page_num)
 
-            # 검색 결과 iframe 찾기
-            search_frame = self._find_iframe(['ArticleSearchList', 'menus'])
+            self._navigate(self.page, search_url)
 
+            # 검색 결과 프레임(iframe 우선, 없으면 메인 페이지)에 게시글 링크가 나타날 때까지 대기
+            search_frame = self._wait_for_search_frame()
             if not search_frame:
-                self.logger.debug("검색 iframe 미발견, 메인 페이지 사용")
-                search_frame = self.page
-
-            # 게시글 링크 찾기
-            link_elements = self._find_element_with_selectors(
-                search_frame, self.selectors.ARTICLE_LINKS, "게시글 링크"
-            )
-
-            if not link_elements:
                 self.logger.debug(f"'{keyword}' {page_num}페이지 결과 없음")
                 return posts
 
-            link_count = search_frame.locator(self.selectors.ARTICLE_LINKS[0]).count()
-            self.logger.debug(f"{link_count}개 게시글 발견")
-
-            # URL 수집
-            for i in range(link_count):
-                try:
-                    link = search_frame.locator(self.selectors.ARTICLE_LINKS[0]).nth(i)
-                    href = link.get_attribute('href')
-
-                    if href and '/articles/' in href:
-                        if href.startswith('http'):
-                            post_url = href
-                        elif href.startswith('/'):
-                            post_url = f"https://cafe.naver.com{href}"
-                        else:
-                            post_url = f"https://cafe.naver.com/{href}"
-
-                        posts.append({'keyword': keyword, 'url': post_url})
-
-                except Exception as e:
-                    self.logger.debug(f"URL 수집 오류 (인덱스 {i}): {e}")
-                    continue
+            # URL 및 목록 정보 일괄 수집 (정규화 키/URL로 변환)
+            posts = self._posts_from_links(self._collect_article_links(search_frame), cafe_id, keyword)
 
         except Exception as e:
             self.logger.warning(f"'{keyword}' {page_num}페이지 검색 오류: {e}")
@@ -852,360 +1888,916 @@ class NaverCafeCrawler:
         stop=stop_after_attempt(RetryConfig.MAX_ATTEMPTS),
         wait=wait_exponential(min=RetryConfig.MIN_WAIT, max=RetryConfig.MAX_WAIT),
         retry=retry_if_exception_type((PlaywrightTimeoutError,)),
+        before_sleep=record_retry,
         reraise=True
     )
     def collect_post_details(self, post_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """게시글 상세 정보 수집 (재시도 포함)"""
         url = post_info['url']
-        keyword = post_info['keyword']
-        cafe_name = post_info['cafe_name']
+        article_key = str(post_info['article_key'])
 
-        # 중복 URL 체크
-        if url in self.existing_urls:
-            self.logger.debug(f"중복 URL 건너뛰기: {url}")
+        # 중복 게시글 체크 (정규화 키 기준)
+        if article_key in self.article_index:
+            self.article_index.touch(article_key)
+            self.logger.debug(f"중복 게시글 건너뛰기: {url}")
+            self.metrics.inc('duplicate_skipped')
             return None
 
+        # HTTP 수집 우선 시도 (실패 시 브라우저로 폴백)
+        if self.http_fetcher:
+            record = self._collect_post_details_http(post_info)
+            if record:
+                return record
+
         try:
             # 게시글 페이지 이동
-            self.page.goto(url, wait_until='domcontentloaded', timeout=self.timeouts.PAGE_LOAD)
-            self._wait(self.wait_times.AFTER_PAGE_LOAD)
+            self._navigate(self.page, self._article_nav_url(post_info))
+            with self.metrics.timer('extract'):
+                return self._extract_post_details(self.page, post_info)
 
-            # 동적 콘텐츠 로딩 대기 - 고정 대기 대신 실제 요소 로딩 감지
-            try:
-                self.page.wait_for_selector('h3.title_text', timeout=3000)
-            except PlaywrightTimeoutError:
-                pass  # iframe 안에 있을 수 있으므로 실패해도 계속 진행
+        except Exception as e:
+            self.logger.warning(f"게시글 수집 오류 ({url}): {e}")
+            raise
+
+    def _article_nav_url(self, post_info: Dict[str, Any]) -> str:
+        """게시글 이동 URL (direct 모드는 카페 화면 없이 iframe 문서를 최상위로 로딩)"""
+        if self.config.article_navigation == 'direct':
+            return self._cafe_url(post_info['article_key'].frame_url)
+        return self._cafe_url(post_info['url'])
+
+    def _cached_article_frame(self, page: Page, post_info: Dict[str, Any]) -> Optional[Frame]:
+        """직전에 게시글을 찾은 위치의 프레임 (아직 없으면 None)"""
+        if self.article_frame_mode == 'main':
+            return page.main_frame
+        if self.article_frame_mode == 'iframe':
+            return self._find_matching_inner_iframe(page.main_frame, post_info['article_key'].article_id)
+        return None
+
+    def _remember_article_frame(self, page: Page, frame: Frame):
+        mode = 'main' if frame == page.main_frame else 'iframe'
+        if mode != self.article_frame_mode:
+            self.logger.debug(f"게시글 프레임 위치: {mode}")
+            self.article_frame_mode = mode
 
-            # 모든 프레임에서 요소 찾기 시도
-            article_frame = None
-            for frame in self.page.frames:
+    def _resolve_article_frame(self, page: Page, post_info: Dict[str, Any]) -> Optional[Frame]:
+        """제목이 나타난 게시글 프레임 대기
+
+        직전에 찾은 위치(최상위 문서/게시글 iframe)만 먼저 확인하고, 그곳에 없으면
+        모든 프레임을 확인한다 (매번 전체 프레임에 locator 조회를 하지 않도록).
+        """
+        selector = self.selectors.ARTICLE_READY
+        found = []
+
+        def condition():
+            frame = self._cached_article_frame(page, post_info)
+            if frame and frame.locator(selector).count() > 0:
+                found.append(frame)
+                return True
+            for frame in page.frames:
                 try:
-                    # 제목이 있는 프레임을 찾음
-                    if frame.locator('h3.title_text').count() > 0:
-                        article_frame = frame
-                        self.logger.debug(f"게시글 프레임 발견: {frame.url}")
-                        break
+                    if frame.locator(selector).count() > 0:
+                        found.append(frame)
+                        return True
                 except Exception:
                     continue
+            return False
 
-            if not article_frame:
-                self.logger.warning(f"게시글 프레임 미발견, 메인 페이지 사용 ({url})")
-                self.logger.debug(f"사용 가능한 프레임 수: {len(self.page.frames)}")
-                for idx, frame in enumerate(self.page.frames):
-                    self.logger.debug(f"프레임 {idx}: {frame.url}")
-                article_frame = self.page
+        self._poll_ready(page, 'article_ready', condition, self.timeouts.ARTICLE_READY)
+        if not found:
+            return None
+        self._remember_article_frame(page, found[0])
+        return found[0]
 
-            # 기본 정보 수집
-            try:
-                # 제목
-                title_elem = article_frame.locator(self.selectors.TITLE).first
-                title = self._normalize_text(title_elem.inner_text()) if title_elem.count() > 0 else ""
-                self.logger.debug(f"제목: {title[:50] if title else 'None'}...")
-
-                # 작성자
-                author_elem = article_frame.locator(self.selectors.AUTHOR).first
-                author = author_elem.inner_text().strip() if author_elem.count() > 0 else ""
-                self.logger.debug(f"작성자: {author if author else 'None'}")
-
-                # 날짜
-                date_elem = article_frame.locator(self.selectors.DATE).first
-                date_str = date_elem.inner_text().strip() if date_elem.count() > 0 else ""
-                self.logger.debug(f"날짜: {date_str if date_str else 'None'}")
-
-                # 본문 내용
-                content_elem = article_frame.locator(self.selectors.CONTENT).first
-                content = self._normalize_text(content_elem.inner_text()) if content_elem.count() > 0 else ""
-                self.logger.debug(f"내용 길이: {len(content)} 글자")
-
-                # 좋아요 수 추출 (여러 선택자 시도)
-                like_elem = self._find_element_with_selectors(article_frame, self.selectors.LIKES, "좋아요", wait=False)
-                likes = "0"
-                if like_elem and like_elem.count() > 0:
-                    likes_text = like_elem.inner_text().strip()
-                    likes = re.sub(r'\D', '', likes_text) if likes_text else "0"
-                    if not likes:  # 숫자가 없으면 0으로
-                        likes = "0"
-                self.logger.debug(f"좋아요: {likes}")
+    def _extract_post_details(self, page: Page, post_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """이동이 끝난 게시글 페이지에서 상세 정보 추출"""
+        url = post_info['url']
 
-            except Exception as e:
-                self.logger.error(f"기본 정보 수집 실패 ({url}): {e}")
-                self.logger.error(f"상세 오류: {traceback.format_exc()}")
-                return None
+        # 제목이 나타난 프레임 대기 (직전에 찾은 위치 우선, 없으면 전체 프레임)
+        article_frame = self._resolve_article_frame(page, post_info)
+        if article_frame:
+            self.logger.debug(f"게시글 프레임 발견: {article_frame.url}")
 
-            # 댓글 수집 (중첩 iframe 처리 제거 - Frame detached 오류 방지)
-            comments = []
-            try:
-                comments = self._collect_comments(article_frame, url)
-            except Exception as comment_err:
-                self.logger.debug(f"댓글 수집 실패: {comment_err}")
+        if not article_frame:
+            self.logger.warning(f"게시글 프레임 미발견, 메인 페이지 사용 ({url})")
+            self.logger.debug(f"사용 가능한 프레임 수: {len(page.frames)}")
+            for idx, frame in enumerate(page.frames):
+                self.logger.debug(f"프레임 {idx}: {frame.url}")
+            article_frame = page
 
-            if len(comments) == 0:
-                self.logger.debug(f"댓글 없음: {url}")
-            else:
-                self.logger.debug(f"댓글 {len(comments)}개 수집 완료")
+        # 기본 정보 수집 (단일 evaluate)
+        try:
+            article = self._extract_article_record(article_frame)
+            self.logger.debug(f"제목: {article.title[:50] if article.title else 'None'}...")
+            self.logger.debug(f"작성자: {article.author if article.author else 'None'}")
+            self.logger.debug(f"날짜: {article.date if article.date else 'None'}")
+            self.logger.debug(f"내용 길이: {len(article.content)} 글자")
+            self.logger.debug(f"좋아요: {article.likes}")
 
-            # 수집 완료 후 existing_urls에 추가
-            self.existing_urls.add(url)
+        except Exception as e:
+            self.logger.error(f"기본 정보 수집 실패 ({url}): {e}")
+            self.logger.error(f"상세 오류: {traceback.format_exc()}")
+            return None
 
-            # 메모리 정리 (더 적극적)
+        # 댓글 수집 (network 모드는 API 응답 우선, 실패 시 화면 추출)
+        with self.metrics.timer('comments'):
+            comments = None
+            if self.config.comment_source == 'network':
+                comments = self._collect_comments_network(page, post_info)
+            if comments is None:
+                comments = []
+                try:
+                    comments = self._collect_comments(article_frame, url, post_info.get('comment_count'))
+                except Exception as comment_err:
+                    self.logger.debug(f"댓글 수집 실패: {comment_err}")
+
+        if len(comments) == 0:
+            self.logger.debug(f"댓글 없음: {url}")
+        else:
+            self.logger.debug(f"댓글 {len(comments)}개 수집 완료")
+
+        # 메모리 정리 (memory_policy 사용 시에는 측정값 기준으로 탭/컨텍스트를 재생성하므로 생략)
+        if not self.config.memory_policy.enabled:
             try:
                 # JavaScript 가비지 컬렉션 실행
-                self.page.evaluate('() => { if (window.gc) window.gc(); }')
+                page.evaluate('() => { if (window.gc) window.gc(); }')
                 # 페이지 리소스 정리
-                self.page.evaluate('() => { window.stop(); }')
+                page.evaluate('() => { window.stop(); }')
                 # 콘솔 로그 정리
-                self.page.evaluate('() => { console.clear(); }')
+                page.evaluate('() => { console.clear(); }')
             except Exception:
                 pass
 
-            return {
-                '채널': cafe_name,
-                '키워드': keyword,
-                '닉네임': author,
-                '날짜': date_str,
-                '제목': title,
-                '내용': content,
-                '좋아요': likes,
-                'URL': url,
-                '댓글': comments
-            }
+        return self._build_post_record(post_info, article, comments)
+
+    def _collect_comments_network(self, page: Page, post_info: Dict[str, Any]) -> Optional[List[CommentRecord]]:
+        """게시글 로딩 중 받은 게시글/댓글 API 응답으로 댓글 수집, 남은 페이지는 컨텍스트 요청으로 조회
+
+        응답이 없거나 실패하면 None (화면 추출로 대체)
+        """
+        key = post_info['article_key']
+        if post_info.get('comment_count') == 0:
+            self.comment_capture.take(key)
+            return []
+
+        captured = []
+
+        def condition():
+            captured.extend(self.comment_capture.take(key))
+            return bool(captured)
+
+        if not self._poll_ready(page, 'comment_response', condition, self.timeouts.COMMENT_LOAD):
+            self.logger.debug(f"댓글 API 응답 없음, 화면 추출로 대체: {post_info['url']}")
+            return None
+
+        try:
+            results = {}
+            for page_no, response in captured:
+                if not response.ok:
+                    raise ArticleFetchError(f"HTTP {response.status}: {response.url}", status=response.status)
+                results[page_no] = unwrap_result(response.json(), response.url)
+
+            comments, seen_ids = merge_comment_results(results)
+            if seen_ids:
+                comments.extend(collect_comment_pages(
+                    lambda page_no: self._request_comment_page(page, key, page_no),
+                    start_page=max(results) + 1,
+                    seen_ids=seen_ids
+                ))
+            return comments
 
         except Exception as e:
-            self.logger.warning(f"게시글 수집 오류 ({url}): {e}")
-            raise
+            self.logger.debug(f"댓글 API 응답 처리 실패, 화면 추출로 대체: {e}")
+            return None
 
-    def _save_batch_to_excel(self, keyword: str):
-        """키워드별 배치 저장"""
-        if len(self.collected_data) == 0:
-            self.logger.info(f"'{keyword}' 수집 데이터 없음, 저장 건너뜀")
+    def _comment_page_url(self, key: ArticleKey, page_no: int) -> str:
+        path = COMMENTS_PATH.format(cafe_id=key.cafe_id, article_id=key.article_id, page=page_no)
+        return f"{self.config.api_base_url.rstrip('/')}{path}"
+
+    def _request_comment_page(self, page: Page, key: ArticleKey, page_no: int) -> Dict[str, Any]:
+        """브라우저 컨텍스트(쿠키 공유)로 댓글 페이지 조회"""
+        url = self._comment_page_url(key, page_no)
+        self._pace()
+        response = page.context.request.get(url, params=COMMENTS_PARAMS, headers={'Referer': f"{CAFE_BASE_URL}/"})
+        if not response.ok:
+            raise ArticleFetchError(f"HTTP {response.status}: {url}", status=response.status)
+        return unwrap_result(response.json(), url)
+
+    def _collect_posts(self, posts: List[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], Any]]:
+        """게시글 목록 상세 수집 - (post_info, 레코드/None/예외)를 목록 순서대로 반환"""
+        if self.account_info.tab_pool_size <= 1:
+            for post_info in posts:
+                try:
+                    yield post_info, self.collect_post_details(post_info)
+                except Exception as e:
+                    yield post_info, e
             return
 
-        self.logger.info(f"'{keyword}' {len(self.collected_data)}개 데이터 저장 중...")
+        yield from self._collect_posts_with_tabs(posts)
 
-        # 출력 폴더 생성
-        output_folder = Path(self.config.output_folder)
-        output_folder.mkdir(parents=True, exist_ok=True)
+    def _get_tab_pages(self) -> List[Page]:
+        """게시글 탭 풀 (같은 컨텍스트, 필요 시 생성)"""
+        while len(self.tab_pages) < self.account_info.tab_pool_size:
+            tab = self.context.new_page()
+            if not self.cdp_mode:
+                Stealth().apply_stealth_sync(tab)
+            self.tab_pages.append(tab)
+        return self.tab_pages
 
-        # 파일명 생성
-        filename = self._get_output_filename()
-        filepath = output_folder / filename
+    def _collect_posts_with_tabs(self, posts: List[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], Any]]:
+        """탭 N개로 게시글 로딩을 겹쳐서 수집
 
-        # 기존 파일이 있으면 로드, 없으면 새로 생성
-        if filepath.exists():
-            wb = load_workbook(filepath)
-            ws = wb.active
-            existing_rows = ws.max_row
-        else:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "모니터링"
-            existing_rows = 0
-
-            # 헤더 생성 (새 파일인 경우)
-            max_comments = max((len(data.get('댓글', [])) for data in self.collected_data), default=0)
-            headers = ['채널', '키워드', '닉네임', '날짜', '제목', '내용', '좋아요', 'URL']
-            headers.extend([f'댓글{i}' for i in range(1, max_comments + 1)])
-
-            ws.append(headers)
-            for cell in ws[1]:
-                cell.font = Font(bold=True)
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-
-        # 현재 최대 댓글 컬럼 수 확인
-        current_max_cols = ws.max_column
-        new_max_comments = max((len(data.get('댓글', [])) for data in self.collected_data), default=0)
-        required_cols = 8 + new_max_comments  # 기본 8개 + 댓글 컬럼
-
-        # 필요시 댓글 컬럼 추가
-        if required_cols > current_max_cols:
-            for i in range(current_max_cols - 7, new_max_comments + 1):
-                ws.cell(row=1, column=8 + i, value=f'댓글{i}')
-                ws.cell(row=1, column=8 + i).font = Font(bold=True)
-                ws.cell(row=1, column=8 + i).alignment = Alignment(horizontal='center', vertical='center')
-
-        # 데이터 추가
-        for data in self.collected_data:
-            row = [
-                data.get('채널', ''),
-                data.get('키워드', ''),
-                data.get('닉네임', ''),
-                data.get('날짜', ''),
-                data.get('제목', ''),
-                data.get('내용', ''),
-                data.get('좋아요', '0'),
-                data.get('URL', '')
-            ]
-
-            comments = data.get('댓글', [])
-            row.extend(comments)
-
-            # 남은 컬럼 빈칸
-            max_cols = ws.max_column
-            row.extend([''] * (max_cols - len(row)))
-
-            ws.append(row)
-
-        # 컬럼 너비 고정 설정 (전체 셀 순회 대신 고정값으로 성능 개선)
-        fixed_widths = {1: 20, 2: 15, 3: 15, 4: 20, 5: 40, 6: 50, 7: 8, 8: 50}
-        max_col = ws.max_column
-        for col_idx in range(1, max_col + 1):
-            col_letter = ws.cell(row=1, column=col_idx).column_letter
-            if col_idx in fixed_widths:
-                ws.column_dimensions[col_letter].width = fixed_widths[col_idx]
-            else:
-                ws.column_dimensions[col_letter].width = 30  # 댓글 컬럼
+        빈 탭에 다음 게시글 이동(commit까지만)을 걸어 두고, 가장 먼저 배정된 탭부터
+        로딩 완료를 기다려 추출한다. 한 탭을 추출하는 동안 나머지 탭은 백그라운드에서 로딩된다.
+        """
+        pending = deque(enumerate(posts))
+        in_flight = deque()  # (인덱스, post_info, 탭, 이동 시작 시각, 응답, 이동 오류)
+        free_tabs = list(self._get_tab_pages())
+        results: Dict[int, Any] = {}
+        next_idx = 0
+
+        while pending or in_flight:
+            # 빈 탭에 다음 게시글 배정
+            while free_tabs and pending:
+                idx, post_info = pending.popleft()
+                url = post_info['url']
+                article_key = str(post_info['article_key'])
+
+                if article_key in self.article_index:
+                    self.article_index.touch(article_key)
+                    self.logger.debug(f"중복 게시글 건너뛰기: {url}")
+                    self.metrics.inc('duplicate_skipped')
+                    results[idx] = None
+                    continue
+
+                if self.http_fetcher:
+                    try:
+                        record = self._collect_post_details_http(post_info)
+                    except Exception as e:
+                        # 예외가 제너레이터 밖으로 나가면 배치 전체가 중단되므로 결과로 전달
+                        results[idx] = e
+                        continue
+                    if record:
+                        results[idx] = record
+                        continue
+
+                tab = free_tabs.pop()
+                self._pace()
+                started = time.time()
+                try:
+                    response = tab.goto(self._article_nav_url(post_info), wait_until='commit', timeout=self.timeouts.PAGE_LOAD)
+                    in_flight.append((idx, post_info, tab, started, response, None))
+                except Exception as e:
+                    in_flight.append((idx, post_info, tab, started, None, e))
+
+            # 가장 먼저 배정된 탭 추출
+            if in_flight:
+                idx, post_info, tab, started, response, nav_error = in_flight.popleft()
+                try:
+                    if nav_error:
+                        raise nav_error
+                    try:
+                        tab.wait_for_load_state('domcontentloaded', timeout=self.timeouts.PAGE_LOAD)
+                    except Exception:
+                        self._record_navigation_error(started)
+                        raise
+                    # 지연은 이동 시작부터 로딩 완료까지 (다른 탭 추출 대기 포함이라 다소 길게 측정됨)
+                    self._record_navigation(tab, response, started)
+                    with self.metrics.timer('extract'):
+                        results[idx] = self._extract_post_details(tab, post_info)
+                except Exception as e:
+                    # 탭 수집 실패 시 메인 페이지에서 재시도 포함 순차 수집
+                    self.logger.warning(f"탭 수집 실패, 순차 수집으로 재시도 ({post_info['url']}): {e}")
+                    try:
+                        results[idx] = self.collect_post_details(post_info)
+                    except Exception as retry_err:
+                        results[idx] = retry_err
+                free_tabs.append(tab)
+
+            # 완료된 결과를 순서대로 반환
+            while next_idx in results:
+                yield posts[next_idx], results.pop(next_idx)
+                next_idx += 1
+
+    def _build_post_record(
+        self,
+        post_info: Dict[str, Any],
+        article: ArticleRecord,
+        comments: List[CommentRecord]
+    ) -> Dict[str, Any]:
+        """저장용 게시글 레코드 생성 (브라우저/HTTP 수집 공통)"""
+        return {
+            '채널': post_info['cafe_name'],
+            '키워드': ', '.join(post_info.get('keywords') or [post_info['keyword']]),
+            '닉네임': article.author,
+            '날짜': article.date,
+            '제목': article.title,
+            '내용': article.content,
+            '좋아요': article.likes,
+            'URL': post_info['url'],
+            '게시글키': str(post_info['article_key']),
+            '댓글': [comment.to_line() for comment in comments],
+            '댓글상세': [comment.model_dump() for comment in comments]
+        }
+
+    def _init_http_fetcher(self):
+        """HTTP 수집기 생성 및 브라우저 세션 쿠키 적용"""
+        if self.config.fetch_engine != 'http':
+            return
+
+        if not self.http_fetcher:
+            self.http_fetcher = NaverCafeHttpFetcher(
+                api_base_url=self.config.api_base_url,
+                pool_size=self.config.http_pool_size,
+                timeout=self.timeouts.PAGE_LOAD / 1000
+            )
+
+        # 로그인된 컨텍스트 쿠키 우선, 없으면 저장된 쿠키 파일 사용
+        try:
+            cookies = self.context.cookies()
+        except Exception as e:
+            self.logger.debug(f"컨텍스트 쿠키 조회 실패: {e}")
+            cookies = []
+        if not cookies:
+            cookies = self._read_cookie_file()
+
+        count = self.http_fetcher.load_cookies(cookies)
+        self.logger.info(f"HTTP 수집기 준비 완료 (쿠키 {count}개)")
+
+    def _collect_post_details_http(self, post_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """HTTP로 게시글 상세 수집 (실패 시 None 반환 → 브라우저 수집)"""
+        return self._fetch_post_details_http(post_info, self._paced_http_request)
+
+    def _paced_http_request(self, request: Callable[[], Any]) -> Any:
+        """HTTP API 요청 1건 (게시글/댓글 페이지마다 요청 간격 슬롯 사용 후 결과를 제어기에 반영)"""
+        self._pace()
+        started = time.time()
+        try:
+            result = request()
+        except Exception as e:
+            self._record_http_request((time.time() - started) * 1000, e)
+            raise
+        self._record_http_request((time.time() - started) * 1000)
+        return result
+
+    def _record_http_request(self, latency_ms: float, error: Optional[Exception] = None):
+        """HTTP 요청 결과를 요청 간격 제어기에 반영 (403/429는 차단 신호)"""
+        blocked = isinstance(error, ArticleFetchError) and error.status in self.constants.BLOCK_STATUS_CODES
+        self.rate_controller.record(latency_ms, ok=error is None, blocked=blocked)
 
-        # 저장
-        wb.save(filepath)
-        self.logger.info(f"'{keyword}' 저장 완료: {filepath}")
-        print(f"  💾 '{keyword}' {len(self.collected_data)}개 저장: {filepath}")
+    def _fetch_post_details_http(self, post_info: Dict[str, Any], request_hook: RequestHook) -> Optional[Dict[str, Any]]:
+        """HTTP 수집 (request_hook: API 요청마다 요청 간격 대기/결과 기록, async 크롤러는 스레드에서 호출)"""
+        url = post_info['url']
+        article_key = post_info['article_key']
+
+        started = time.time()
+        try:
+            article, comments = self.http_fetcher.fetch_article(
+                article_key.cafe_id, article_key.article_id, request_hook=request_hook
+            )
+        except Exception as e:
+            # ArticleFetchError 외 예상하지 못한 오류도 브라우저 수집으로 넘김
+            blocked = isinstance(e, ArticleFetchError) and e.status in self.constants.BLOCK_STATUS_CODES
+            self.metrics.observe('http_fetch', time.time() - started)
+            self.metrics.inc('blocked' if blocked else 'http_fallback')
+            self.logger.info(f"HTTP 수집 실패, 브라우저로 폴백 ({url}): {e}")
+            return None
+        self.metrics.observe('http_fetch', time.time() - started)
+
+        self.logger.debug(f"HTTP 수집 완료: {article.title[:50]}... (댓글 {len(comments)}개)")
+        return self._build_post_record(post_info, article, comments)
+
+    def _open_result_sinks(self):
+        """설정된 결과 저장소 생성"""
+        if self.result_sinks:
+            return
+        output_folder = Path(self.config.output_folder)
+        for name in self.config.result_sinks:
+            sink = create_sink(name, output_folder, self.group_name)
+            if isinstance(sink, ExcelSink):
+                # 이전 실행에서 남은 세그먼트도 종료 시 함께 생성
+                sink.open(self._get_output_basename())
+            self.result_sinks.append(sink)
+        self.logger.info(f"결과 저장 형식: {', '.join(self.config.result_sinks)}")
+
+    def _get_output_basename(self) -> str:
+        """이번 주 출력 파일명 (확장자 제외, 주차가 바뀌면 새 파일)"""
+        return Path(self._get_output_filename()).stem
+
+    def _save_batch(self, batch_name: str) -> bool:
+        """배치 저장 (batch_name: 로그용 배치 이름) - 설정된 모든 저장소에 추가, 모두 성공하면 True"""
+        if len(self.collected_data) == 0:
+            self.logger.info(f"'{batch_name}' 수집 데이터 없음, 저장 건너뜀")
+            return True
+
+        self._open_result_sinks()
+        basename = self._get_output_basename()
+        count = len(self.collected_data)
+        failed = []
+        for sink in self.result_sinks:
+            try:
+                with self.metrics.timer(f"save_{type(sink).__name__}"):
+                    location = sink.write(self.collected_data, basename)
+                self.logger.info(f"'{batch_name}' {count}개 저장: {location}")
+                print(f"  💾 '{batch_name}' {count}개 저장: {location}")
+            except Exception as e:
+                self.metrics.inc('save_error')
+                failed.append(type(sink).__name__)
+                self.logger.error(f"'{batch_name}' 저장 실패 ({type(sink).__name__}): {e}")
+
+        # 모든 저장소에 기록된 게시글만 인덱스에 기록 (하나라도 실패하거나 저장 전 종료되면 다음 실행에서 다시 수집)
+        if failed:
+            self.logger.warning(
+                f"'{batch_name}' {count}개 인덱스 미기록 ({', '.join(failed)} 저장 실패) - 다음 실행에서 다시 수집"
+            )
+        else:
+            for record in self.collected_data:
+                self.article_index.add(record['게시글키'], record['URL'])
 
         # 메모리 해제
         self.collected_data.clear()
+        self._write_metrics()
+        return not failed
+
+    def _write_metrics(self):
+        """지표 스냅샷 저장 (배치마다 갱신, main()이 계정별 스냅샷을 합침)"""
+        try:
+            self.metrics.write(Path(self.config.log_folder))
+        except Exception as e:
+            self.logger.warning(f"지표 저장 실패: {e}")
 
-    def _crawl_keyword(self, cafe_id: str, cafe_name: str, keyword: str, keyword_idx: int, total_keywords: int):
-        """단일 키워드 크롤링"""
+    def _close_result_sinks(self):
+        """저장소 종료 (엑셀 생성, 버퍼 저장 등)"""
+        for sink in self.result_sinks:
+            try:
+                for message in sink.close():
+                    self.logger.info(message)
+                    print(f"  💾 {message}")
+            except Exception as e:
+                self.logger.error(f"저장소 종료 실패 ({type(sink).__name__}): {e}")
+        self.result_sinks = []
+
+    # ---- 카페/키워드 흐름 (sync/async 크롤러 공용) ----
+    #
+    # 흐름 메서드는 제너레이터로, 브라우저 I/O가 필요한 곳에서 io('메서드명', ...)를 yield한다.
+    # NaverCafeCrawler._drive는 해당 메서드를 바로 호출하고, AsyncNaverCafeCrawler._drive는 같은 이름의
+    # 코루틴을 await한 뒤 결과(또는 예외)를 흐름에 돌려준다. 체크포인트/인덱스/저장은 흐름에서 직접 호출한다.
+
+    def _drive(self, flow: Flow) -> Any:
+        """흐름 제너레이터 실행 - yield된 I/O 호출을 실행해 결과/예외를 돌려보내고 최종 반환값 반환"""
+        result, error = None, None
+        while True:
+            try:
+                call = flow.throw(error) if error is not None else flow.send(result)
+            except StopIteration as stop:
+                return stop.value
+            result, error = None, None
+            try:
+                result = getattr(self, call.method)(*call.args, **call.kwargs)
+            except BaseException as e:
+                # KeyboardInterrupt 등도 흐름에 전달해 finally(브라우저 종료 등)가 실행되도록
+                error = e
+
+    def _discover_keyword(
+        self,
+        cafe_id: str,
+        cafe_name: str,
+        keyword: str,
+        keyword_idx: int,
+        total_keywords: int,
+        candidates: Dict[str, Dict[str, Any]],
+        start_page: int = 1
+    ) -> Flow:
+        """단일 키워드 검색 (게시글 후보만 수집, 상세 수집은 _fetch_candidates에서)
+
+        검색 결과가 최신순이라는 전제로, 페이지 전체가 워터마크 이하(이미 처리한 게시글)이면
+        페이지 넘김을 멈춘다. 같은 페이지가 반복되어도 멈춘다.
+        반환값은 이번 검색에서 본 가장 최신 게시글 ID (워터마크 갱신용).
+        페이지마다 체크포인트에 다음 페이지와 후보를 기록한다 (재개 시 start_page부터).
+        검색 오류는 그대로 전달한다 (끝까지 검색하지 못한 키워드는 워터마크를 갱신하면 안 됨).
+        """
+        self.metrics.cafe = cafe_name
         print(f"\n{'='*80}")
         print(f"[{cafe_name}] [키워드 {keyword_idx}/{total_keywords}] '{keyword}' 검색 시작")
         print(f"{'='*80}")
-        self.logger.info(f"[{cafe_name}] [{keyword_idx}/{total_keywords}] '{keyword}' 시작")
+        self.logger.info(f"[{cafe_name}] [{keyword_idx}/{total_keywords}] '{keyword}' 검색 시작")
 
-        page_num = 1
-        keyword_total_posts = 0
+        page_num = start_page
+        keyword_new_posts = 0
+        newest_id: Optional[int] = None
+        seen_pages = set()
+        watermark = self.article_index.get_watermark(cafe_id, keyword) if self.config.use_watermark else None
+        if watermark:
+            self.logger.debug(f"'{keyword}' 워터마크: {watermark}")
 
         while True:
             print(f"\n[{cafe_name}] [{keyword}] {page_num}페이지 검색 중...")
 
             try:
                 # 게시글 URL 수집
-                posts = self.search_keyword_in_cafe(cafe_id, keyword, page_num)
-
-                # 각 post에 cafe_name 추가
-                for post in posts:
-                    post['cafe_name'] = cafe_name
+                with self.metrics.timer('search_page'):
+                    posts = yield io('search_keyword_in_cafe', cafe_id, keyword, page_num)
 
                 if len(posts) == 0:
                     print(f"  → {page_num}페이지 게시글 없음. '{keyword}' 종료")
                     self.logger.info(f"'{keyword}' {page_num}페이지 없음, 종료")
                     break
 
-                print(f"  → {len(posts)}개 발견")
-                self.logger.info(f"'{keyword}' {page_num}페이지: {len(posts)}개")
-
-                # 각 게시글 처리
-                page_collected = 0
-                for post_idx, post_info in enumerate(posts, 1):
-                    print(f"  [{post_idx}/{len(posts)}] 처리 중...")
+                # 같은 페이지 반복 감지 (마지막 페이지를 계속 돌려주는 경우)
+                fingerprint = tuple(sorted(str(post['article_key']) for post in posts))
+                if fingerprint in seen_pages:
+                    print(f"  → {page_num}페이지가 이전 페이지와 동일. '{keyword}' 종료")
+                    self.logger.info(f"'{keyword}' {page_num}페이지 반복, 종료")
+                    break
+                seen_pages.add(fingerprint)
 
-                    try:
-                        post_data = self.collect_post_details(post_info)
+                page_ids = [int(post['article_key'].article_id) for post in posts]
+                newest_id = max([newest_id or 0] + page_ids)
 
-                        if post_data:
-                            self.collected_data.append(post_data)
-                            page_collected += 1
-                            keyword_total_posts += 1
-                            comment_count = len(post_data.get('댓글', []))
-                            print(f"    ✅ 완료 (댓글 {comment_count}개)")
-                        else:
-                            print(f"    ⏭️  수집 실패, 건너뜀")
+                # 후보 병합 (이미 다른 키워드로 발견된 게시글은 키워드만 추가)
+                page_new = self._merge_candidates(posts, cafe_name, keyword, candidates)
 
-                    except Exception as e:
-                        self.logger.warning(f"게시글 처리 실패 ({post_info['url']}): {e}")
-                        print(f"    ❌ 오류, 건너뜀")
-                        continue
+                keyword_new_posts += page_new
+                print(f"  → {len(posts)}개 발견 (신규 {page_new}개)")
+                self.logger.info(
+                    f"'{keyword}' {page_num}페이지: {len(posts)}개 (신규 {page_new}개), "
+                    f"요청 간격 {self.rate_controller.delay_ms:.0f}ms"
+                )
+                self._record_page_progress(keyword, page_num + 1, candidates, newest_id)
 
-                print(f"\n  {page_num}페이지 완료: {page_collected}개")
+                # 워터마크 이하 게시글만 있으면 이후 페이지는 이미 처리됨
+                if watermark and max(page_ids) <= watermark:
+                    print(f"  → 이미 처리한 게시글만 있음. '{keyword}' 종료")
+                    self.logger.info(f"'{keyword}' {page_num}페이지 워터마크({watermark}) 이하, 종료")
+                    break
 
                 # 다음 페이지로
                 page_num += 1
 
                 # 페이지 완료 후 브라우저 재시작 체크
                 try:
-                    restarted = self._restart_browser_if_needed()
+                    restarted = yield io('_restart_browser_if_needed', self._search_url(cafe_id, keyword, page_num))
                     if restarted:
                         self.logger.info(f"브라우저 재시작 후 '{keyword}' 계속")
                 except Exception as e:
                     self.logger.error(f"브라우저 재시작 실패: {e}")
                     raise
 
-                # Rate limiting: 계정별 랜덤 대기 시간
-                random_wait = random.uniform(
-                    self.account_info.rate_limit_min_ms,
-                    self.account_info.rate_limit_max_ms
-                )
-                self._wait(self.wait_times.BETWEEN_PAGES + random_wait)
+                # 요청 간격은 다음 검색 이동 시 rate_controller가 적용
 
             except Exception as e:
+                # 중간에 끊긴 키워드는 워터마크를 갱신하지 않도록 호출 측으로 전달
                 self.logger.error(f"'{keyword}' {page_num}페이지 오류: {e}")
-                print(f"  ❌ 오류 발생, 다음 키워드로")
+                raise
+
+        print(f"\n'{keyword}' 검색 완료: 신규 후보 {keyword_new_posts}개")
+        self.logger.info(f"'{keyword}' 검색 완료: 신규 후보 {keyword_new_posts}개")
+        return newest_id
+
+    def _record_page_progress(
+        self,
+        keyword: str,
+        next_page: int,
+        candidates: Dict[str, Dict[str, Any]],
+        newest_id: Optional[int]
+    ):
+        """검색 페이지 완료 기록 (작업 큐 모드: 임대 연장 / 그 외: 체크포인트)"""
+        if self.work_unit:
+            self._renew_lease()
+        else:
+            self.checkpoint.record_page(keyword, next_page, candidates, newest_id)
+
+    def _record_fetch_progress(self, fetched: int, failed_ids: Dict[str, int]):
+        """상세 수집 배치 저장 완료 기록 (작업 큐 모드: 임대 연장 / 그 외: 체크포인트)"""
+        if self.work_unit:
+            self._renew_lease()
+        else:
+            self.checkpoint.record_fetched(fetched, failed_ids)
+
+    @staticmethod
+    def _record_failed(failed_ids: Dict[str, int], post_info: Dict[str, Any]):
+        """수집/저장 실패 게시글 기록 (키워드별 가장 오래된 게시글 ID)"""
+        article_id = int(post_info['article_key'].article_id)
+        for keyword in post_info['keywords']:
+            failed_ids[keyword] = min(article_id, failed_ids.get(keyword, article_id))
+
+    def _set_watermark(self, cafe_id: str, keyword: str, newest_id: int, failed_ids: Dict[str, int]):
+        """워터마크 갱신 - 실패한 게시글이 있으면 그 아래까지만 (다음 실행에서 다시 검색되도록)"""
+        if keyword in failed_ids:
+            newest_id = min(newest_id, failed_ids[keyword] - 1)
+            self.logger.info(f"'{keyword}' 실패 게시글({failed_ids[keyword]})이 있어 워터마크 {newest_id}까지만 갱신")
+        if newest_id > 0:
+            self.article_index.set_watermark(cafe_id, keyword, newest_id)
+
+    def _merge_candidates(
+        self,
+        posts: List[Dict[str, Any]],
+        cafe_name: str,
+        keyword: str,
+        candidates: Dict[str, Dict[str, Any]]
+    ) -> int:
+        """검색 페이지 게시글을 후보에 병합 (수집 이력에 있는 게시글 제외), 신규 후보 수 반환"""
+        page_new = 0
+        for post in posts:
+            article_key = str(post['article_key'])
+            if article_key in candidates:
+                if keyword not in candidates[article_key]['keywords']:
+                    candidates[article_key]['keywords'].append(keyword)
+                continue
+            if article_key in self.article_index:
+                self.article_index.touch(article_key)
+                continue
+            post['cafe_name'] = cafe_name
+            post['keywords'] = [keyword]
+            candidates[article_key] = post
+            page_new += 1
+        return page_new
+
+    def _next_fetch_url(self, candidates: List[Dict[str, Any]], index: int) -> Optional[str]:
+        """재시작 시 미리 이동할 다음 게시글 (메인 페이지로 순서대로 수집할 때만)"""
+        if index >= len(candidates) or self.http_fetcher or self.account_info.tab_pool_size > 1:
+            return None
+        return self._article_nav_url(candidates[index])
+
+    def _fetch_candidates(
+        self,
+        cafe_name: str,
+        candidates: List[Dict[str, Any]],
+        start_index: int = 0,
+        failed_ids: Optional[Dict[str, int]] = None
+    ) -> Flow:
+        """후보 게시글을 한 번씩만 상세 수집 (배치 단위 저장, start_index: 재개 위치)
+
+        반환값은 키워드별 가장 오래된 실패 게시글 ID (failed_ids: 재개 전까지의 실패).
+        수집 오류, 중복이 아닌데 결과가 없는 경우, 저장 실패로 인덱스에 기록되지 않은 경우를 실패로 본다.
+        """
+        failed_ids = dict(failed_ids or {})
+        total = len(candidates)
+        self.metrics.cafe = cafe_name
+        print(f"\n[{cafe_name}] 게시글 상세 수집 시작: {total - start_index}개")
+        self.logger.info(f"[{cafe_name}] 상세 수집 시작: {total - start_index}개 (전체 {total}개)")
+
+        batch_size = self.constants.FETCH_BATCH_SIZE
+        total_collected = 0
+
+        for start in range(start_index, total, batch_size):
+            batch = candidates[start:start + batch_size]
+            yield io('_update_trace_window')
+
+            # sync는 탭에서 끝나는 대로 하나씩, async는 배치 전체가 끝난 뒤 목록으로 받음
+            results = yield io('_collect_posts', batch)
+            collected = []
+            for offset, (post_info, result) in enumerate(results, 1):
+                self.profiler.article_done()
+                yield io('_update_trace_window')
+                print(f"  [{start + offset}/{total}] 처리 중... ({', '.join(post_info['keywords'])})")
+
+                if isinstance(result, Exception):
+                    self.metrics.inc('articles_failed')
+                    self.logger.warning(f"게시글 처리 실패 ({post_info['url']}): {result}")
+                    print(f"    ❌ 오류, 건너뜀")
+                    self._record_failed(failed_ids, post_info)
+                    continue
+
+                if result:
+                    self.metrics.inc('articles_collected')
+                    self.collected_data.append(result)
+                    collected.append(post_info)
+                    total_collected += 1
+                    comment_count = len(result.get('댓글', []))
+                    print(f"    ✅ 완료 (댓글 {comment_count}개)")
+                else:
+                    print(f"    ⏭️  수집 실패, 건너뜀")
+                    # 중복으로 건너뛴 게시글은 이미 인덱스에 있음
+                    if str(post_info['article_key']) not in self.article_index:
+                        self._record_failed(failed_ids, post_info)
+
+            # 배치 저장 후 체크포인트 기록
+            if not self._save_batch(f"{cafe_name} {start + 1}-{start + len(batch)}"):
+                for post_info in collected:
+                    self._record_failed(failed_ids, post_info)
+            self._record_fetch_progress(start + len(batch), failed_ids)
+
+            # 배치 완료 후 브라우저 재시작 체크
+            try:
+                yield io('_restart_browser_if_needed', self._next_fetch_url(candidates, start + batch_size))
+            except Exception as e:
+                self.logger.error(f"브라우저 재시작 실패: {e}")
+                raise
+
+        print(f"\n[{cafe_name}] 상세 수집 완료: 총 {total_collected}개")
+        self.logger.info(f"[{cafe_name}] 상세 수집 완료: {total_collected}개")
+        return failed_ids
+
+    def _accessible_cafe_names(self) -> List[str]:
+        """작업 큐에서 임대할 수 있는 카페 (accessible_cafes가 없으면 전체)"""
+        names = [cafe.cafe_name for cafe in self.config.cafes]
+        if self.account_info.accessible_cafes is None:
+            return names
+        return [name for name in names if name in self.account_info.accessible_cafes]
+
+    def _open_work_queue(self) -> WorkQueue:
+        if self.work_queue is None:
+            self.work_queue = WorkQueue(Path(self.config.output_folder) / self.config.work_queue_db)
+        return self.work_queue
+
+    def _renew_lease(self):
+        """진행 중인 작업의 임대 연장 (이미 회수된 경우 경고만, 중복 수집은 인덱스가 막음)"""
+        if not self.work_queue.renew(self.work_unit, self.group_name, self.config.lease_seconds):
+            self.logger.warning(f"작업 임대 만료 후 회수됨: {self.work_unit.cafe_name} / '{self.work_unit.keyword}'")
+
+    def _lease_next_unit(self, allowed: List[str], last_cafe: Optional[str]) -> Flow:
+        """다음 작업 임대 - 남은 작업이 모두 다른 작업자 임대 중이면 만료될 때까지 대기"""
+        while True:
+            unit = self.work_queue.lease(
+                self.run_id, self.group_name, allowed, self.config.lease_seconds, prefer_cafe=last_cafe
+            )
+            if unit or not self.work_queue.has_unfinished(self.run_id, allowed):
+                return unit
+            yield io('_wait', self.constants.WORK_QUEUE_POLL_SECONDS * 1000)
+
+    def _crawl_unit(self, cafe: CafeInfo, keyword: str) -> Flow:
+        """작업 1개 처리 (키워드 검색 → 상세 수집 → 워터마크 갱신)
+
+        검색 오류는 그대로 전달해 작업을 실패 처리한다 (워터마크 없이 재시도).
+        작업이 키워드 단위라 다른 키워드 작업에서 이미 수집한 게시글은 인덱스에서 건너뛰며,
+        저장된 결과의 '키워드'에는 먼저 수집한 작업의 키워드만 남는다.
+        """
+        candidates: Dict[str, Dict[str, Any]] = {}
+        newest_id = yield from self._discover_keyword(cafe.cafe_id, cafe.cafe_name, keyword, 1, 1, candidates)
+        failed_ids = yield from self._fetch_candidates(cafe.cafe_name, list(candidates.values()))
+        if newest_id:
+            self._set_watermark(cafe.cafe_id, keyword, newest_id, failed_ids)
+
+    def _run_work_queue(self) -> Flow:
+        """공유 작업 큐에서 (카페, 키워드) 작업을 더 없을 때까지 가져와 처리"""
+        queue = self._open_work_queue()
+        cafes = {cafe.cafe_name: cafe for cafe in self.config.cafes}
+        allowed = self._accessible_cafe_names()
+        self.logger.info(f"작업 큐 모드 (실행 {self.run_id}, 접근 가능 카페 {len(allowed)}개)")
+
+        last_cafe = None
+        processed = 0
+        while True:
+            unit = yield from self._lease_next_unit(allowed, last_cafe)
+            if unit is None:
                 break
 
-        print(f"\n'{keyword}' 완료: 총 {keyword_total_posts}개")
-        self.logger.info(f"'{keyword}' 완료: {keyword_total_posts}개")
+            self.work_unit = unit
+            print(f"\n[{self.group_name}] 작업 임대: {unit.cafe_name} / '{unit.keyword}'")
+            self.logger.info(f"작업 임대: {unit.cafe_name} / '{unit.keyword}'")
+            try:
+                yield from self._crawl_unit(cafes[unit.cafe_name], unit.keyword)
+                queue.complete(unit, self.group_name)
+                processed += 1
+            except Exception as e:
+                self.logger.error(f"작업 실패 ({unit.cafe_name} / '{unit.keyword}'): {e}")
+                queue.fail(unit, self.group_name)
+            finally:
+                self.work_unit = None
+            last_cafe = unit.cafe_name
 
-        # 키워드별 배치 저장
-        self._save_batch_to_excel(keyword)
+        self.logger.info(f"작업 큐 완료: {processed}개 처리 ({queue.summary(self.run_id)})")
 
-    def _setup(self):
-        """초기 설정 (로그인만)"""
+    def _setup(self) -> Flow:
+        """초기 설정 (수집 이력/저장소 열기, 로그인, HTTP 수집기)"""
         self.logger.info("="*80)
         self.logger.info("네이버 카페 크롤링 시작")
         self.logger.info("="*80)
 
-        # 기존 URL 로드
-        self._load_existing_urls()
+        # 수집 이력 인덱스 / 결과 저장소 열기
+        self._open_article_index()
+        self._open_result_sinks()
 
         if self.cdp_mode:
             # CDP 모드: 이미 로그인된 Chrome 세션 사용, 로그인 생략
             self.logger.info("CDP 모드: 기존 Chrome 세션 사용 (로그인 생략)")
             print(f"\n[{self.group_name}] CDP 모드: 로그인 생략 (기존 Chrome 세션 사용)\n")
+        elif (self.config.headless or self.prefer_saved_cookies) and (yield io('_load_cookies')):
+            # headless 모드(보안인증을 직접 처리할 화면 없음)와 async 엔진은 저장된 쿠키 우선
+            self.logger.info("저장된 쿠키로 로그인 생략")
+            print(f"[{self.group_name}] 쿠키 재사용 (로그인 생략)")
         else:
             # 일반 모드: 로그인 진행
-            if not self.login_naver():
+            if not (yield io('login_naver')):
                 raise Exception("로그인 실패")
 
-    def _crawl_cafe(self, cafe: CafeInfo, cafe_idx: int, total_cafes: int):
+        yield io('_init_http_fetcher')
+
+    def _crawl_cafe(self, cafe: CafeInfo, cafe_idx: int, total_cafes: int) -> Flow:
         """단일 카페 크롤링"""
         print(f"\n{'='*80}")
         print(f"[카페 {cafe_idx}/{total_cafes}] {cafe.cafe_name} 크롤링 시작")
         print(f"{'='*80}")
         self.logger.info(f"[카페 {cafe_idx}/{total_cafes}] {cafe.cafe_name} 시작")
 
-        # 모든 키워드 크롤링
-        keywords = self.config.keywords
-        total_keywords = len(keywords)
+        # 중단된 카페면 체크포인트에서 이어서
+        cafe_state = self.checkpoint.cafe_state(cafe.cafe_name)
+        if cafe_state:
+            self.logger.info(
+                f"[{cafe.cafe_name}] 체크포인트에서 재개: {cafe_state['phase']} 단계, "
+                f"후보 {len(cafe_state['candidates'])}개"
+            )
+            print(f"  ↻ 체크포인트에서 재개 ({cafe_state['phase']} 단계)")
+        else:
+            self.checkpoint.begin_cafe(cafe.cafe_name)
+            cafe_state = self.checkpoint.cafe_state(cafe.cafe_name)
 
-        for keyword_idx, keyword in enumerate(keywords, 1):
-            try:
-                self._crawl_keyword(cafe.cafe_id, cafe.cafe_name, keyword, keyword_idx, total_keywords)
-            except Exception as e:
-                self.logger.error(f"[{cafe.cafe_name}] '{keyword}' 크롤링 실패: {e}")
-                print(f"\n❌ [{cafe.cafe_name}] '{keyword}' 크롤링 실패, 다음 키워드로 이동\n")
-                continue
+        candidates = self.checkpoint.restored_candidates(cafe_state)
+
+        if cafe_state['phase'] == 'discover':
+            # 1단계: 모든 키워드 검색으로 후보 게시글 수집 (게시글 키 기준 병합)
+            keywords = self.config.keywords
+            total_keywords = len(keywords)
+
+            for keyword_idx, keyword in enumerate(keywords, 1):
+                if keyword in cafe_state['done_keywords']:
+                    continue
+                start_page = cafe_state['page'] if cafe_state['keyword'] == keyword else 1
+                try:
+                    newest_id = yield from self._discover_keyword(
+                        cafe.cafe_id, cafe.cafe_name, keyword, keyword_idx, total_keywords, candidates,
+                        start_page=start_page
+                    )
+                except Exception as e:
+                    # 이미 찾은 후보는 수집하되 워터마크는 갱신하지 않음 (다음 실행에서 처음부터 검색)
+                    self.logger.error(f"[{cafe.cafe_name}] '{keyword}' 검색 실패: {e}")
+                    print(f"\n❌ [{cafe.cafe_name}] '{keyword}' 검색 실패, 다음 키워드로 이동\n")
+                    self.checkpoint.fail_keyword(keyword)
+                    continue
+                self.checkpoint.finish_keyword(keyword, newest_id)
+
+            queue = list(candidates.values())
+            self.checkpoint.begin_fetch(queue)
+            fetched = 0
+        else:
+            queue = list(candidates.values())
+            fetched = cafe_state['fetched']
+
+        # 2단계: 게시글별 1회 상세 수집 (매칭된 키워드 전체 기록)
+        failed_ids = yield from self._fetch_candidates(
+            cafe.cafe_name, queue, start_index=fetched, failed_ids=cafe_state.get('failed_ids')
+        )
+
+        # 상세 수집까지 끝난 키워드만 워터마크 갱신 (실패한 게시글 아래까지)
+        for keyword, newest_id in cafe_state['newest_ids'].items():
+            self._set_watermark(cafe.cafe_id, keyword, newest_id, failed_ids)
+
+        self.checkpoint.finish_cafe(cafe.cafe_name)
 
         print(f"\n{'='*80}")
         print(f"[카페 {cafe_idx}/{total_cafes}] {cafe.cafe_name} 완료")
         print(f"{'='*80}")
         self.logger.info(f"[카페 {cafe_idx}/{total_cafes}] {cafe.cafe_name} 완료")
 
+    def _run_assigned_cafes(self) -> Flow:
+        """담당 카페(assigned_cafes)를 순서대로 크롤링 (체크포인트 재개 포함)"""
+        assigned_cafe_names = self.account_info.assigned_cafes
+        cafes = [cafe for cafe in self.config.cafes if cafe.cafe_name in assigned_cafe_names]
+        total_cafes = len(cafes)
+
+        # 체크포인트 (같은 주차 출력이면 이어서)
+        output = self._get_output_basename()
+        if self.config.resume and self.checkpoint.load(output):
+            done = self.checkpoint.state.get('completed_cafes', [])
+            self.logger.info(f"체크포인트 재개: {self.checkpoint.path} (완료 카페 {len(done)}개)")
+            print(f"\n[{self.group_name}] ↻ 체크포인트에서 재개 (완료 카페 {len(done)}개)\n")
+        else:
+            self.checkpoint.start(output)
+
+        for cafe_idx, cafe in enumerate(cafes, 1):
+            if self.checkpoint.is_cafe_done(cafe.cafe_name):
+                self.logger.info(f"[카페 {cafe_idx}/{total_cafes}] {cafe.cafe_name} 완료됨, 건너뜀")
+                continue
+            try:
+                yield from self._crawl_cafe(cafe, cafe_idx, total_cafes)
+            except Exception as e:
+                self.logger.error(f"카페 크롤링 실패 ({cafe.cafe_name}): {e}")
+                print(f"\n❌ 카페 크롤링 실패 ({cafe.cafe_name}), 다음 카페로 이동\n")
+                continue
+
+        # 실패한 카페가 없을 때만 체크포인트 삭제
+        if all(self.checkpoint.is_cafe_done(cafe.cafe_name) for cafe in cafes):
+            self.checkpoint.clear()
+
     def run(self):
         """메인 실행"""
-        try:
-            with self.browser_context():
-                self._setup()
+        self._drive(self._run_steps())
 
-                # 담당 카페만 필터링
-                assigned_cafe_names = self.account_info.assigned_cafes
-                cafes = [cafe for cafe in self.config.cafes if cafe.cafe_name in assigned_cafe_names]
-                total_cafes = len(cafes)
+    def _run_steps(self) -> Flow:
+        """계정 1개 전체 흐름 (브라우저 시작 → 로그인 → 카페/작업 큐 → 정리)"""
+        for warning in self.profiler.start():
+            self.logger.warning(warning)
+        try:
+            try:
+                yield io('_start_browser')
+                yield from self._setup()
 
-                for cafe_idx, cafe in enumerate(cafes, 1):
-                    try:
-                        self._crawl_cafe(cafe, cafe_idx, total_cafes)
-                    except Exception as e:
-                        self.logger.error(f"카페 크롤링 실패 ({cafe.cafe_name}): {e}")
-                        print(f"\n❌ 카페 크롤링 실패 ({cafe.cafe_name}), 다음 카페로 이동\n")
-                        continue
+                if self.config.scheduler == 'queue':
+                    yield from self._run_work_queue()
+                else:
+                    yield from self._run_assigned_cafes()
+            finally:
+                yield io('_close_browser')
 
             self.logger.info("="*80)
             self.logger.info("크롤링 완료!")
@@ -1219,20 +2811,54 @@ class NaverCafeCrawler:
             self.logger.error(traceback.format_exc())
             print(f"\n❌ 치명적 오류: {e}\n")
 
+        finally:
+            self.logger.info(f"요청 간격 제어: {self.rate_controller.summary()}")
+            if self.config.memory_policy.enabled:
+                self.logger.info(f"메모리 정책: {self.memory_policy.summary()}")
+            self.logger.info(f"준비 대기: {self.wait_stats.summary()}")
+            self.logger.info(f"단계별 소요 시간: {self.metrics.summary()}")
+            self._write_metrics()
+            self._close_result_sinks()
+            for path in self.profiler.stop():
+                self.logger.info(f"프로파일 저장: {path}")
+            if self.http_fetcher:
+                self.http_fetcher.close()
+            if self.article_index:
+                self.article_index.close()
+            if self.work_queue:
+                self.work_queue.close()
+
+
+def open_work_run(config: CrawlerSettings) -> Optional[str]:
+    """작업 큐 모드면 카페 × 키워드 작업을 등록(또는 미완료 실행 재개)하고 run_id 반환"""
+    if config.scheduler != 'queue':
+        return None
+    queue = WorkQueue(Path(config.output_folder) / config.work_queue_db)
+    try:
+        run_id = queue.open_run([cafe.cafe_name for cafe in config.cafes], config.keywords, resume=config.resume)
+        print(f"작업 큐 실행: {run_id} ({queue.summary(run_id)})\n")
+        return run_id
+    finally:
+        queue.close()
+
 
-def run_crawler_for_account(account_info_dict: dict, config_path: str):
+def run_crawler_for_account(account_info_dict: dict, config_path: str, run_id: Optional[str] = None):
     """각 계정별로 크롤러를 실행하는 프로세스 함수"""
     try:
         account_info = AccountConfig(**account_info_dict)
         group_name = account_info.group_name
 
         print(f"\n[{group_name}] 프로세스 시작 (계정: {account_info.naver_id})")
-        print(f"[{group_name}] 담당 카페: {', '.join(account_info.assigned_cafes)}\n")
+        if run_id:
+            print(f"[{group_name}] 작업 큐 모드 (실행: {run_id})\n")
+        else:
+            print(f"[{group_name}] 담당 카페: {', '.join(account_info.assigned_cafes)}\n")
 
         crawler = NaverCafeCrawler(
             config_path=config_path,
             account_info=account_info,
-            group_name=group_name
+            group_name=group_name,
+            run_id=run_id
         )
         crawler.run()
 
@@ -1255,6 +2881,23 @@ def main():
             config_dict = json.load(f)
 
         config = CrawlerSettings(**config_dict)
+        started_at = time.time()
+
+        if config.engine == 'async':
+            # 모든 계정을 하나의 이벤트 루프에서 실행 (Playwright 드라이버/브라우저 공유)
+            from async_engine import run_async_engine
+
+            print(f"asyncio 엔진으로 {len(config.accounts)}개 계정 실행\n")
+            run_async_engine("config.json")
+
+            print("\n" + "="*80)
+            print("✅ 모든 크롤링 완료!")
+            print("="*80)
+            print("\n프로그램 종료")
+            return
+
+        # 작업 큐 모드: 모든 프로세스가 같은 실행의 작업을 나눠 가져감
+        run_id = open_work_run(config)
 
         # 계정별로 프로세스 생성
         processes = []
@@ -1262,7 +2905,7 @@ def main():
             account_dict = account.model_dump()
             p = multiprocessing.Process(
                 target=run_crawler_for_account,
-                args=(account_dict, "config.json")
+                args=(account_dict, "config.json", run_id)
             )
             processes.append(p)
             p.start()
@@ -1274,6 +2917,10 @@ def main():
         for p in processes:
             p.join()
 
+        # 계정(프로세스)별 지표 스냅샷을 합쳐 저장
+        if export_aggregate(Path(config.log_folder), [a.group_name for a in config.accounts], since=started_at):
+            print(f"📊 지표 저장: {Path(config.log_folder) / 'metrics.prom'}")
+
         print("\n" + "="*80)
         print("✅ 모든 크롤링 완료!")
         print("="*80)
@@ -0,0 +1,312 @@
+"""
+네이버 카페 게시글 HTTP 수집기
+- 브라우저 없이 로그인 세션 쿠키로 게시글/댓글 API 직접 호출
+- requests.Session 커넥션 풀 재사용
+- 응답 JSON을 파이썬에서 파싱하여 ArticleRecord / CommentRecord 반환
+"""
+
+import re
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Callable, List, Dict, Any, Optional, Tuple, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from models import ArticleRecord, CommentRecord
+
+DEFAULT_API_BASE_URL = 'https://apis.naver.com'
+ARTICLE_PATH = '/cafe-web/cafe-articleapi/v2.1/cafes/{cafe_id}/articles/{article_id}'
+COMMENTS_PATH = '/cafe-web/cafe-articleapi/v2/cafes/{cafe_id}/articles/{article_id}/comments/pages/{page}'
+COMMENTS_PARAMS = {'requestFrom': 'A', 'orderBy': 'asc'}
+
+# 브라우저가 보낸 게시글/댓글 API 요청 URL (게시글 응답에는 댓글 1페이지 포함)
+API_URL_PATTERN = re.compile(
+    r'/cafe-articleapi/v[\d.]+/cafes/(\d+)/articles/(\d+)(?:/comments/pages/(\d+))?/?(?:\?|$)'
+)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# 댓글 페이지 최대 조회 수 (무한 루프 방지)
+MAX_COMMENT_PAGES = 100
+
+# 좋아요 수가 들어올 수 있는 게시글 필드 (API 버전별 상이)
+LIKE_COUNT_KEYS = ('likeItCount', 'likeCount', 'sympathyCount')
+
+T = TypeVar('T')
+# API 요청 1건을 감싸 실행 (호출 측 요청 간격 대기/결과 기록용): hook(request) → request()의 결과
+RequestHook = Callable[[Callable[[], T]], T]
+
+
+class ArticleFetchError(Exception):
+    """HTTP 수집 실패 (호출 측에서 브라우저 수집으로 폴백)"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class _TextExtractor(HTMLParser):
+    """contentHtml에서 본문 텍스트만 추출"""
+
+    SKIP_TAGS = {'script', 'style'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in ('br', 'p', 'div', 'li'):
+            self.parts.append(' ')
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth > 0:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if self._skip_depth == 0:
+            self.parts.append(data)
+
+
+def html_to_text(content_html: str) -> str:
+    """HTML을 공백 정규화된 텍스트로 변환"""
+    if not content_html:
+        return ""
+    parser = _TextExtractor()
+    parser.feed(content_html)
+    parser.close()
+    return re.sub(r'\s+', ' ', ''.join(parser.parts)).strip()
+
+
+def format_timestamp(value: Any) -> str:
+    """API 타임스탬프(ms)를 화면 표기와 같은 'YYYY.MM.DD. HH:MM' 형식으로 변환"""
+    if not value:
+        return ""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000).strftime('%Y.%m.%d. %H:%M')
+    return str(value).strip()
+
+
+def parse_article(article: Dict[str, Any]) -> ArticleRecord:
+    """게시글 API 응답의 article 객체 파싱"""
+    writer = article.get('writer') or {}
+
+    likes = "0"
+    for key in LIKE_COUNT_KEYS:
+        if article.get(key) is not None:
+            likes = re.sub(r'\D', '', str(article[key])) or "0"
+            break
+
+    return ArticleRecord(
+        title=re.sub(r'\s+', ' ', article.get('subject') or '').strip(),
+        author=(writer.get('nick') or '').strip(),
+        date=format_timestamp(article.get('writeDate')),
+        content=html_to_text(article.get('contentHtml') or ''),
+        likes=likes
+    )
+
+
+def parse_comment_items(items: List[Dict[str, Any]]) -> List[CommentRecord]:
+    """댓글 API 응답의 items 배열 파싱 (삭제된 댓글 제외)"""
+    comments = []
+    for item in items:
+        if item.get('isDeleted'):
+            continue
+        text = re.sub(r'\s+', ' ', item.get('content') or '').strip()
+        if not text:
+            continue
+        writer = item.get('writer') or {}
+        # 답글은 refId가 부모 댓글 ID를 가리킴 (일반 댓글은 자기 자신)
+        ref_id = item.get('refId')
+        is_reply = ref_id is not None and ref_id != item.get('id')
+        comments.append(CommentRecord(
+            author=(writer.get('nick') or '').strip() or "익명",
+            text=text,
+            depth=1 if is_reply else 0,
+            date=format_timestamp(item.get('updateDate') or item.get('writeDate')) or None,
+            comment_id=str(item['id']) if item.get('id') is not None else None,
+            parent_id=str(ref_id) if is_reply else None
+        ))
+    return comments
+
+
+def match_api_url(url: str) -> Optional[Tuple[str, str, int]]:
+    """게시글/댓글 API URL이면 (카페 ID, 게시글 ID, 댓글 페이지) 반환 (게시글 응답은 1페이지)"""
+    match = API_URL_PATTERN.search(url)
+    if not match:
+        return None
+    return match.group(1), match.group(2), int(match.group(3) or 1)
+
+
+def unwrap_result(data: Any, url: str) -> Dict[str, Any]:
+    """API 응답 JSON의 result 반환 (오류 응답이거나 형식이 다르면 ArticleFetchError)"""
+    if not isinstance(data, dict):
+        raise ArticleFetchError(f"응답 형식 오류 ({type(data).__name__}): {url}")
+    if 'result' not in data:
+        message = data.get('message')
+        error = message.get('error') if isinstance(message, dict) else None
+        if not isinstance(error, dict):
+            raise ArticleFetchError(f"API 오류: {message or url}")
+        raise ArticleFetchError(f"API 오류 {error.get('code', '')}: {error.get('msg', url)}")
+    result = data['result']
+    if not isinstance(result, dict):
+        raise ArticleFetchError(f"응답 형식 오류 (result: {type(result).__name__}): {url}")
+    return result
+
+
+def comment_items(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """게시글/댓글 API result의 댓글 items (형식이 다르면 ArticleFetchError)"""
+    comments = result.get('comments') or {}
+    if not isinstance(comments, dict):
+        raise ArticleFetchError(f"응답 형식 오류 (comments: {type(comments).__name__})")
+    items = comments.get('items') or []
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ArticleFetchError("응답 형식 오류 (comments.items)")
+    return items
+
+
+def collect_comment_pages(
+    get_page: Callable[[int], Dict[str, Any]],
+    start_page: int = 1,
+    seen_ids: Optional[set] = None
+) -> List[CommentRecord]:
+    """댓글 페이지를 끝까지 조회해 파싱 (get_page: 페이지 번호 → API result)"""
+    comments = []
+    seen_ids = set(seen_ids or ())
+    for page in range(start_page, MAX_COMMENT_PAGES + 1):
+        items = comment_items(get_page(page))
+        # 마지막 페이지 이후 빈 목록 또는 같은 페이지 반복 시 종료
+        new_items = [item for item in items if item.get('id') not in seen_ids]
+        if not new_items:
+            break
+        seen_ids.update(item.get('id') for item in new_items)
+        comments.extend(parse_comment_items(new_items))
+    return comments
+
+
+class NaverCafeHttpFetcher:
+    """로그인 쿠키를 재사용하는 HTTP 게시글 수집기"""
+
+    def __init__(
+        self,
+        api_base_url: str = DEFAULT_API_BASE_URL,
+        pool_size: int = 4,
+        timeout: float = 10.0,
+        user_agent: str = DEFAULT_USER_AGENT
+    ):
+        self.api_base_url = api_base_url.rstrip('/')
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            'Accept': 'application/json, text/plain, */*',
+            'Referer': 'https://cafe.naver.com/'
+        })
+
+    def load_cookies(self, cookies: List[Dict[str, Any]]) -> int:
+        """Playwright 형식 쿠키(context.cookies() / 쿠키 파일)를 세션에 적용 - 적용한 개수 반환"""
+        self.session.cookies.clear()
+        count = 0
+        for cookie in cookies:
+            # 손상된 쿠키 파일의 잘못된 항목은 건너뜀
+            if not isinstance(cookie, dict) or 'name' not in cookie or 'value' not in cookie:
+                continue
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+            count += 1
+        return count
+
+    def _get_json(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        request_hook: Optional[RequestHook] = None
+    ) -> Dict[str, Any]:
+        """API 호출 후 JSON 반환 (실패 시 ArticleFetchError, request_hook이 있으면 요청을 감싸 실행)"""
+        if request_hook is not None:
+            return request_hook(lambda: self._get_json(path, params))
+
+        url = f"{self.api_base_url}{path}"
+        try:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise ArticleFetchError(f"요청 실패: {e}") from e
+
+        if response.status_code != 200:
+            raise ArticleFetchError(f"HTTP {response.status_code}: {url}", status=response.status_code)
+
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise ArticleFetchError(f"JSON 파싱 실패: {url}") from e
+
+        return unwrap_result(data, url)
+
+    def fetch_comments(
+        self,
+        cafe_id: str,
+        article_id: str,
+        start_page: int = 1,
+        seen_ids: Optional[set] = None,
+        request_hook: Optional[RequestHook] = None
+    ) -> List[CommentRecord]:
+        """댓글 API를 페이지 끝까지 조회 (페이지마다 request_hook 적용)"""
+        return collect_comment_pages(
+            lambda page: self._get_json(
+                COMMENTS_PATH.format(cafe_id=cafe_id, article_id=article_id, page=page),
+                params=COMMENTS_PARAMS,
+                request_hook=request_hook
+            ),
+            start_page=start_page,
+            seen_ids=seen_ids
+        )
+
+    def fetch_article(
+        self,
+        cafe_id: str,
+        article_id: str,
+        request_hook: Optional[RequestHook] = None
+    ) -> Tuple[ArticleRecord, List[CommentRecord]]:
+        """게시글 본문과 댓글 전체 수집 (request_hook: 게시글/댓글 페이지 요청마다 적용)"""
+        result = self._get_json(
+            ARTICLE_PATH.format(cafe_id=cafe_id, article_id=article_id),
+            params={'useCafeId': 'true', 'requestFrom': 'A'},
+            request_hook=request_hook
+        )
+
+        article = result.get('article')
+        if not article:
+            raise ArticleFetchError(f"게시글 없음 (권한 또는 삭제): {cafe_id}/{article_id}")
+        if not isinstance(article, dict):
+            raise ArticleFetchError(f"응답 형식 오류 (article: {type(article).__name__}): {cafe_id}/{article_id}")
+
+        try:
+            # 첫 페이지 댓글은 게시글 응답에 포함됨
+            first_items = comment_items(result)
+            comments = parse_comment_items(first_items)
+            if first_items:
+                comments.extend(self.fetch_comments(
+                    cafe_id, article_id, start_page=2,
+                    seen_ids={item.get('id') for item in first_items},
+                    request_hook=request_hook
+                ))
+            return parse_article(article), comments
+
+        except (TypeError, AttributeError, ValueError) as e:
+            # 필드 타입이 예상과 다른 응답 (API 변경 등)
+            raise ArticleFetchError(f"응답 파싱 실패 ({cafe_id}/{article_id}): {e}") from e
+
+    def close(self):
+        """세션 종료"""
+        self.session.close()
@@ -24,6 +24,9 @@ subprocess.Popen([
     "--user-data-dir=C:\\temp\\chrome_nayoonjae",
     "--no-first-run",
     "--no-default-browser-check",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
     f"--window-position=0,0",
     f"--window-size={win_w},{win_h}"
 ])
@@ -37,6 +40,9 @@ subprocess.Popen([
     "--user-data-dir=C:\\temp\\chrome_kimyoonj319",
     "--no-first-run",
     "--no-default-browser-check",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
     f"--window-position={win_w},0",
     f"--window-size={win_w},{win_h}"
 ])
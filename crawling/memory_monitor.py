@@ -0,0 +1,154 @@
+"""
+측정 메모리 기반 탭/컨텍스트/브라우저 재생성 정책
+- 탭 JS 힙: CDP Performance.getMetrics (JSHeapUsedSize)
+- 렌더러 RSS: CDP SystemInfo.getProcessInfo로 렌더러 PID 조회 후 psutil로 측정 (psutil 없으면 생략)
+- 파이썬 프로세스 RSS: psutil, 없으면 /proc/self/statm (리눅스)
+
+측정(CDP 호출)은 sync/async 크롤러가 각각 하고, 여기서는 값 변환과 판단만 한다.
+"""
+
+import os
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+try:
+    import psutil
+except ImportError:  # 선택 의존성 - 없으면 렌더러 RSS는 측정하지 않음
+    psutil = None
+
+MB = 1024 * 1024
+
+# 재생성 단위 (가벼운 순)
+RECYCLE_PAGE = 'page'
+RECYCLE_CONTEXT = 'context'
+RECYCLE_BROWSER = 'browser'
+
+
+class MemorySample(NamedTuple):
+    """측정값 (MB, 측정 불가 항목은 None)"""
+    js_heap_mb: Optional[float]
+    renderer_rss_mb: Optional[float]
+    process_rss_mb: Optional[float]
+
+    def describe(self) -> str:
+        def fmt(value):
+            return f"{value:.0f}MB" if value is not None else '-'
+        return f"JS 힙 {fmt(self.js_heap_mb)}, 렌더러 {fmt(self.renderer_rss_mb)}, 프로세스 {fmt(self.process_rss_mb)}"
+
+
+def js_heap_mb(metrics_result: Dict[str, Any]) -> Optional[float]:
+    """Performance.getMetrics 결과에서 사용 중인 JS 힙 (MB)"""
+    for metric in metrics_result.get('metrics', []):
+        if metric.get('name') == 'JSHeapUsedSize':
+            return metric.get('value', 0) / MB
+    return None
+
+
+def renderer_pids(process_info_result: Dict[str, Any]) -> List[int]:
+    """SystemInfo.getProcessInfo 결과 중 렌더러 프로세스 PID"""
+    return [
+        int(info['id']) for info in process_info_result.get('processInfo', [])
+        if info.get('type') == 'renderer' and info.get('id')
+    ]
+
+
+def rss_mb_of_pids(pids: Iterable[int]) -> Optional[float]:
+    """PID 목록의 RSS 합계 (MB, psutil 없거나 측정 불가면 None)"""
+    if psutil is None:
+        return None
+    total = 0
+    measured = False
+    for pid in pids:
+        try:
+            total += psutil.Process(pid).memory_info().rss
+            measured = True
+        except (psutil.Error, OSError):
+            continue
+    return total / MB if measured else None
+
+
+def process_rss_mb() -> Optional[float]:
+    """현재 파이썬 프로세스 RSS (MB)"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / MB
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / MB
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class MemoryPolicy:
+    """측정값으로 재생성 단위 결정
+
+    - 탭 JS 힙 초과 → 탭만 재생성 (로그인/컨텍스트 유지)
+    - 렌더러/프로세스 RSS 초과 또는 최대 사용 시간 초과 → 컨텍스트 재생성
+    - 컨텍스트를 재생성한 뒤에도 연속으로 RSS 초과 → 브라우저 재시작
+    - RSS를 전혀 측정할 수 없으면 (psutil 없는 Windows 등) max_age_seconds 대신 unmeasured_max_age_seconds 적용
+    """
+
+    def __init__(
+        self,
+        page_heap_mb: float,
+        renderer_rss_mb: float,
+        process_rss_mb: float,
+        browser_restart_after: int = 3,
+        max_age_seconds: Optional[float] = None,
+        unmeasured_max_age_seconds: Optional[float] = None
+    ):
+        self.page_heap_mb = page_heap_mb
+        self.renderer_rss_mb = renderer_rss_mb
+        self.process_rss_mb = process_rss_mb
+        self.browser_restart_after = browser_restart_after
+        self.max_age_seconds = max_age_seconds
+        self.unmeasured_max_age_seconds = unmeasured_max_age_seconds
+
+        self.over_rss_streak = 0
+        self.last_sample: Optional[MemorySample] = None
+        self.peak = {'js_heap_mb': 0.0, 'renderer_rss_mb': 0.0, 'process_rss_mb': 0.0}
+        self.samples = 0
+        self.actions = {RECYCLE_PAGE: 0, RECYCLE_CONTEXT: 0, RECYCLE_BROWSER: 0}
+
+    @staticmethod
+    def _over(value: Optional[float], limit: float) -> bool:
+        return value is not None and limit > 0 and value > limit
+
+    def decide(self, sample: MemorySample, age_seconds: float = 0) -> Optional[str]:
+        """재생성 단위 (필요 없으면 None)"""
+        self.samples += 1
+        self.last_sample = sample
+        for name, value in sample._asdict().items():
+            if value is not None:
+                self.peak[name] = max(self.peak[name], value)
+
+        over_rss = (self._over(sample.renderer_rss_mb, self.renderer_rss_mb)
+                    or self._over(sample.process_rss_mb, self.process_rss_mb))
+        if over_rss:
+            self.over_rss_streak += 1
+            if self.over_rss_streak > self.browser_restart_after:
+                return RECYCLE_BROWSER
+            return RECYCLE_CONTEXT
+        self.over_rss_streak = 0
+
+        max_age = self.max_age_seconds
+        if max_age is None and sample.renderer_rss_mb is None and sample.process_rss_mb is None:
+            # RSS 기준이 동작하지 않으면 고정 주기 재생성으로 대체
+            max_age = self.unmeasured_max_age_seconds
+        if max_age and age_seconds >= max_age:
+            return RECYCLE_CONTEXT
+        if self._over(sample.js_heap_mb, self.page_heap_mb):
+            return RECYCLE_PAGE
+        return None
+
+    def record(self, action: str):
+        """재생성 수행 기록 (브라우저 재시작 후에는 초과 횟수 초기화)"""
+        self.actions[action] += 1
+        if action == RECYCLE_BROWSER:
+            self.over_rss_streak = 0
+
+    def summary(self) -> str:
+        """로그용 요약 문자열"""
+        peak = MemorySample(**{name: value or None for name, value in self.peak.items()})
+        return (f"측정 {self.samples}회, 최대 {peak.describe()}, "
+                f"탭 재생성 {self.actions[RECYCLE_PAGE]}회, 컨텍스트 재생성 {self.actions[RECYCLE_CONTEXT]}회, "
+                f"브라우저 재시작 {self.actions[RECYCLE_BROWSER]}회")
@@ -0,0 +1,202 @@
+"""
+단계별 소요 시간/횟수 지표
+- 단계(stage)별 지연 히스토그램과 이벤트 카운터를 계정·카페 단위로 기록
+- 계정(프로세스)마다 log_folder/metrics_<그룹>.json 스냅샷 저장
+- main()이 모든 계정 스냅샷을 합쳐 metrics.json / metrics.prom (Prometheus 텍스트 형식) 저장
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 히스토그램 구간 상한 (초, 마지막 +Inf 구간은 별도)
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRIC_PREFIX = 'naver_cafe_crawler'
+
+SeriesKey = Tuple[str, str, str]  # (단계/이벤트, 계정, 카페)
+
+
+def _atomic_write(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class CrawlMetrics:
+    """계정별 지표 (단일 프로세스/이벤트 루프에서만 갱신)"""
+
+    def __init__(self, account: str):
+        self.account = account
+        self.cafe = ''  # 현재 처리 중인 카페 (observe/inc 기본값)
+        self.started_at = time.time()
+        # (단계, 계정, 카페) → {'buckets': [...], 'sum': 초, 'count': 횟수}
+        self.histograms: Dict[SeriesKey, Dict[str, Any]] = {}
+        # (이벤트, 계정, 카페) → 횟수
+        self.counters: Dict[SeriesKey, float] = {}
+
+    def observe(self, stage: str, seconds: float, cafe: Optional[str] = None):
+        """단계 소요 시간 기록"""
+        key = (stage, self.account, self.cafe if cafe is None else cafe)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = {'buckets': [0] * (len(BUCKETS) + 1), 'sum': 0.0, 'count': 0}
+        index = next((i for i, bound in enumerate(BUCKETS) if seconds <= bound), len(BUCKETS))
+        histogram['buckets'][index] += 1
+        histogram['sum'] += seconds
+        histogram['count'] += 1
+
+    def inc(self, event: str, value: float = 1, cafe: Optional[str] = None):
+        """이벤트 횟수 증가"""
+        key = (event, self.account, self.cafe if cafe is None else cafe)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def timer(self, stage: str, cafe: Optional[str] = None):
+        """with 블록 소요 시간 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started, cafe)
+
+    # ---- 스냅샷 ----
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'account': self.account,
+            'started_at': self.started_at,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+            'buckets': list(BUCKETS),
+            'histograms': [
+                {'stage': stage, 'account': account, 'cafe': cafe, **values}
+                for (stage, account, cafe), values in sorted(self.histograms.items())
+            ],
+            'counters': [
+                {'event': event, 'account': account, 'cafe': cafe, 'value': value}
+                for (event, account, cafe), value in sorted(self.counters.items())
+            ]
+        }
+
+    def merge_snapshot(self, snapshot: Dict[str, Any]):
+        """다른 계정 스냅샷 합치기 (구간 정의가 다르면 무시)"""
+        if snapshot.get('buckets') != list(BUCKETS):
+            return
+        for item in snapshot.get('histograms', []):
+            key = (item['stage'], item['account'], item['cafe'])
+            histogram = self.histograms.setdefault(key, {'buckets': [0] * (len(BUCKETS) + 1), 'sum': 0.0, 'count': 0})
+            histogram['buckets'] = [a + b for a, b in zip(histogram['buckets'], item['buckets'])]
+            histogram['sum'] += item['sum']
+            histogram['count'] += item['count']
+        for item in snapshot.get('counters', []):
+            key = (item['event'], item['account'], item['cafe'])
+            self.counters[key] = self.counters.get(key, 0) + item['value']
+
+    def write(self, log_folder: Path) -> Path:
+        """계정 스냅샷 저장 (log_folder/metrics_<그룹>.json)"""
+        path = Path(log_folder) / f"metrics_{self.account}.json"
+        _atomic_write(path, json.dumps(self.snapshot(), ensure_ascii=False))
+        return path
+
+    # ---- Prometheus 텍스트 형식 ----
+
+    def to_prometheus(self) -> str:
+        lines = [
+            f"# HELP {METRIC_PREFIX}_stage_seconds 단계별 소요 시간",
+            f"# TYPE {METRIC_PREFIX}_stage_seconds histogram"
+        ]
+        for (stage, account, cafe), histogram in sorted(self.histograms.items()):
+            labels = _labels(stage=stage, account=account, cafe=cafe)
+            cumulative = 0
+            for bound, count in zip(list(BUCKETS) + ['+Inf'], histogram['buckets']):
+                cumulative += count
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{METRIC_PREFIX}_stage_seconds_sum{{{labels}}} {histogram['sum']:.6f}")
+            lines.append(f"{METRIC_PREFIX}_stage_seconds_count{{{labels}}} {histogram['count']}")
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_events_total 이벤트 횟수",
+            f"# TYPE {METRIC_PREFIX}_events_total counter"
+        ]
+        for (event, account, cafe), value in sorted(self.counters.items()):
+            lines.append(f"{METRIC_PREFIX}_events_total{{{_labels(event=event, account=account, cafe=cafe)}}} {value:g}")
+        return '\n'.join(lines) + '\n'
+
+    def stage_stats(self) -> Dict[str, Dict[str, float]]:
+        """단계별 합계 (계정/카페 합산) - count, total, mean, p50, p95 (초, 분위수는 구간 상한 기준 근사)"""
+        merged: Dict[str, Dict[str, Any]] = {}
+        for (stage, _, _), histogram in self.histograms.items():
+            total = merged.setdefault(stage, {'buckets': [0] * (len(BUCKETS) + 1), 'sum': 0.0, 'count': 0})
+            total['buckets'] = [a + b for a, b in zip(total['buckets'], histogram['buckets'])]
+            total['sum'] += histogram['sum']
+            total['count'] += histogram['count']
+
+        stats = {}
+        for stage, total in merged.items():
+            count = total['count']
+            stats[stage] = {
+                'count': count,
+                'total': total['sum'],
+                'mean': total['sum'] / count if count else 0.0,
+                'p50': bucket_quantile(total['buckets'], 0.5),
+                'p95': bucket_quantile(total['buckets'], 0.95)
+            }
+        return stats
+
+    def summary(self, top: int = 5) -> str:
+        """로그용 요약 (총 소요 시간이 큰 단계 순)"""
+        ranked = sorted(self.stage_stats().items(), key=lambda item: item[1]['total'], reverse=True)[:top]
+        return ', '.join(f"{stage} {values['total']:.1f}초/{values['count']}회" for stage, values in ranked) or '-'
+
+
+def bucket_quantile(buckets: List[int], q: float) -> float:
+    """히스토그램 구간 횟수로 분위수 근사 (해당 구간 상한, 마지막 구간이면 inf)"""
+    count = sum(buckets)
+    if count == 0:
+        return 0.0
+    rank = q * count
+    cumulative = 0
+    for bound, bucket_count in zip(list(BUCKETS) + [float('inf')], buckets):
+        cumulative += bucket_count
+        if cumulative >= rank:
+            return bound
+    return float('inf')
+
+
+def _labels(**labels: str) -> str:
+    def escape(value: str) -> str:
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return ','.join(f'{name}="{escape(value)}"' for name, value in labels.items())
+
+
+def export_aggregate(log_folder: Path, accounts: Iterable[str], since: float = 0) -> Optional[CrawlMetrics]:
+    """계정별 스냅샷을 합쳐 log_folder/metrics.json, metrics.prom 저장
+
+    since 이전에 시작된 실행의 스냅샷(이전 실행에서 남은 파일)은 제외한다.
+    """
+    log_folder = Path(log_folder)
+    merged = CrawlMetrics('all')
+    found = False
+    for account in accounts:
+        path = log_folder / f"metrics_{account}.json"
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if snapshot.get('started_at', 0) < since:
+            continue
+        merged.merge_snapshot(snapshot)
+        found = True
+
+    if not found:
+        return None
+    _atomic_write(log_folder / 'metrics.json', json.dumps(merged.snapshot(), ensure_ascii=False))
+    _atomic_write(log_folder / 'metrics.prom', merged.to_prometheus())
+    return merged
@@ -0,0 +1,408 @@
+"""
+오프라인 벤치마크용 모의 네이버 카페 서버
+- 검색 결과 화면 (/f-e/cafes/<id>/menus/0?q=..&page=..) - 게시글 링크/댓글 수/날짜 목록, 페이지 끝나면 빈 목록
+- 게시글 화면 (/f-e/cafes/<id>/articles/<n>) - 카페 화면 + 게시글 iframe (/ca-fe/cafes/<id>/articles/<n>)
+- 게시글 iframe 문서 - 게시글 API를 불러와 제목(h3.title_text)/본문(.se-main-container)/댓글 1페이지(li.CommentItem) 렌더링,
+  댓글 버튼(a.button_comment) 클릭 시 나머지 댓글 페이지를 API로 불러와 추가
+- 게시글/댓글 API (/cafe-web/cafe-articleapi/...) - http_fetcher와 같은 응답 형식 (fetch_engine=http, comment_source=network 확인용)
+
+모든 응답에 지연(latency_ms ± jitter_ms)을 넣을 수 있고, 게시글/댓글 내용은 seed 기준으로 항상 같게 생성한다.
+단독 실행: python mock_cafe_server.py --port 8900 --latency-ms 80
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from pydantic import BaseModel, Field
+
+# 게시글 작성 시각 기준 (모든 실행에서 같은 날짜가 나오도록 고정)
+BASE_TIME = datetime(2025, 1, 6, 9, 0)
+
+SEARCH_PATH = re.compile(r'^/f-e/cafes/(\d+)/menus/\d+/?$')
+ARTICLE_SHELL_PATH = re.compile(r'^/f-e/cafes/(\d+)/articles/(\d+)/?$')
+ARTICLE_FRAME_PATH = re.compile(r'^/ca-fe/cafes/(\d+)/articles/(\d+)/?$')
+ARTICLE_API_PATH = re.compile(r'^/cafe-web/cafe-articleapi/v[\d.]+/cafes/(\d+)/articles/(\d+)/?$')
+COMMENTS_API_PATH = re.compile(r'^/cafe-web/cafe-articleapi/v[\d.]+/cafes/(\d+)/articles/(\d+)/comments/pages/(\d+)/?$')
+
+
+class MockCafeOptions(BaseModel):
+    """모의 카페 데이터/응답 설정"""
+    articles_per_keyword: int = Field(default=100, ge=0, description="키워드별 검색 결과 게시글 수")
+    overlap: float = Field(default=0.5, ge=0, le=1, description="키워드 간 게시글이 겹치는 정도 (0: 겹치지 않음)")
+    page_size: int = Field(default=50, ge=1, description="검색 결과 페이지당 게시글 수")
+    comments_min: int = Field(default=0, ge=0, description="게시글당 최소 댓글 수")
+    comments_max: int = Field(default=30, ge=0, description="게시글당 최대 댓글 수")
+    comment_page_size: int = Field(default=20, ge=1, description="댓글 API/화면 페이지당 댓글 수")
+    reply_every: int = Field(default=4, ge=0, description="n번째 댓글마다 직전 댓글의 답글 (0: 답글 없음)")
+    paragraphs: int = Field(default=5, ge=1, description="본문 문단 수")
+    latency_ms: int = Field(default=50, ge=0, description="화면 응답 지연")
+    api_latency_ms: Optional[int] = Field(default=None, ge=0, description="API 응답 지연 (없으면 latency_ms)")
+    jitter_ms: int = Field(default=0, ge=0, description="지연에 더하는 무작위 값 범위 (±)")
+    seed: int = Field(default=0, description="게시글/댓글 생성 seed")
+
+
+class MockCafe:
+    """seed 기준으로 항상 같은 검색 결과/게시글/댓글을 만드는 데이터 생성기"""
+
+    def __init__(self, options: MockCafeOptions):
+        self.options = options
+
+    def _rng(self, *parts: Any) -> random.Random:
+        return random.Random(':'.join(str(part) for part in (self.options.seed,) + parts))
+
+    def article_ids(self, cafe_id: str, keyword: str) -> List[int]:
+        """키워드 검색 결과 게시글 ID (최신순)"""
+        count = self.options.articles_per_keyword
+        if count == 0:
+            return []
+        overlap = self.options.overlap
+        if overlap > 0:
+            # 키워드마다 같은 범위(count / overlap개)에서 뽑음 → 두 키워드의 평균 중복 비율이 overlap
+            start, pool = 1000, -(-count // overlap)
+        else:
+            start, pool = 1000 + (zlib.crc32(f"{cafe_id}:{keyword}".encode('utf-8')) % 100000) * count, count
+        ids = self._rng(cafe_id, keyword).sample(range(start, start + int(pool)), count)
+        return sorted(ids, reverse=True)
+
+    def search_page(self, cafe_id: str, keyword: str, page: int, size: Optional[int] = None) -> List[int]:
+        size = min(size or self.options.page_size, self.options.page_size)
+        ids = self.article_ids(cafe_id, keyword)
+        start = (page - 1) * size
+        return ids[start:start + size] if page >= 1 else []
+
+    def comment_count(self, cafe_id: str, article_id: int) -> int:
+        low = self.options.comments_min
+        high = max(self.options.comments_max, low)
+        return self._rng(cafe_id, article_id, 'comments').randint(low, high)
+
+    def written_at(self, article_id: int) -> datetime:
+        return BASE_TIME + timedelta(minutes=article_id * 7)
+
+    def article(self, cafe_id: str, article_id: int) -> Dict[str, Any]:
+        """게시글 API의 article 객체"""
+        rng = self._rng(cafe_id, article_id, 'article')
+        paragraphs = [
+            f"모의 게시글 {article_id}의 {index + 1}번째 문단입니다. " + '내용 ' * rng.randint(10, 40)
+            for index in range(self.options.paragraphs)
+        ]
+        return {
+            'id': article_id,
+            'subject': f"[모의] 게시글 {article_id} 제목",
+            'writer': {'nick': f"작성자{article_id % 97}"},
+            'writeDate': int(self.written_at(article_id).timestamp() * 1000),
+            'contentHtml': ''.join(f"<p>{escape(text)}</p>" for text in paragraphs),
+            'likeItCount': rng.randint(0, 50),
+            'commentCount': self.comment_count(cafe_id, article_id)
+        }
+
+    def comments(self, cafe_id: str, article_id: int) -> List[Dict[str, Any]]:
+        """댓글 전체 (답글은 부모 댓글 바로 뒤, refId = 부모 ID)"""
+        items = []
+        parent_id = None
+        written_at = self.written_at(article_id)
+        for index in range(self.comment_count(cafe_id, article_id)):
+            comment_id = article_id * 1000 + index + 1
+            is_reply = bool(self.options.reply_every) and parent_id is not None and (index + 1) % self.options.reply_every == 0
+            if not is_reply:
+                parent_id = comment_id
+            items.append({
+                'id': comment_id,
+                'refId': parent_id,
+                'writer': {'nick': f"댓글러{comment_id % 53}"},
+                'content': f"{'답글' if is_reply else '댓글'} {index + 1} (게시글 {article_id})",
+                'writeDate': int((written_at + timedelta(minutes=index + 1)).timestamp() * 1000),
+                'isDeleted': False
+            })
+        return items
+
+    def comment_page(self, cafe_id: str, article_id: int, page: int) -> List[Dict[str, Any]]:
+        size = self.options.comment_page_size
+        return self.comments(cafe_id, article_id)[(page - 1) * size:page * size] if page >= 1 else []
+
+
+# ---- 화면 ----
+
+SEARCH_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>모의 카페 검색</title></head>
+<body>
+<div class="cafe_header">모의 카페 {cafe_id}</div>
+<div class="article-board">
+<table><tbody>
+{rows}
+</tbody></table>
+</div>
+<div class="prev-next">{pages}</div>
+</body></html>
+"""
+
+SEARCH_ROW_TEMPLATE = """<tr>
+<td class="td_article"><div class="inner_list"><a class="article" href="/f-e/cafes/{cafe_id}/articles/{article_id}?referrerAllArticles=false">{title}</a><span class="cmt">[{comment_count}]</span></div></td>
+<td class="td_date">{date}</td>
+</tr>"""
+
+SHELL_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>모의 카페</title></head>
+<body>
+<div class="cafe_header">모의 카페 {cafe_id}</div>
+<div class="cafe_menu">{menus}</div>
+<iframe id="cafe_main" name="cafe_main" src="/ca-fe/cafes/{cafe_id}/articles/{article_id}?useCafeId=true" width="860" height="2000" frameborder="0"></iframe>
+</body></html>
+"""
+
+# 게시글 API를 불러와 렌더링 (실제 화면처럼 제목/댓글은 스크립트가 채움)
+ARTICLE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>모의 게시글</title></head>
+<body>
+<div id="app"></div>
+<script>
+const API = '/cafe-web/cafe-articleapi';
+const cafeId = '{cafe_id}';
+const articleId = '{article_id}';
+const text = (value) => String(value).replace(/[&<>"]/g, (c) => ({{'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}})[c]);
+const fmt = (ms) => {{
+    const d = new Date(ms);
+    const pad = (n) => String(n).padStart(2, '0');
+    return `${{d.getFullYear()}}.${{pad(d.getMonth() + 1)}}.${{pad(d.getDate())}}. ${{pad(d.getHours())}}:${{pad(d.getMinutes())}}`;
+}};
+let nextPage = 2;
+let loading = false;
+
+function renderComments(items) {{
+    const list = document.querySelector('ul.comment_list');
+    for (const item of items) {{
+        const li = document.createElement('li');
+        li.className = item.refId !== item.id ? 'CommentItem CommentItem--reply' : 'CommentItem';
+        li.innerHTML = `<div class="comment_box"><a class="comment_nickname">${{text(item.writer.nick)}}</a>`
+            + `<p class="comment_text_box"><span class="text_comment">${{text(item.content)}}</span></p>`
+            + `<span class="comment_info_date">${{fmt(item.writeDate)}}</span></div>`;
+        list.appendChild(li);
+    }}
+}}
+
+async function loadMoreComments(event) {{
+    if (event) event.preventDefault();
+    if (loading || nextPage === null) return;
+    loading = true;
+    while (nextPage !== null) {{
+        const response = await fetch(`${{API}}/v2/cafes/${{cafeId}}/articles/${{articleId}}/comments/pages/${{nextPage}}?requestFrom=A&orderBy=asc`);
+        const items = (await response.json()).result.comments.items;
+        if (items.length === 0) {{
+            nextPage = null;
+            break;
+        }}
+        renderComments(items);
+        nextPage += 1;
+    }}
+    loading = false;
+}}
+
+async function loadArticle() {{
+    const response = await fetch(`${{API}}/v2.1/cafes/${{cafeId}}/articles/${{articleId}}?useCafeId=true&requestFrom=A`);
+    const result = (await response.json()).result;
+    const article = result.article;
+    document.getElementById('app').innerHTML = `
+        <div class="ArticleContentBox">
+            <div class="article_header">
+                <h3 class="title_text">${{text(article.subject)}}</h3>
+                <div class="profile_area"><button class="nickname">${{text(article.writer.nick)}}</button></div>
+                <div class="article_info"><span class="date">${{fmt(article.writeDate)}}</span></div>
+            </div>
+            <div class="article_container"><div class="se-main-container">${{article.contentHtml}}</div></div>
+            <div class="ReplyBox">
+                <a href="#" class="like_article"><em class="u_cnt _count">${{article.likeItCount}}</em></a>
+                <a href="#" class="button_comment">댓글 <strong class="num">${{article.commentCount}}</strong></a>
+            </div>
+            <div class="CommentBox"><ul class="comment_list"></ul></div>
+        </div>`;
+    renderComments(result.comments.items);
+    if (result.comments.items.length === 0) nextPage = null;
+    document.querySelector('a.button_comment').addEventListener('click', loadMoreComments);
+}}
+
+loadArticle();
+</script>
+</body></html>
+"""
+
+
+class MockCafeHandler(BaseHTTPRequestHandler):
+    """경로별 화면/API 응답 (모든 응답에 설정된 지연 적용)"""
+
+    protocol_version = 'HTTP/1.1'
+    server: 'MockCafeServer'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        path = parsed.path
+        cafe = self.server.cafe
+
+        match = COMMENTS_API_PATH.match(path)
+        if match:
+            cafe_id, article_id, page = match.group(1), int(match.group(2)), int(match.group(3))
+            items = cafe.comment_page(cafe_id, article_id, page)
+            return self._send_json('comments_api', {'result': {'comments': {'items': items}}})
+
+        match = ARTICLE_API_PATH.match(path)
+        if match:
+            cafe_id, article_id = match.group(1), int(match.group(2))
+            return self._send_json('article_api', {'result': {
+                'article': cafe.article(cafe_id, article_id),
+                'comments': {'items': cafe.comment_page(cafe_id, article_id, 1)}
+            }})
+
+        match = SEARCH_PATH.match(path)
+        if match:
+            return self._send_html('search', self._render_search(match.group(1), query))
+
+        match = ARTICLE_SHELL_PATH.match(path)
+        if match:
+            menus = ''.join(f'<a href="/f-e/cafes/{match.group(1)}/menus/{n}">메뉴 {n}</a>' for n in range(1, 11))
+            return self._send_html('article_shell', SHELL_TEMPLATE.format(
+                cafe_id=match.group(1), article_id=match.group(2), menus=menus
+            ))
+
+        match = ARTICLE_FRAME_PATH.match(path)
+        if match:
+            return self._send_html('article_frame', ARTICLE_TEMPLATE.format(
+                cafe_id=match.group(1), article_id=match.group(2)
+            ))
+
+        self._send('not_found', 404, 'text/plain; charset=utf-8', b'not found')
+
+    def _render_search(self, cafe_id: str, query: Dict[str, str]) -> str:
+        cafe = self.server.cafe
+        keyword = query.get('q', '')
+        page = int(query.get('page', '1') or 1)
+        size = int(query.get('size', '0') or 0) or None
+        rows = []
+        for article_id in cafe.search_page(cafe_id, keyword, page, size):
+            rows.append(SEARCH_ROW_TEMPLATE.format(
+                cafe_id=cafe_id,
+                article_id=article_id,
+                title=escape(f"[모의] 게시글 {article_id} 제목"),
+                comment_count=cafe.comment_count(cafe_id, article_id),
+                date=cafe.written_at(article_id).strftime('%Y.%m.%d.')
+            ))
+        total_pages = -(-len(cafe.article_ids(cafe_id, keyword)) // cafe.options.page_size)
+        pages = ''.join(f'<a class="page" data-page="{n}">{n}</a>' for n in range(1, total_pages + 1))
+        return SEARCH_TEMPLATE.format(cafe_id=cafe_id, rows='\n'.join(rows), pages=pages)
+
+    def _delay(self, route: str):
+        options = self.server.cafe.options
+        latency = options.latency_ms
+        if route.endswith('_api') and options.api_latency_ms is not None:
+            latency = options.api_latency_ms
+        if options.jitter_ms:
+            latency += random.uniform(-options.jitter_ms, options.jitter_ms)
+        if latency > 0:
+            time.sleep(latency / 1000)
+
+    def _send_html(self, route: str, html: str):
+        self._send(route, 200, 'text/html; charset=utf-8', html.encode('utf-8'))
+
+    def _send_json(self, route: str, data: Dict[str, Any]):
+        self._send(route, 200, 'application/json; charset=utf-8', json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+    def _send(self, route: str, status: int, content_type: str, body: bytes):
+        self._delay(route)
+        self.server.record(route)
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MockCafeServer(ThreadingHTTPServer):
+    """백그라운드 스레드에서 실행되는 모의 카페 서버 (port=0이면 빈 포트 사용)"""
+
+    daemon_threads = True
+
+    def __init__(self, options: Optional[MockCafeOptions] = None, host: str = '127.0.0.1', port: int = 0):
+        super().__init__((host, port), MockCafeHandler)
+        self.cafe = MockCafe(options or MockCafeOptions())
+        self.request_counts: Counter = Counter()
+        self._counts_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, route: str):
+        with self._counts_lock:
+            self.request_counts[route] += 1
+
+    def start(self) -> 'MockCafeServer':
+        self._thread = threading.Thread(target=self.serve_forever, name='mock-cafe-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> 'MockCafeServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def add_option_arguments(parser: argparse.ArgumentParser):
+    """MockCafeOptions 필드를 명령행 인자로 추가 (--articles-per-keyword 형식)"""
+    for name, field in MockCafeOptions.model_fields.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            dest=name,
+            type=float if field.annotation is float else int,
+            default=None,
+            help=f"{field.description} (기본값 {field.default})"
+        )
+
+
+def options_from_args(args: argparse.Namespace) -> MockCafeOptions:
+    values = {name: getattr(args, name) for name in MockCafeOptions.model_fields if getattr(args, name, None) is not None}
+    return MockCafeOptions(**values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 네이버 카페 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8900)
+    add_option_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockCafeServer(options_from_args(args), host=args.host, port=args.port)
+    print(f"모의 카페 서버: {server.base_url} (Ctrl+C로 종료)")
+    print(f"설정: cafe_base_url / api_base_url = \"{server.base_url}\"")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"요청 수: {dict(server.request_counts)}")
+
+
+if __name__ == "__main__":
+    main()
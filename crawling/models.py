@@ -0,0 +1,90 @@
+"""
+수집 데이터 모델 정의
+"""
+
+import re
+from typing import NamedTuple, Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+from pydantic import BaseModel
+
+CAFE_BASE_URL = 'https://cafe.naver.com'
+
+
+class ArticleRecord(BaseModel):
+    """게시글 기본 정보"""
+    title: str = ""
+    author: str = ""
+    date: str = ""
+    content: str = ""
+    likes: str = "0"
+
+
+class CommentRecord(BaseModel):
+    """댓글 정보"""
+    author: str = "익명"
+    text: str = ""
+    depth: int = 0
+    date: Optional[str] = None
+    comment_id: Optional[str] = None
+    parent_id: Optional[str] = None  # 답글이면 부모 댓글 ID (API 수집 시에만)
+
+    def to_line(self) -> str:
+        """엑셀 출력용 "작성자 : 내용" 문자열"""
+        return f"{self.author} : {self.text}"
+
+
+class ArticleKey(NamedTuple):
+    """게시글 정규화 키 (cafe_id, article_id) - 중복 체크/출력/인덱스 공통"""
+    cafe_id: str
+    article_id: str
+
+    def __str__(self) -> str:
+        return f"{self.cafe_id}:{self.article_id}"
+
+    @property
+    def url(self) -> str:
+        """출력/방문용 정규 URL"""
+        return f"{CAFE_BASE_URL}/f-e/cafes/{self.cafe_id}/articles/{self.article_id}"
+
+    @property
+    def frame_url(self) -> str:
+        """카페 화면 없이 게시글 본문만 있는 iframe 문서 URL"""
+        return f"{CAFE_BASE_URL}/ca-fe/cafes/{self.cafe_id}/articles/{self.article_id}"
+
+    @classmethod
+    def from_url(cls, url: str, cafe_id: Optional[str] = None) -> Optional['ArticleKey']:
+        """게시글 URL 변형(/f-e/, /ca-fe/, ArticleRead, 카페별 주소, 쿼리 포함)을 키로 변환
+
+        카페 ID가 URL에 없는 형식(cafe.naver.com/<카페주소>/<글번호>)은 cafe_id 인자를 사용한다.
+        """
+        if not url:
+            return None
+
+        # iframe_url 등으로 한 번 더 인코딩된 경우 해제
+        url = unquote(url)
+        parsed = urlparse(url)
+
+        match = re.search(r'/cafes/(\d+)/articles/(\d+)', parsed.path)
+        if match:
+            return cls(match.group(1), match.group(2))
+
+        query = parse_qs(parsed.query)
+        article_id = query.get('articleid', [''])[0]
+        if article_id.isdigit():
+            # URL에 있는 clubid 우선 (iframe_url 안이라 쿼리로 분리되지 않은 경우 포함), 없을 때만 인자 사용
+            club_match = re.search(r'clubid=(\d+)', url, re.IGNORECASE)
+            club_id = club_match.group(1) if club_match else cafe_id
+            if club_id:
+                return cls(club_id, article_id)
+
+        # iframe_url=/ArticleRead.nhn?clubid=...&articleid=... 형태
+        match = re.search(r'clubid=(\d+).*?articleid=(\d+)', url, re.IGNORECASE)
+        if match:
+            return cls(match.group(1), match.group(2))
+
+        match = re.fullmatch(r'/[\w.-]+/(\d+)/?', parsed.path)
+        if match and cafe_id:
+            return cls(cafe_id, match.group(1))
+
+        return None
@@ -0,0 +1,148 @@
+"""
+선택적 프로파일링 (설정 profiling, 기본 꺼짐)
+- cProfile: 실행 전체의 파이썬 호출 통계 → profile_<그룹>_<시각>.prof (+ 누적 시간 상위 목록 .txt)
+- tracemalloc: 브라우저 재시작/컨텍스트 재생성마다 스냅샷 → tracemalloc_<그룹>_<시각>_<n>.snapshot,
+  직전 스냅샷 대비 증가량 상위 항목은 로그로 출력
+- Playwright tracing: trace_after_articles개 처리 후부터 trace_articles개 게시글 구간 → trace_<그룹>_<시각>.zip
+  (playwright show-trace로 확인)
+
+모든 파일은 log_folder에 저장한다. 트레이싱 시작/종료(Playwright 호출)는 sync/async 크롤러가 각각 하고,
+여기서는 구간 판단과 파일 저장만 한다.
+"""
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# 통계 텍스트/스냅샷 비교 로그에 남길 항목 수
+PROFILE_TOP = 50
+TRACEMALLOC_TOP = 10
+
+
+class CrawlProfiler:
+    """계정 1개의 프로파일링 상태 (꺼진 항목은 아무것도 하지 않음)"""
+
+    def __init__(
+        self,
+        log_folder: Path,
+        group_name: str,
+        cprofile: bool = False,
+        tracemalloc_frames: int = 0,
+        trace_articles: int = 0,
+        trace_after_articles: int = 0
+    ):
+        self.log_folder = Path(log_folder)
+        self.group_name = group_name
+        self.cprofile = cprofile
+        self.tracemalloc_frames = tracemalloc_frames
+        self.trace_articles = trace_articles
+        self.trace_after_articles = trace_after_articles
+
+        self.profile: Optional[cProfile.Profile] = None
+        self.owns_tracemalloc = False
+        self.last_snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_count = 0
+
+        self.articles_seen = 0
+        self.trace_path: Optional[Path] = None  # 트레이싱 중이면 저장할 경로
+        self.trace_done = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.cprofile or self.tracemalloc_frames > 0 or self.trace_articles > 0
+
+    def dump_path(self, kind: str, suffix: str) -> Path:
+        """log_folder/<종류>_<그룹>_<시각><접미사>"""
+        self.log_folder.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return self.log_folder / f"{kind}_{self.group_name}_{timestamp}{suffix}"
+
+    def start(self) -> List[str]:
+        """cProfile/tracemalloc 시작 - 시작하지 못한 항목의 사유 목록 반환"""
+        warnings = []
+        if self.cprofile:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+                self.profile = profile
+            except ValueError as e:
+                # 같은 스레드에서 다른 프로파일러가 실행 중 (async 엔진의 다른 계정 등)
+                warnings.append(f"cProfile 시작 실패: {e}")
+        if self.tracemalloc_frames > 0:
+            # 이미 추적 중이면 (async 엔진이 먼저 시작) 스냅샷만 저장하고 종료는 시작한 쪽에 맡김
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.tracemalloc_frames)
+                self.owns_tracemalloc = True
+            self.last_snapshot = tracemalloc.take_snapshot()
+        return warnings
+
+    def stop(self) -> List[str]:
+        """cProfile 통계와 마지막 tracemalloc 스냅샷 저장 - 저장한 파일 경로 목록 반환"""
+        saved = []
+        if self.profile:
+            self.profile.disable()
+            path = self.dump_path('profile', '.prof')
+            self.profile.dump_stats(str(path))
+            text = io.StringIO()
+            pstats.Stats(self.profile, stream=text).sort_stats('cumulative').print_stats(PROFILE_TOP)
+            path.with_suffix('.txt').write_text(text.getvalue(), encoding='utf-8')
+            saved.append(str(path))
+            self.profile = None
+        if self.tracemalloc_frames > 0 and tracemalloc.is_tracing():
+            path, _ = self.snapshot_memory()
+            saved.append(str(path))
+            if self.owns_tracemalloc:
+                tracemalloc.stop()
+                self.owns_tracemalloc = False
+        return saved
+
+    def snapshot_memory(self) -> Optional[Tuple[Path, str]]:
+        """tracemalloc 스냅샷 저장 - (경로, 직전 스냅샷 대비 증가 상위 항목 문자열), 꺼져 있으면 None"""
+        if self.tracemalloc_frames <= 0 or not tracemalloc.is_tracing():
+            return None
+        snapshot = tracemalloc.take_snapshot()
+        self.snapshot_count += 1
+        path = self.dump_path('tracemalloc', f"_{self.snapshot_count}.snapshot")
+        snapshot.dump(str(path))
+
+        growth = ''
+        if self.last_snapshot is not None:
+            stats = snapshot.compare_to(self.last_snapshot, 'lineno')[:TRACEMALLOC_TOP]
+            growth = '\n'.join(str(stat) for stat in stats)
+        self.last_snapshot = snapshot
+        return path, growth
+
+    # ---- Playwright 트레이싱 구간 ----
+
+    @property
+    def tracing(self) -> bool:
+        return self.trace_path is not None
+
+    def trace_action(self) -> Optional[str]:
+        """지금 트레이싱을 시작('start')/종료('stop')해야 하는지 (한 실행에 구간 1개)"""
+        if self.trace_articles <= 0 or self.trace_done:
+            return None
+        if self.tracing:
+            if self.articles_seen >= self.trace_after_articles + self.trace_articles:
+                return 'stop'
+            return None
+        if self.articles_seen >= self.trace_after_articles:
+            return 'start'
+        return None
+
+    def article_done(self):
+        self.articles_seen += 1
+
+    def trace_started(self) -> Path:
+        self.trace_path = self.dump_path('trace', '.zip')
+        return self.trace_path
+
+    def trace_stopped(self) -> Optional[Path]:
+        """트레이싱 종료 처리 (이후 구간은 다시 시작하지 않음) - 저장 경로 반환"""
+        path, self.trace_path = self.trace_path, None
+        self.trace_done = True
+        return path
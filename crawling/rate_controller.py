@@ -0,0 +1,130 @@
+"""
+계정별 적응형 요청 간격 제어 (AIMD)
+- 정상 응답: 요청 속도를 조금씩 올림 (가산 증가)
+- 지연 증가/오류율 상승: 요청 속도를 절반으로 (승산 감소)
+- 차단 신호 (로그인/보안 확인 페이지, 403/429): 최대 간격으로 내리고 일정 시간 유지
+- 간격은 항상 [floor_ms, ceiling_ms] 범위
+
+호출 측은 요청 직전에 reserve()로 대기 시간을 받아 직접 대기하고 (sync/async 공용),
+응답 후 record()로 결과를 알려 준다.
+"""
+
+import random
+import time
+from collections import deque
+from typing import Deque, Optional
+
+
+class AimdRateController:
+    """요청 간격 제어기 (요청 시작 시각 기준 간격)"""
+
+    def __init__(
+        self,
+        initial_delay_ms: float,
+        floor_ms: float,
+        ceiling_ms: float,
+        additive_step: float = 2.0,
+        backoff_factor: float = 0.5,
+        latency_threshold_ms: float = 5000,
+        error_rate_threshold: float = 0.2,
+        block_cooldown_ms: float = 60000,
+        jitter: float = 0.2,
+        window: int = 20,
+        adaptive: bool = True
+    ):
+        """
+        additive_step: 정상 응답 1건당 올리는 속도 (분당 요청 수)
+        backoff_factor: 속도를 낮출 때 곱하는 값
+        latency_threshold_ms: 이 값 또는 최근 최저 지연의 3배를 넘으면 지연 증가로 판단
+        jitter: 간격에 더하는 무작위 편차 비율 (±)
+        adaptive: False면 간격을 바꾸지 않음 (기존 고정 대기와 동일)
+        """
+        self.floor_ms = floor_ms
+        self.ceiling_ms = max(ceiling_ms, floor_ms)
+        self.additive_step = additive_step
+        self.backoff_factor = backoff_factor
+        self.latency_threshold_ms = latency_threshold_ms
+        self.error_rate_threshold = error_rate_threshold
+        self.block_cooldown_ms = block_cooldown_ms
+        self.jitter = jitter
+        self.adaptive = adaptive
+
+        self.delay_ms = self._clamp(initial_delay_ms)
+        self.next_slot = 0.0
+        self.blocked_until = 0.0
+        self.baseline_latency_ms: Optional[float] = None
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+
+        # 통계
+        self.requests = 0
+        self.errors = 0
+        self.blocks = 0
+        self.backoffs = 0
+        self.total_wait_ms = 0.0
+
+    def _clamp(self, delay_ms: float) -> float:
+        return min(max(delay_ms, self.floor_ms), self.ceiling_ms)
+
+    @property
+    def rate_per_minute(self) -> float:
+        """현재 허용 요청 속도 (분당, 간격 0은 1ms로 계산 - floor_ms/ceiling_ms 0 허용)"""
+        return 60000.0 / max(self.delay_ms, 1.0)
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def reserve(self) -> float:
+        """다음 요청 시작까지 기다릴 시간(초) - 호출 시 슬롯을 예약하므로 여러 탭이 나눠 써도 간격 유지"""
+        now = time.time()
+        delay = self.delay_ms * (1 + random.uniform(-self.jitter, self.jitter))
+        slot = max(now, self.next_slot + delay / 1000.0, self.blocked_until)
+        self.next_slot = slot
+        wait = slot - now
+        self.total_wait_ms += wait * 1000
+        return wait
+
+    def _backoff(self):
+        self.backoffs += 1
+        self.delay_ms = self._clamp(self.delay_ms / self.backoff_factor)
+
+    def record(self, latency_ms: float, ok: bool = True, blocked: bool = False):
+        """요청 결과 반영"""
+        self.requests += 1
+        self.outcomes.append(ok and not blocked)
+
+        if blocked:
+            self.blocks += 1
+            if self.adaptive:
+                self.delay_ms = self.ceiling_ms
+                self.blocked_until = time.time() + self.block_cooldown_ms / 1000.0
+            return
+
+        if not ok:
+            self.errors += 1
+            if self.adaptive and self.error_rate > self.error_rate_threshold:
+                self._backoff()
+            return
+
+        if not self.adaptive:
+            return
+
+        if self.baseline_latency_ms is None or latency_ms < self.baseline_latency_ms:
+            self.baseline_latency_ms = latency_ms
+        else:
+            # 기준 지연은 천천히 따라 올라감 (일시적 최저값에 고정되지 않도록)
+            self.baseline_latency_ms += (latency_ms - self.baseline_latency_ms) * 0.01
+
+        if latency_ms > max(self.latency_threshold_ms, self.baseline_latency_ms * 3):
+            self._backoff()
+        else:
+            # 속도(분당 요청 수)를 가산 증가 → 간격 감소
+            self.delay_ms = self._clamp(60000.0 / (self.rate_per_minute + self.additive_step))
+
+    def summary(self) -> str:
+        """로그용 요약 문자열"""
+        return (f"간격 {self.delay_ms:.0f}ms ({self.rate_per_minute:.1f}회/분), "
+                f"요청 {self.requests}건, 오류 {self.errors}건, 차단 {self.blocks}건, "
+                f"감속 {self.backoffs}회, 누적 대기 {self.total_wait_ms / 1000:.1f}초")
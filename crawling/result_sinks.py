@@ -0,0 +1,411 @@
+"""
+수집 결과 저장소 (ResultSink)
+- excel: 수집 중에는 JSONL 세그먼트에 추가만 하고, 종료 시 openpyxl write-only 모드로 한 번에 생성
+- jsonl: 레코드 그대로 추가 (write()마다 fsync)
+- sqlite: 게시글 키 기준 upsert
+- parquet: 배치마다 part 파일 생성 (pyarrow 필요)
+"""
+
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment
+from openpyxl.utils import get_column_letter
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# 엑셀 기본 컬럼 (이후 댓글1..N 컬럼)
+BASE_COLUMNS = ['채널', '키워드', '닉네임', '날짜', '제목', '내용', '좋아요', 'URL']
+
+# 컬럼 너비 (댓글 컬럼은 COMMENT_COLUMN_WIDTH)
+FIXED_WIDTHS = {1: 20, 2: 15, 3: 15, 4: 20, 5: 40, 6: 50, 7: 8, 8: 50}
+COMMENT_COLUMN_WIDTH = 30
+
+SHEET_TITLE = "모니터링"
+
+# 엑셀 생성 잠금 (같은 파일을 여러 프로세스가 동시에 다시 쓰지 않도록)
+LOCK_TIMEOUT_SECONDS = 120
+LOCK_STALE_SECONDS = 600
+
+
+def record_to_row(record: Dict[str, Any]) -> List[Any]:
+    """게시글 레코드를 엑셀 행으로 변환"""
+    row = [
+        record.get('채널', ''),
+        record.get('키워드', ''),
+        record.get('닉네임', ''),
+        record.get('날짜', ''),
+        record.get('제목', ''),
+        record.get('내용', ''),
+        record.get('좋아요', '0'),
+        record.get('URL', '')
+    ]
+    row.extend(record.get('댓글', []))
+    return row
+
+
+class ExcelSegmentWriter:
+    """주간 엑셀 파일 출력 (세그먼트 추가 → 종료 시 1회 생성)"""
+
+    def __init__(self, filepath: Path, segment_name: str):
+        self.filepath = Path(filepath)
+        self.segment_dir = self.filepath.parent / '.segments'
+        self.segment_path = self.segment_dir / f"{self.filepath.stem}.{segment_name}.jsonl"
+        self.lock_path = self.segment_dir / f"{self.filepath.stem}.lock"
+
+    def append(self, records: List[Dict[str, Any]]) -> int:
+        """세그먼트 파일에 행 추가 (기존 파일 크기와 무관한 고정 비용)"""
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.segment_path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record_to_row(record), ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        return len(records)
+
+    def has_pending(self) -> bool:
+        return self.segment_path.exists() and self.segment_path.stat().st_size > 0
+
+    def _read_segment(self) -> List[List[Any]]:
+        rows = []
+        with open(self.segment_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    # 비정상 종료로 잘린 마지막 줄
+                    continue
+        return rows
+
+    def _acquire_lock(self):
+        deadline = time.time() + LOCK_TIMEOUT_SECONDS
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return
+            except FileExistsError:
+                try:
+                    if time.time() - self.lock_path.stat().st_mtime > LOCK_STALE_SECONDS:
+                        self.lock_path.unlink()
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.time() > deadline:
+                    raise TimeoutError(f"엑셀 잠금 대기 시간 초과: {self.lock_path}")
+                time.sleep(0.5)
+
+    def _release_lock(self):
+        try:
+            self.lock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _header_cells(self, ws, headers: List[str]) -> List[WriteOnlyCell]:
+        cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = Font(bold=True)
+            cell.alignment = Alignment(horizontal='center', vertical='center')
+            cells.append(cell)
+        return cells
+
+    def finalize(self) -> Optional[int]:
+        """기존 엑셀 + 세그먼트로 엑셀 파일 생성 후 세그먼트 삭제 (추가된 행 수 반환)"""
+        if not self.has_pending():
+            return None
+
+        self._acquire_lock()
+        try:
+            new_rows = self._read_segment()
+
+            # 기존 파일은 read-only로 스트리밍
+            existing_wb = None
+            existing_rows = iter(())
+            existing_comment_cols = 0
+            if self.filepath.exists():
+                existing_wb = load_workbook(self.filepath, read_only=True)
+                existing_ws = existing_wb.active
+                rows_iter = existing_ws.iter_rows(values_only=True)
+                header = next(rows_iter, None) or ()
+                existing_comment_cols = max(len(header) - len(BASE_COLUMNS), 0)
+                existing_rows = rows_iter
+
+            # 댓글 컬럼 수는 기존 헤더와 새 행 중 최대값
+            new_comment_cols = max((len(row) - len(BASE_COLUMNS) for row in new_rows), default=0)
+            comment_cols = max(existing_comment_cols, new_comment_cols)
+            headers = BASE_COLUMNS + [f'댓글{i}' for i in range(1, comment_cols + 1)]
+
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(SHEET_TITLE)
+            for col_idx in range(1, len(headers) + 1):
+                ws.column_dimensions[get_column_letter(col_idx)].width = FIXED_WIDTHS.get(col_idx, COMMENT_COLUMN_WIDTH)
+
+            ws.append(self._header_cells(ws, headers))
+            for row in existing_rows:
+                ws.append(list(row))
+            for row in new_rows:
+                ws.append(row)
+
+            # 임시 파일에 저장 후 교체 (저장 중 종료되어도 기존 파일 보존)
+            tmp_path = self.filepath.with_name(f".{self.filepath.name}.tmp")
+            wb.save(tmp_path)
+            if existing_wb:
+                existing_wb.close()
+            os.replace(tmp_path, self.filepath)
+
+            self.segment_path.unlink()
+            return len(new_rows)
+
+        finally:
+            self._release_lock()
+
+
+def record_to_columns(record: Dict[str, Any], basename: str) -> Dict[str, Any]:
+    """게시글 레코드를 분석용 컬럼(영문)으로 변환"""
+    return {
+        'article_key': record.get('게시글키', ''),
+        'channel': record.get('채널', ''),
+        'keywords': record.get('키워드', ''),
+        'author': record.get('닉네임', ''),
+        'date': record.get('날짜', ''),
+        'title': record.get('제목', ''),
+        'content': record.get('내용', ''),
+        'likes': int(record.get('좋아요') or 0),
+        'url': record.get('URL', ''),
+        'comments': list(record.get('댓글', [])),
+        'comment_details': json.dumps(record.get('댓글상세', []), ensure_ascii=False),
+        'output': basename,
+        'collected_at': datetime.now().isoformat(timespec='seconds')
+    }
+
+
+# record_to_columns 컬럼의 parquet 스키마 (배치마다 추론하면 댓글 없는 배치가 list<null>이 되어 part 파일끼리 어긋남)
+PARQUET_SCHEMA = pa.schema([
+    ('article_key', pa.string()),
+    ('channel', pa.string()),
+    ('keywords', pa.string()),
+    ('author', pa.string()),
+    ('date', pa.string()),
+    ('title', pa.string()),
+    ('content', pa.string()),
+    ('likes', pa.int64()),
+    ('url', pa.string()),
+    ('comments', pa.list_(pa.string())),
+    ('comment_details', pa.string()),
+    ('output', pa.string()),
+    ('collected_at', pa.string())
+]) if pa is not None else None
+
+
+class ResultSink(ABC):
+    """결과 저장소 공통 인터페이스
+
+    write()는 collect_post_details가 만든 레코드 목록과 이번 주 출력 파일명(확장자 제외)을 받는다.
+    write()가 반환되면 레코드는 파일에 기록된 상태여야 한다 (이후 게시글 인덱스에 추가되어 재수집되지 않음).
+    """
+
+    def __init__(self, output_folder: Path, group_name: str):
+        self.output_folder = Path(output_folder)
+        self.group_name = group_name
+
+    @abstractmethod
+    def write(self, records: List[Dict[str, Any]], basename: str) -> str:
+        """레코드 저장 후 저장 위치 반환"""
+
+    def close(self) -> List[str]:
+        """남은 버퍼 저장 및 정리 (로그용 요약 반환)"""
+        return []
+
+
+class ExcelSink(ResultSink):
+    """주간 엑셀 파일 (세그먼트 → 종료 시 생성)"""
+
+    def __init__(self, output_folder: Path, group_name: str):
+        super().__init__(output_folder, group_name)
+        self.writers: Dict[str, ExcelSegmentWriter] = {}
+
+    def _get_writer(self, basename: str) -> ExcelSegmentWriter:
+        if basename not in self.writers:
+            self.writers[basename] = ExcelSegmentWriter(self.output_folder / f"{basename}.xlsx", self.group_name)
+        return self.writers[basename]
+
+    def open(self, basename: str):
+        """이번 주 출력과, 이전 실행(지난 주차 포함)에서 남은 이 그룹의 세그먼트도 종료 시 합쳐지도록 등록
+
+        다른 그룹의 세그먼트는 실행 중인 프로세스가 추가하고 있을 수 있으므로 건드리지 않는다.
+        """
+        self._get_writer(basename)
+        suffix = f".{self.group_name}.jsonl"
+        segment_dir = self.output_folder / '.segments'
+        if segment_dir.is_dir():
+            for path in segment_dir.glob(f"*{suffix}"):
+                self._get_writer(path.name[:-len(suffix)])
+
+    def write(self, records: List[Dict[str, Any]], basename: str) -> str:
+        writer = self._get_writer(basename)
+        writer.append(records)
+        return str(writer.segment_path)
+
+    def close(self) -> List[str]:
+        """모든 세그먼트를 엑셀로 생성 (실패한 파일은 세그먼트 유지 후 마지막에 예외)"""
+        summary, errors = [], []
+        for writer in self.writers.values():
+            try:
+                added = writer.finalize()
+                if added is not None:
+                    summary.append(f"엑셀 생성 완료: {writer.filepath} (+{added}행)")
+            except Exception as e:
+                errors.append(f"{writer.filepath}: {e}")
+        if errors:
+            raise RuntimeError(f"엑셀 생성 실패, 세그먼트 유지 ({'; '.join(errors)})")
+        return summary
+
+
+class JsonlSink(ResultSink):
+    """JSONL 추가 저장 (배치(write())마다 fsync - 반환 후 인덱스에 기록되므로)"""
+
+    def __init__(self, output_folder: Path, group_name: str):
+        super().__init__(output_folder, group_name)
+        self.files: Dict[str, Any] = {}
+
+    def _get_file(self, basename: str):
+        if basename not in self.files:
+            self.output_folder.mkdir(parents=True, exist_ok=True)
+            path = self.output_folder / f"{basename}.{self.group_name}.jsonl"
+            self.files[basename] = open(path, 'a', encoding='utf-8')
+        return self.files[basename]
+
+    def _sync(self):
+        for f in self.files.values():
+            f.flush()
+            os.fsync(f.fileno())
+
+    def write(self, records: List[Dict[str, Any]], basename: str) -> str:
+        f = self._get_file(basename)
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._sync()
+        return f.name
+
+    def close(self) -> List[str]:
+        self._sync()
+        summary = [f"JSONL 저장: {f.name}" for f in self.files.values()]
+        for f in self.files.values():
+            f.close()
+        self.files.clear()
+        return summary
+
+
+class SqliteSink(ResultSink):
+    """SQLite 저장 (게시글 키 기준 upsert, 모든 주차/계정 공유)"""
+
+    COLUMNS = ['article_key', 'channel', 'keywords', 'author', 'date', 'title', 'content',
+               'likes', 'url', 'comments', 'comment_details', 'output', 'collected_at']
+
+    def __init__(self, output_folder: Path, group_name: str, filename: str = 'results.db'):
+        super().__init__(output_folder, group_name)
+        self.output_folder.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.output_folder / filename
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS posts ('
+            ' article_key TEXT PRIMARY KEY,'
+            ' channel TEXT, keywords TEXT, author TEXT, date TEXT, title TEXT, content TEXT,'
+            ' likes INTEGER, url TEXT, comments TEXT, comment_details TEXT,'
+            ' output TEXT, collected_at TEXT'
+            ')'
+        )
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_posts_output ON posts (output)')
+        self.conn.commit()
+
+    def write(self, records: List[Dict[str, Any]], basename: str) -> str:
+        rows = []
+        for record in records:
+            columns = record_to_columns(record, basename)
+            columns['comments'] = json.dumps(columns['comments'], ensure_ascii=False)
+            rows.append(tuple(columns[name] for name in self.COLUMNS))
+
+        placeholders = ', '.join('?' * len(self.COLUMNS))
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO posts ({', '.join(self.COLUMNS)}) VALUES ({placeholders})",
+                rows
+            )
+        return str(self.db_path)
+
+    def close(self) -> List[str]:
+        self.conn.close()
+        return [f"SQLite 저장: {self.db_path}"]
+
+
+class ParquetSink(ResultSink):
+    """Parquet 저장 (<출력명>.parquet/ 폴더에 배치마다 part 파일 생성)
+
+    배치 저장 후 게시글이 인덱스에 기록되므로 버퍼에 모아두지 않고 write()마다 바로 파일로 쓴다.
+    """
+
+    def __init__(self, output_folder: Path, group_name: str):
+        if pa is None:
+            raise ImportError("parquet 저장에는 pyarrow가 필요합니다 (pip install pyarrow)")
+        super().__init__(output_folder, group_name)
+        self.part_count = 0
+        self.written: Dict[str, int] = {}
+
+    def _dataset_dir(self, basename: str) -> Path:
+        return self.output_folder / f"{basename}.parquet"
+
+    def _write_part(self, basename: str, rows: List[Dict[str, Any]]):
+        if not rows:
+            return
+        dataset_dir = self._dataset_dir(basename)
+        dataset_dir.mkdir(parents=True, exist_ok=True)
+        self.part_count += 1
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        part_path = dataset_dir / f"part-{self.group_name}-{timestamp}-{self.part_count:04d}.parquet"
+        # 임시 파일에 쓴 뒤 교체 (쓰는 중 종료되어도 깨진 part 파일이 남지 않도록)
+        tmp_path = part_path.with_name(f".{part_path.name}.tmp")
+        pq.write_table(pa.Table.from_pylist(rows, schema=PARQUET_SCHEMA), tmp_path)
+        os.replace(tmp_path, part_path)
+        self.written[str(dataset_dir)] = self.written.get(str(dataset_dir), 0) + len(rows)
+
+    def write(self, records: List[Dict[str, Any]], basename: str) -> str:
+        self._write_part(basename, [record_to_columns(record, basename) for record in records])
+        return str(self._dataset_dir(basename))
+
+    def close(self) -> List[str]:
+        return [f"Parquet 저장: {path} ({count}행)" for path, count in self.written.items()]
+
+
+SINK_TYPES = {
+    'excel': ExcelSink,
+    'jsonl': JsonlSink,
+    'sqlite': SqliteSink,
+    'parquet': ParquetSink
+}
+
+
+def create_sink(name: str, output_folder: Path, group_name: str) -> ResultSink:
+    """설정 이름으로 저장소 생성"""
+    if name not in SINK_TYPES:
+        raise ValueError(f"알 수 없는 저장 형식: {name} (지원: {', '.join(SINK_TYPES)})")
+    return SINK_TYPES[name](output_folder, group_name)
@@ -0,0 +1,180 @@
+"""
+(카페, 키워드) 작업 큐 (SQLite, 프로세스 간 공유)
+- main()이 실행(run)마다 카페 × 키워드 작업을 등록하고, 계정 작업자가 하나씩 임대(lease)해서 처리
+- 임대 시간이 지난 작업은 다른 작업자가 다시 가져감 (비정상 종료된 작업자 작업 회수)
+- 작업자별 접근 가능 카페만 임대
+"""
+
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+# 실패 시 재시도 횟수 (초과하면 failed로 종료)
+MAX_ATTEMPTS = 3
+
+
+class WorkUnit(NamedTuple):
+    """임대한 작업 단위"""
+    run_id: str
+    cafe_name: str
+    keyword: str
+
+
+class WorkQueue:
+    """카페/키워드 작업 큐"""
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS runs ('
+            ' run_id TEXT PRIMARY KEY,'
+            ' created_at TEXT NOT NULL'
+            ') WITHOUT ROWID'
+        )
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS units ('
+            ' run_id TEXT NOT NULL,'
+            ' seq INTEGER NOT NULL,'
+            ' cafe_name TEXT NOT NULL,'
+            ' keyword TEXT NOT NULL,'
+            " status TEXT NOT NULL DEFAULT 'pending',"
+            ' owner TEXT,'
+            ' lease_expires REAL,'
+            ' attempts INTEGER NOT NULL DEFAULT 0,'
+            ' updated_at TEXT,'
+            ' PRIMARY KEY (run_id, cafe_name, keyword)'
+            ') WITHOUT ROWID'
+        )
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat(timespec='seconds')
+
+    def open_run(self, cafe_names: List[str], keywords: List[str], resume: bool = True) -> str:
+        """실행 시작 - resume이면 미완료 작업이 남은 최근 실행을 이어서, 아니면 새 실행 등록"""
+        if resume:
+            row = self.conn.execute(
+                'SELECT r.run_id FROM runs r'
+                " WHERE EXISTS (SELECT 1 FROM units u WHERE u.run_id = r.run_id AND u.status IN ('pending', 'leased'))"
+                ' ORDER BY r.created_at DESC LIMIT 1'
+            ).fetchone()
+            if row:
+                return row[0]
+
+        run_id = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        rows = []
+        seq = 0
+        for cafe_name in cafe_names:
+            for keyword in keywords:
+                rows.append((run_id, seq, cafe_name, keyword, self._now()))
+                seq += 1
+
+        with self.conn:
+            self.conn.execute('BEGIN')
+            self.conn.execute('INSERT INTO runs (run_id, created_at) VALUES (?, ?)', (run_id, self._now()))
+            self.conn.executemany(
+                'INSERT INTO units (run_id, seq, cafe_name, keyword, updated_at) VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+        return run_id
+
+    def lease(
+        self,
+        run_id: str,
+        owner: str,
+        cafe_names: Iterable[str],
+        lease_seconds: float,
+        prefer_cafe: Optional[str] = None
+    ) -> Optional[WorkUnit]:
+        """대기 중이거나 임대가 만료된 작업 1개 임대 (직전에 처리한 카페 우선, 만료 작업은 재시도 횟수 이내만)"""
+        cafe_names = list(cafe_names)
+        if not cafe_names:
+            return None
+
+        now = time.time()
+        placeholders = ', '.join('?' * len(cafe_names))
+        # BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡아 두 작업자가 같은 작업을 가져가지 않도록
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            # 재시도 횟수를 다 쓴 채 임대가 만료된 작업 (작업자가 계속 비정상 종료/멈춤)은 failed로 종료
+            self.conn.execute(
+                "UPDATE units SET status = 'failed', owner = NULL, lease_expires = NULL, updated_at = ?"
+                " WHERE run_id = ? AND status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (self._now(), run_id, now, MAX_ATTEMPTS)
+            )
+            row = self.conn.execute(
+                'SELECT cafe_name, keyword FROM units'
+                f' WHERE run_id = ? AND cafe_name IN ({placeholders})'
+                " AND (status = 'pending' OR (status = 'leased' AND lease_expires < ? AND attempts < ?))"
+                ' ORDER BY (cafe_name = ?) DESC, seq LIMIT 1',
+                [run_id] + cafe_names + [now, MAX_ATTEMPTS, prefer_cafe or '']
+            ).fetchone()
+            if row is None:
+                self.conn.execute('COMMIT')
+                return None
+
+            self.conn.execute(
+                "UPDATE units SET status = 'leased', owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ?"
+                ' WHERE run_id = ? AND cafe_name = ? AND keyword = ?',
+                (owner, now + lease_seconds, self._now(), run_id, row[0], row[1])
+            )
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        return WorkUnit(run_id, row[0], row[1])
+
+    def renew(self, unit: WorkUnit, owner: str, lease_seconds: float) -> bool:
+        """임대 연장 (다른 작업자가 회수해 간 경우 False)"""
+        cursor = self.conn.execute(
+            'UPDATE units SET lease_expires = ?, updated_at = ?'
+            " WHERE run_id = ? AND cafe_name = ? AND keyword = ? AND status = 'leased' AND owner = ?",
+            (time.time() + lease_seconds, self._now(), unit.run_id, unit.cafe_name, unit.keyword, owner)
+        )
+        return cursor.rowcount > 0
+
+    def complete(self, unit: WorkUnit, owner: str):
+        self.conn.execute(
+            "UPDATE units SET status = 'done', lease_expires = NULL, updated_at = ?"
+            ' WHERE run_id = ? AND cafe_name = ? AND keyword = ? AND owner = ?',
+            (self._now(), unit.run_id, unit.cafe_name, unit.keyword, owner)
+        )
+
+    def fail(self, unit: WorkUnit, owner: str):
+        """실패 처리 (재시도 횟수가 남아 있으면 다시 대기열로)"""
+        self.conn.execute(
+            'UPDATE units SET status = CASE WHEN attempts >= ? THEN \'failed\' ELSE \'pending\' END,'
+            ' owner = NULL, lease_expires = NULL, updated_at = ?'
+            ' WHERE run_id = ? AND cafe_name = ? AND keyword = ? AND owner = ?',
+            (MAX_ATTEMPTS, self._now(), unit.run_id, unit.cafe_name, unit.keyword, owner)
+        )
+
+    def has_unfinished(self, run_id: str, cafe_names: Iterable[str]) -> bool:
+        """접근 가능한 카페에 아직 끝나지 않은 작업(다른 작업자가 임대 중 포함)이 있는지"""
+        cafe_names = list(cafe_names)
+        if not cafe_names:
+            return False
+        placeholders = ', '.join('?' * len(cafe_names))
+        row = self.conn.execute(
+            f"SELECT 1 FROM units WHERE run_id = ? AND cafe_name IN ({placeholders}) AND status IN ('pending', 'leased') LIMIT 1",
+            [run_id] + cafe_names
+        ).fetchone()
+        return row is not None
+
+    def summary(self, run_id: str) -> str:
+        """로그용 상태별 작업 수"""
+        rows = self.conn.execute(
+            'SELECT status, COUNT(*) FROM units WHERE run_id = ? GROUP BY status ORDER BY status',
+            (run_id,)
+        ).fetchall()
+        return ', '.join(f"{status}={count}" for status, count in rows) or '-'
+
+    def close(self):
+        self.conn.close()